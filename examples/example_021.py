@@ -0,0 +1,25 @@
+# Collecting all the validation errors
+from typing import List
+
+from pymodelio import Attr, PymodelioModel
+from pymodelio.exceptions import ModelValidationException
+
+
+class ChildModel(PymodelioModel):
+    name: Attr(str)
+
+
+class ParentModel(PymodelioModel):
+    name: Attr(str)
+    children: Attr(List[ChildModel])
+
+
+try:
+    ParentModel.from_dict({'name': 1, 'children': [{'name': 'child_1'}, {'name': 2}]}, collect_errors=True)
+except ModelValidationException as e:
+    print(e.errors)
+    # > [ValidationError(root='ParentModel', path=('name',), message='is not instance of str'),
+    #    ValidationError(root='ParentModel', path=('children', 1, 'name'), message='is not instance of str')]
+    print(e)
+    # > ParentModel.name is not instance of str
+    #   ParentModel.children[1].name is not instance of str
@@ -0,0 +1,18 @@
+# Validating records without raising exceptions
+from pymodelio import Attr, PymodelioModel
+
+
+class Person(PymodelioModel):
+    name: Attr(str)
+    age: Attr(int)
+
+
+results = Person.try_from_dict_many([
+    {'name': 'Rick Sanchez', 'age': 70},
+    {'name': 'Morty Smith', 'age': '14'}
+])
+
+for person, errors in results:
+    print(person, errors)
+    # > Person(age=70, name='Rick Sanchez') []
+    # > None [ValidationError(root='Person', path=('age',), message='is not instance of int')]
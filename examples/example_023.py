@@ -0,0 +1,25 @@
+# Recording runtime statistics
+from pymodelio import Attr, PymodelioModel, stats
+
+
+class Person(PymodelioModel):
+    name: Attr(str)
+    age: Attr(int)
+
+
+stats.enable()
+
+Person.from_dict({'name': 'Rick Sanchez', 'age': 70}).to_dict()
+
+snapshot = stats.snapshot()
+
+print(snapshot['models']['__main__.Person']['from_dict']['count'])
+# > 1
+print(snapshot['attrs']['__main__.Person']['age']['failures'])
+# > 0
+
+print(stats.to_prometheus())
+# > # HELP pymodelio_model_operation_seconds Duration of pymodelio model operations.
+# > ...
+
+stats.disable()
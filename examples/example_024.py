@@ -0,0 +1,28 @@
+# Tracing model operations
+from typing import List
+
+from pymodelio import Attr, PymodelioModel, Tracer, TraceEvent, set_tracer
+
+
+class Child(PymodelioModel):
+    name: Attr(str)
+
+
+class Parent(PymodelioModel):
+    children: Attr(List[Child])
+
+
+class PrintTracer(Tracer):
+
+    def on_end(self, event: TraceEvent) -> None:
+        print(event.operation, event.model, event.payload_size, event.depth, event.outcome)
+
+
+set_tracer(PrintTracer())
+
+Parent.from_dict({'children': [{'name': 'Morty Smith'}]})
+# > from_dict __main__.Child 1 1 ok
+# > validate __main__.Parent 2 1 ok
+# > from_dict __main__.Parent 2 0 ok
+
+set_tracer(None)
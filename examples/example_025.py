@@ -0,0 +1,24 @@
+# Deserializing discriminated unions
+from typing import List, Literal, Union
+
+from pymodelio import Attr, PymodelioModel
+
+
+class Click(PymodelioModel):
+    type: Attr(Literal['click'])
+    x: Attr(int)
+    y: Attr(int)
+
+
+class Scroll(PymodelioModel):
+    type: Attr(Literal['scroll'])
+    delta: Attr(int)
+
+
+class Session(PymodelioModel):
+    events: Attr(List[Union[Click, Scroll]], discriminator='type')
+
+
+session = Session.from_dict({'events': [{'type': 'click', 'x': 10, 'y': 20}, {'type': 'scroll', 'delta': -3}]})
+print(session)
+# > Session(events=[Click(type='click', x=10, y=20), Scroll(delta=-3, type='scroll')])
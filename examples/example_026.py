@@ -0,0 +1,24 @@
+# Sampling the validation of large collections
+from typing import List
+
+from pymodelio import Attr, PymodelioModel, PymodelioSettings, ValidationPolicy
+
+
+class Reading(PymodelioModel):
+    sensor: Attr(str)
+    value: Attr(float)
+
+
+class Feed(PymodelioModel):
+    readings: Attr(List[Reading])
+    checksums: Attr(List[str], validation_policy=ValidationPolicy.first_n(100))
+
+
+rows = [{'sensor': 's%s' % i, 'value': float(i)} for i in range(100000)]
+
+with PymodelioSettings.override(VALIDATION_POLICY=ValidationPolicy.sample(1000, seed=42)):
+    feed = Feed.from_dict({'readings': rows, 'checksums': ['a1b2'] * 100000})
+
+print(feed.get_validation_policies())
+# > {'readings': ValidationPolicy(mode='sample', size=1000, seed=42),
+#    'checksums': ValidationPolicy(mode='first_n', size=100, seed=None)}
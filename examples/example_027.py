@@ -0,0 +1,18 @@
+# Constructing trusted models
+from pymodelio import Attr, PymodelioModel
+
+
+class Product(PymodelioModel):
+    name: Attr(str)
+    _price: Attr(float, init_alias='price')
+    stock: Attr(int, default_factory=lambda: 0)
+
+
+# Values are provided by attribute name, so _price is used instead of its init alias
+product = Product.construct(name='Portal gun', _price=999.9)
+print(product)
+# > Product(name='Portal gun', stock=0)
+
+product = Product.from_dict({'name': 'Plumbus', 'price': 6.5, 'stock': 3}, trusted=True)
+print(product)
+# > Product(name='Plumbus', stock=3)
@@ -0,0 +1,26 @@
+# Constructing models from database rows
+import sqlite3
+from datetime import datetime
+
+from pymodelio import Attr, PymodelioModel
+
+
+class Product(PymodelioModel):
+    name: Attr(str)
+    _price: Attr(float, init_alias='price')
+    created_at: Attr(datetime)
+
+
+connection = sqlite3.connect(':memory:')
+connection.execute('CREATE TABLE products (name TEXT, price REAL, created_at TEXT)')
+connection.execute("INSERT INTO products VALUES ('Portal gun', 999.9, '2023-01-02T03:04:05')")
+
+# The columns are mapped to the attributes once, and the rows are fetched in batches
+cursor = connection.execute('SELECT name, price, created_at FROM products')
+for product in Product.from_cursor(cursor, batch_size=500):
+    print(product.name, product.created_at)
+# > Portal gun 2023-01-02 03:04:05
+
+products = Product.from_rows([('Plumbus', 6.5, datetime(2023, 1, 2))], columns=['name', 'price', 'created_at'])
+print(products)
+# > [Product(created_at=datetime(2023, 1, 2, 0, 0, 0, 0, None), name='Plumbus')]
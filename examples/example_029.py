@@ -0,0 +1,30 @@
+# Exporting models to rows
+import sqlite3
+from datetime import datetime
+
+from pymodelio import Attr, PymodelioModel
+
+
+class Product(PymodelioModel):
+    name: Attr(str)
+    _price: Attr(float, init_alias='price')
+    created_at: Attr(datetime)
+
+    @property
+    def price(self) -> float:
+        return self._price
+
+
+products = [Product(name='Plumbus %s' % i, price=6.5, created_at=datetime(2023, 1, 2)) for i in range(1000)]
+
+print(Product.get_row_columns())
+# > ['name', 'created_at', 'price']
+
+connection = sqlite3.connect(':memory:')
+connection.execute('CREATE TABLE products (name TEXT, created_at REAL, price REAL)')
+# Datetimes are exported in ISO format by default, but they can be adapted to other types (like epochs)
+for chunk in Product.to_rows(products, adapters={datetime: datetime.timestamp}, chunk_size=500):
+    connection.executemany('INSERT INTO products VALUES (?, ?, ?)', chunk)
+
+print(connection.execute('SELECT COUNT(*) FROM products').fetchone())
+# > (1000,)
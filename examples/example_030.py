@@ -0,0 +1,32 @@
+# Storing models in SQLite
+from datetime import datetime
+from typing import List
+
+from pymodelio import Attr, PymodelioModel
+from pymodelio.stores import SQLiteStore
+
+
+class Component(PymodelioModel):
+    name: Attr(str)
+
+
+class Product(PymodelioModel):
+    id: Attr(int)
+    name: Attr(str)
+    category: Attr(str)
+    created_at: Attr(datetime)
+    components: Attr(List[Component])
+
+
+with SQLiteStore(Product, ':memory:', indexes=['category']) as store:
+    store.put_many(
+        Product(id=i, name='Portal gun %s' % i, category='gadgets' if i % 2 else 'weapons',
+                created_at=datetime(2023, 1, 2), components=[Component(name='Fluid')])
+        for i in range(10000)
+    )
+    print(store.get(42))
+    # > Product(category='weapons', components=[Component(name='Fluid')], created_at=datetime(2023, 1, 2, 0, 0, 0, 0, None), id=42, name='Portal gun 42')
+    print(sum(1 for _ in store.where(category='gadgets')))
+    # > 5000
+    print(sum(1 for _ in store.iter_all(batch_size=1000)))
+    # > 10000
@@ -0,0 +1,36 @@
+# Reading and writing CSV files
+import io
+from datetime import date
+from typing import Optional
+
+from pymodelio import Attr, PymodelioModel, write_csv
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+
+
+class Product(PymodelioModel):
+    name: Attr(str)
+    stock: Attr(int)
+    rating: Attr(Optional[float])
+    released: Attr(date)
+
+
+feed = io.StringIO('''name,stock,rating,released
+Portal gun,3,4.5,2023-01-02
+Plumbus,10,,2023-02-03
+Meeseeks box,many,5,2023-03-04
+''')
+
+try:
+    for product in Product.iter_csv(feed):
+        print(product)
+except ModelValidationException as e:
+    print(e)
+# > Product(name='Portal gun', rating=4.5, released=date(2023, 1, 2), stock=3)
+# > Product(name='Plumbus', rating=None, released=date(2023, 2, 3), stock=10)
+# > Product[4].stock is not instance of int
+
+output = io.StringIO()
+write_csv([Product(name='Portal gun', stock=3, rating=None, released=date(2023, 1, 2))], output)
+print(output.getvalue())
+# > name,stock,rating,released
+# > Portal gun,3,,2023-01-02
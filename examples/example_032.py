@@ -0,0 +1,27 @@
+# Exporting models to columns
+from datetime import date
+
+from pymodelio import Attr, PymodelioModel
+
+
+class Product(PymodelioModel):
+    name: Attr(str)
+    stock: Attr(int)
+    released: Attr(date)
+
+
+products = [Product(name='Portal gun', stock=3, released=date(2023, 1, 2)),
+            Product(name='Plumbus', stock=10, released=date(2023, 2, 3))]
+
+columns = Product.to_columns(products)
+print(columns)
+# > {'name': ['Portal gun', 'Plumbus'], 'stock': [3, 10], 'released': [datetime.date(2023, 1, 2), datetime.date(2023, 2, 3)]}
+
+# The columns can be passed to pandas.DataFrame(columns), and back with Product.from_columns(df.to_dict('list'))
+print(Product.from_columns(columns))
+# > [Product(name='Portal gun', released=date(2023, 1, 2), stock=3), Product(name='Plumbus', released=date(2023, 2, 3), stock=10)]
+
+# With numpy installed, models can also be exported to structured arrays (and created from them with from_numpy)
+# array = Product.to_numpy(products)
+# array.dtype
+# > dtype([('name', 'O'), ('stock', '<i8'), ('released', '<M8[D]')])
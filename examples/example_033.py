@@ -0,0 +1,33 @@
+# Encoding models to bytes
+from datetime import datetime
+from typing import List, Optional
+
+from pymodelio import Attr, PymodelioModel
+
+
+class Component(PymodelioModel):
+    name: Attr(str)
+    weight: Attr(float)
+
+
+class Product(PymodelioModel):
+    id: Attr(int)
+    name: Attr(str)
+    created_at: Attr(datetime)
+    discontinued_at: Attr(Optional[datetime])
+    components: Attr(List[Component])
+
+
+product = Product(id=1, name='Portal gun', created_at=datetime(2023, 1, 2), discontinued_at=None,
+                  components=[Component(name='Fluid', weight=0.5)])
+
+data = product.to_bytes()
+print(len(data), len(str(product.to_dict())))
+# > 42 143
+
+print(Product.from_bytes(data))
+# > Product(components=[Component(name='Fluid', weight=0.5)], created_at=datetime(2023, 1, 2, 0, 0, 0, 0, None), discontinued_at=None, id=1, name='Portal gun')
+
+# Payloads can be concatenated, and decoded at once
+print(len(Product.from_bytes_many(data + data)))
+# > 2
@@ -0,0 +1,30 @@
+# Pickling models
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+from pymodelio import Attr, PymodelioModel
+
+
+class Component(PymodelioModel):
+    name: Attr(str)
+
+
+class Product(PymodelioModel):
+    name: Attr(str)
+    components: Attr(List[Component])
+
+
+def count_components(product: Product) -> int:
+    return len(product.components)
+
+
+if __name__ == '__main__':
+    product = Product(name='Portal gun', components=[Component(name='Fluid'), Component(name='Battery')])
+
+    print(pickle.loads(pickle.dumps(product)))
+    # > Product(components=[Component(name='Fluid'), Component(name='Battery')], name='Portal gun')
+
+    with ProcessPoolExecutor() as executor:
+        print(list(executor.map(count_components, [product] * 3)))
+    # > [2, 2, 2]
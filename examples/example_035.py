@@ -0,0 +1,29 @@
+# Copying models
+import copy
+from datetime import datetime
+from typing import List
+
+from pymodelio import Attr, PymodelioModel
+
+
+class Component(PymodelioModel):
+    name: Attr(str)
+
+
+class Product(PymodelioModel):
+    name: Attr(str)
+    created_at: Attr(datetime)
+    components: Attr(List[Component])
+
+
+product = Product(name='Portal gun', created_at=datetime(2023, 1, 2), components=[Component(name='Fluid')])
+
+snapshot = copy.deepcopy(product)
+product.components.append(Component(name='Battery'))
+
+print(len(product.components), len(snapshot.components))
+# > 2 1
+
+# Immutable values are shared by the copies
+print(snapshot.created_at is product.created_at)
+# > True
@@ -1,17 +1,55 @@
 # flake8: noqa
+from .lazy_imports import lazy_getattr
 
 __version__ = '1.1.1'
 
-# constants
-from .constants import UNDEFINED
+# Public names are imported on first access, so importing pymodelio is cheap
+_LAZY_NAMES = {
+    # constants
+    'UNDEFINED': ('.constants', 'UNDEFINED'),
+    # Settings
+    'PymodelioSetting': ('.settings.pymodelio_setting', 'PymodelioSetting'),
+    'PymodelioSettings': ('.settings.pymodelio_settings', 'PymodelioSettings'),
+    'PymodelioModel': ('.pymodelio_model', 'PymodelioModel'),
+    # Attribute with all aliases
+    'Attr': ('.attribute', 'Attr'),
+    'do_not_serialize': ('.decorators.do_not_serialize', 'do_not_serialize'),
+    'resolve_refs': ('.model_registry', 'resolve_refs'),
+    'ValidationPolicy': ('.validation_policy', 'ValidationPolicy'),
+    'write_csv': ('.model_csv', 'write_csv'),
+    # Tracing
+    'set_tracer': ('.tracing', 'set_tracer'),
+    'get_tracer': ('.tracing', 'get_tracer'),
+    'Tracer': ('.tracing', 'Tracer'),
+    'TraceEvent': ('.tracing', 'TraceEvent'),
+    # Subpackages
+    'validators': ('.validators', None),
+    'exceptions': ('.exceptions', None),
+    'stats': ('.stats', None),
+    'stores': ('.stores', None),
+    'testing': ('.testing', None),
+    'tracing': ('.tracing', None),
+}
 
-# Settings
-from .settings.pymodelio_setting import PymodelioSetting
-from .settings.pymodelio_settings import PymodelioSettings
+__all__ = tuple(name for name, (_, attr_name) in _LAZY_NAMES.items() if attr_name is not None)
 
-from .pymodelio_model import PymodelioModel
+__getattr__ = lazy_getattr(__name__, globals(), _LAZY_NAMES)
 
-# Attribute with all aliases
-from .attribute import Attr
 
-from .decorators.do_not_serialize import do_not_serialize
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
+
+# Imported by type checkers and IDEs only, as typing is expensive to import
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .constants import UNDEFINED
+    from .settings.pymodelio_setting import PymodelioSetting
+    from .settings.pymodelio_settings import PymodelioSettings
+    from .pymodelio_model import PymodelioModel
+    from .attribute import Attr
+    from .decorators.do_not_serialize import do_not_serialize
+    from .model_registry import resolve_refs
+    from .validation_policy import ValidationPolicy
+    from .model_csv import write_csv
+    from .tracing import set_tracer, get_tracer, Tracer, TraceEvent
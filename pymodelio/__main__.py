@@ -0,0 +1,43 @@
+import argparse
+import pkgutil
+import sys
+from importlib import import_module
+from typing import List, Optional
+
+
+def _module_names(module_name: str) -> List[str]:
+    # Packages are compiled with all their submodules
+    module = import_module(module_name)
+    names = [module_name]
+    if hasattr(module, '__path__'):
+        names.extend(x.name for x in pkgutil.walk_packages(module.__path__, prefix=module_name + '.'))
+    return names
+
+
+def compile_command(args: argparse.Namespace) -> int:
+    from pymodelio.plans import compile_module
+
+    for module_name in args.modules:
+        for name in _module_names(module_name):
+            path, models = compile_module(name)
+            if path is not None:
+                print('%s: %s models compiled to %s' % (name, len(models), path))
+            elif name == module_name:
+                print('%s: no models found' % name)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m pymodelio')
+    commands = parser.add_subparsers(dest='command', required=True)
+    compile_parser = commands.add_parser(
+        'compile', help='compiles the plans of the models of modules (and packages), so they are not built on start'
+    )
+    compile_parser.add_argument('modules', nargs='+', help='modules (or packages) defining models')
+    compile_parser.set_defaults(func=compile_command)
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
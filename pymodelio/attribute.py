@@ -2,26 +2,36 @@ from typing import Callable, Optional, Any, TypeVar, Union, Tuple, Iterable
 
 from pymodelio import UNDEFINED, PymodelioSettings, PymodelioSetting
 from pymodelio.undefined import Undefined
-from pymodelio.validators.default_validators_builder import DefaultValidatorsBuilder
+from pymodelio.validation_policy import ValidationPolicy
 from pymodelio.validators.validator import Validator
 
 T = TypeVar('T')
 
 
+def _no_default() -> None:
+    return None
+
+
 class PymodelioAttr:
     __slots__ = (
-        '_attr_type', '_initable', '_default_factory', '_init_aliases', '_validator', '_compare'
+        '_attr_type', '_initable', '_default_factory', '_init_aliases', '_validator', '_compare', '_discriminator',
+        '_converter', '_validation_policy'
     )
 
     def __init__(self, attr_type: T, validator: Optional[Validator] = UNDEFINED, initable: bool = True,
                  init_alias: Optional[str] = None, init_aliases: Optional[Iterable[str]] = None,
-                 default_factory: Callable = None, compare: bool = True) -> None:
+                 default_factory: Callable = None, compare: bool = True, discriminator: Optional[str] = None,
+                 validation_policy: Optional[ValidationPolicy] = None) -> None:
         self._attr_type = attr_type
+        self._validation_policy = validation_policy
+        self._discriminator = discriminator
         self._init_attr_aliases(init_alias, init_aliases)
         self._initable = initable or len(self._init_aliases) > 0
-        self._default_factory = default_factory if default_factory is not None else (lambda: None)
+        self._default_factory = default_factory if default_factory is not None else _no_default
         self._init_validator(validator)
         self._compare = compare
+        # Built by the deserializer when the attribute gets deserialized for the first time
+        self._converter = UNDEFINED
 
     def _init_attr_aliases(self, init_alias: Optional[str], init_aliases: Optional[Iterable[str]]) -> None:
         if init_aliases is not None:
@@ -33,10 +43,20 @@ class PymodelioAttr:
 
     def _init_validator(self, validator: Union[Validator, None, Undefined]) -> None:
         if validator == UNDEFINED:
-            if PymodelioSettings.get(PymodelioSetting.USE_DEFAULT_ATTR_VALIDATOR_IF_NOT_DEFINED):
-                self._validator = DefaultValidatorsBuilder.build(self.attr_type)
-            else:
+            if not PymodelioSettings.get(PymodelioSetting.USE_DEFAULT_ATTR_VALIDATOR_IF_NOT_DEFINED):
                 self._validator = None
+            else:
+                # Imported here as the type inspection machinery is only needed for inferring validators
+                from pymodelio.discriminators import split_union, get_models_union
+                union_variants = split_union(self.attr_type) if self._discriminator is not None else \
+                    get_models_union(self.attr_type)
+                if union_variants is not None:
+                    from pymodelio.validators.discriminated_union_validator import DiscriminatedUnionValidator
+                    variants, is_list, nullable = union_variants
+                    self._validator = DiscriminatedUnionValidator(variants, is_list=is_list, nullable=nullable)
+                else:
+                    from pymodelio.validators.default_validators_builder import DefaultValidatorsBuilder
+                    self._validator = DefaultValidatorsBuilder.build(self.attr_type)
         else:
             self._validator = validator
 
@@ -48,6 +68,10 @@ class PymodelioAttr:
     def validator(self) -> Optional[Validator]:
         return self._validator
 
+    @validator.setter
+    def validator(self, validator: Optional[Validator]) -> None:
+        self._validator = validator
+
     @property
     def initable(self) -> bool:
         return self._initable
@@ -56,6 +80,10 @@ class PymodelioAttr:
     def default_factory(self) -> Callable:
         return self._default_factory
 
+    @property
+    def has_default_factory(self) -> bool:
+        return self._default_factory is not _no_default
+
     @property
     def attr_type(self) -> T:
         return self._attr_type
@@ -68,9 +96,27 @@ class PymodelioAttr:
     def compare(self) -> bool:
         return self._compare
 
+    @property
+    def discriminator(self) -> Optional[str]:
+        return self._discriminator
+
+    @property
+    def validation_policy(self) -> Optional[ValidationPolicy]:
+        return self._validation_policy
+
+    @property
+    def converter(self) -> Union[Callable[[Any], Any], None, Undefined]:
+        return self._converter
+
+    @converter.setter
+    def converter(self, converter: Optional[Callable[[Any], Any]]) -> None:
+        self._converter = converter
+
 
 def Attr(attr_type: T, /, *, validator: Optional[Validator] = UNDEFINED, initable: bool = True,
          init_alias: Optional[str] = None, init_aliases: Iterable[str] = None, default_factory: Callable = None,
-         compare: bool = True) -> T:
+         compare: bool = True, discriminator: Optional[str] = None,
+         validation_policy: Optional[ValidationPolicy] = None) -> T:
     return PymodelioAttr(attr_type=attr_type, validator=validator, initable=initable, init_alias=init_alias,
-                         init_aliases=init_aliases, default_factory=default_factory, compare=compare)
+                         init_aliases=init_aliases, default_factory=default_factory, compare=compare,
+                         discriminator=discriminator, validation_policy=validation_policy)
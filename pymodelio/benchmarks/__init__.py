@@ -0,0 +1,3 @@
+# flake8: noqa
+from .runner import run_benchmarks, measure, super_linear_sweeps
+from .comparison import compare_runs, Regression
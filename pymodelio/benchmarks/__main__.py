@@ -0,0 +1,83 @@
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from pymodelio.benchmarks.comparison import DEFAULT_THRESHOLD, compare_runs, Regression
+from pymodelio.benchmarks.memory import run_memory_benchmarks
+from pymodelio.benchmarks.runner import DEFAULT_DEPTHS, DEFAULT_LIST_LENGTHS, run_benchmarks, super_linear_sweeps
+
+
+def _parse_sizes(value: str) -> List[int]:
+    return [int(x) for x in value.split(',') if x]
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m pymodelio.benchmarks',
+                                     description='Benchmarks pymodelio against raw Python and other libraries')
+    parser.add_argument('--output', help='file where the results are stored as JSON')
+    parser.add_argument('--input', help='compare the results stored in this file instead of running the benchmarks')
+    parser.add_argument('--compare', metavar='BASELINE', help='file with the results to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed time growth before flagging a regression (default: %(default)s)')
+    parser.add_argument('--list-lengths', type=_parse_sizes, default=DEFAULT_LIST_LENGTHS,
+                        help='comma separated list lengths to sweep (default: %s)' % ','.join(
+                            str(x) for x in DEFAULT_LIST_LENGTHS))
+    parser.add_argument('--depths', type=_parse_sizes, default=DEFAULT_DEPTHS,
+                        help='comma separated nesting depths to sweep (default: %s)' % ','.join(
+                            str(x) for x in DEFAULT_DEPTHS))
+    parser.add_argument('--min-time', type=float, default=0.05, help='minimum time of each measure in seconds')
+    parser.add_argument('--repeat', type=int, default=3, help='measures taken for each benchmark')
+    parser.add_argument('--memory', action='store_true',
+                        help='also measure the memory allocated by construction, from_dict and to_dict')
+    return parser.parse_args(argv)
+
+
+def _load(path: str) -> dict:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _format_regression(regression: Regression) -> str:
+    if regression.name.endswith(']'):
+        # Memory benchmark
+        return '%s %.1f -> %.1f (+%.1f%%)' % (
+            regression.name, regression.baseline, regression.current, regression.change * 100
+        )
+    return '%s %.3f us -> %.3f us (+%.1f%%)' % (
+        regression.name, regression.baseline * 1_000_000, regression.current * 1_000_000, regression.change * 100
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the benchmarks (or loads them with --input) and compares them with a baseline when --compare is provided.
+    Returns 1 if a regression was found.
+    """
+    args = _parse_args(argv)
+    if args.input:
+        run = _load(args.input)
+    else:
+        run = run_benchmarks(args.list_lengths, args.depths, min_time=args.min_time, repeat=args.repeat, log=print)
+        if args.memory:
+            run['memory'] = run_memory_benchmarks(args.list_lengths, args.depths, log=print)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(run, f, indent=2, sort_keys=True)
+    for name, relative in run['relative_to_raw'].items():
+        print('%s: x%.2f raw Python' % (name, relative))
+    for name, scaling in super_linear_sweeps(run).items():
+        print('WARNING: %s grows super-linearly (per item time x%.2f)' % (name, scaling))
+    if not args.compare:
+        return 0
+    regressions = compare_runs(_load(args.compare), run, threshold=args.threshold)
+    for regression in regressions:
+        print('REGRESSION: %s' % _format_regression(regression))
+    if regressions:
+        return 1
+    print('No regressions found')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,38 @@
+from collections import namedtuple
+from typing import Dict, List
+
+# Benchmark whose time per call (in seconds) grew more than the allowed threshold
+Regression = namedtuple('Regression', ('name', 'baseline', 'current', 'change'))
+
+DEFAULT_THRESHOLD = 0.1
+
+# Compared stats of the memory benchmarks
+_MEMORY_STATS = ('retained_bytes', 'retained_blocks', 'allocated_blocks')
+
+
+def compare_runs(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> List[Regression]:
+    """
+    Compares two benchmark runs, returning the benchmarks present in both of them whose time grew more than threshold
+    (a fraction of the baseline), sorted from the biggest to the smallest change. Memory benchmarks are compared
+    too, and their regressions are named as '<benchmark>[<stat>]'.
+    """
+    regressions = []
+    baseline_results = _comparable_results(baseline)
+    for name, value in _comparable_results(current).items():
+        baseline_value = baseline_results.get(name)
+        if not baseline_value:
+            continue
+        change = value / baseline_value - 1
+        if change > threshold:
+            regressions.append(Regression(name, baseline_value, value, change))
+    return sorted(regressions, key=lambda regression: regression.change, reverse=True)
+
+
+def _comparable_results(run: dict) -> Dict[str, float]:
+    results = dict(run['results'])
+    for name, stats in run.get('memory', {}).items():
+        # Stats missing from the runs of older versions are not compared
+        for stat in _MEMORY_STATS:
+            if stat in stats:
+                results['%s[%s]' % (name, stat)] = stats[stat]
+    return results
@@ -0,0 +1,59 @@
+import argparse
+import subprocess
+import sys
+from typing import List, Optional, Set
+
+DEFAULT_STATEMENT = 'import pymodelio'
+DEFAULT_BUDGET_MS = 15.0
+
+
+def _imported_modules(statement: str) -> List[tuple]:
+    """
+    Runs the statement in a new interpreter with -X importtime, returning the (module, cumulative microseconds,
+    nesting level) of each import
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], capture_output=True, text=True,
+                             check=True)
+    imports = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imports.append((name.strip(), int(cumulative), (len(name) - len(name.lstrip())) // 2))
+    return imports
+
+
+def _startup_modules() -> Set[str]:
+    return {name for name, _, _ in _imported_modules('pass')}
+
+
+def measure_import_time(statement: str = DEFAULT_STATEMENT, runs: int = 5) -> float:
+    """
+    Returns the best time (in seconds) spent importing modules when running the statement in a new interpreter,
+    excluding the modules imported during the interpreter startup
+    """
+    startup_modules = _startup_modules()
+    best = None
+    for _ in range(runs):
+        total = sum(cumulative for name, cumulative, level in _imported_modules(statement)
+                    if level == 0 and name not in startup_modules)
+        best = total if best is None else min(best, total)
+    return best / 1_000_000
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m pymodelio.benchmarks.import_time',
+                                     description='Checks the time spent importing pymodelio against a budget')
+    parser.add_argument('--statement', default=DEFAULT_STATEMENT,
+                        help='statement to measure (default: %(default)s)')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help='maximum import time in milliseconds (default: %(default)s)')
+    parser.add_argument('--runs', type=int, default=5, help='amount of runs, the best one is used')
+    args = parser.parse_args(argv)
+    elapsed_ms = measure_import_time(args.statement, runs=args.runs) * 1000
+    print('%s: %.2f ms (budget %.2f ms)' % (args.statement, elapsed_ms, args.budget_ms))
+    return 0 if elapsed_ms <= args.budget_ms else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,203 @@
+from collections import namedtuple
+from functools import partial
+from typing import Callable, List, Optional
+from uuid import UUID
+
+from pymodelio.benchmarks import models
+
+# Operations a library supports over a benchmarked model. Operations a library doesn't support are None.
+Subject = namedtuple('Subject', ('library', 'construct', 'from_dict', 'to_dict', 'validate'))
+
+# validate checks a new instance on each call, while revalidate validates the same (unmodified) instance again, which
+# pymodelio skips once it was validated
+OPERATIONS = ('construction', 'validate', 'revalidate', 'from_dict', 'to_dict', 'repr')
+
+
+def serial_no(i: int) -> str:
+    return str(UUID(int=i))
+
+
+def computer_payload(list_length: int) -> dict:
+    """
+    Payload of a computer with list_length rams and disks
+    """
+    return {
+        'serial_no': serial_no(0),
+        'cpu': {'serial_no': serial_no(1), 'frequency': 3500, 'cores': 8},
+        'rams': [{'serial_no': serial_no(2 + i), 'frequency': 1600, 'size': 8} for i in range(list_length)],
+        'disks': [{'serial_no': serial_no(2 + list_length + i), 'size': 512} for i in range(list_length)]
+    }
+
+
+def chain_payload(depth: int) -> dict:
+    """
+    Payload of depth levels nested into each other
+    """
+    payload = {'value': depth - 1}
+    for level in reversed(range(depth - 1)):
+        payload = {'value': level, 'child': payload}
+    return payload
+
+
+def _build_computer(computer_cls: type, cpu_cls: type, ram_cls: type, disk_cls: type, data: dict,
+                    **options) -> object:
+    # Children are built without validating them, as they are validated by the computer
+    return computer_cls(
+        serial_no=data['serial_no'],
+        cpu=cpu_cls(**data['cpu'], **options),
+        rams=[ram_cls(**x, **options) for x in data['rams']],
+        disks=[disk_cls(**x, **options) for x in data['disks']]
+    )
+
+
+def pymodelio_computer() -> Subject:
+    return Subject(
+        'pymodelio',
+        lambda data: _build_computer(models.Computer, models.CPU, models.RAM, models.Disk, data, auto_validate=False),
+        models.Computer.from_dict,
+        models.Computer.to_dict,
+        models.Computer.validate
+    )
+
+
+def raw_computer() -> Subject:
+    return Subject(
+        'raw',
+        lambda data: _build_computer(models.RawComputer, models.RawCPU, models.RawRAM, models.RawDisk, data,
+                                     auto_validate=False),
+        models.RawComputer.from_dict,
+        models.RawComputer.to_dict,
+        models.RawComputer.validate
+    )
+
+
+def dataclasses_computer() -> Subject:
+    return Subject(
+        'dataclasses',
+        lambda data: _build_computer(models.DataclassComputer, models.DataclassCPU, models.DataclassRAM,
+                                     models.DataclassDisk, data),
+        models.DataclassComputer.from_dict,
+        models.DataclassComputer.to_dict,
+        None
+    )
+
+
+def attrs_computer() -> Optional[Subject]:
+    try:
+        import attr
+    except ImportError:
+        return None
+
+    non_negative_int = [attr.validators.instance_of(int), _validate_non_negative]
+    serial_no_validators = [attr.validators.instance_of(str), attr.validators.matches_re(r'^[a-z0-9-]{36}$')]
+
+    @attr.s(slots=True)
+    class AttrsCPU:
+        serial_no = attr.ib(validator=serial_no_validators)
+        frequency = attr.ib(validator=non_negative_int)
+        cores = attr.ib(validator=non_negative_int)
+
+    @attr.s(slots=True)
+    class AttrsRAM:
+        serial_no = attr.ib(validator=serial_no_validators)
+        frequency = attr.ib(validator=non_negative_int)
+        size = attr.ib(validator=non_negative_int)
+
+    @attr.s(slots=True)
+    class AttrsDisk:
+        serial_no = attr.ib(validator=serial_no_validators)
+        size = attr.ib(validator=non_negative_int)
+
+    @attr.s(slots=True)
+    class AttrsComputer:
+        serial_no = attr.ib(validator=serial_no_validators)
+        cpu = attr.ib(validator=attr.validators.instance_of(AttrsCPU))
+        rams = attr.ib(validator=attr.validators.deep_iterable(attr.validators.instance_of(AttrsRAM),
+                                                               attr.validators.instance_of(list)))
+        disks = attr.ib(validator=attr.validators.deep_iterable(attr.validators.instance_of(AttrsDisk),
+                                                                attr.validators.instance_of(list)))
+
+    def from_dict(data: dict) -> AttrsComputer:
+        return _build_computer(AttrsComputer, AttrsCPU, AttrsRAM, AttrsDisk, data)
+
+    return Subject('attrs', from_dict, from_dict, attr.asdict, None)
+
+
+def pydantic_computer() -> Optional[Subject]:
+    try:
+        import pydantic
+    except ImportError:
+        return None
+
+    class PydanticCPU(pydantic.BaseModel):
+        serial_no: str = pydantic.Field(min_length=36, max_length=36)
+        frequency: int = pydantic.Field(ge=0)
+        cores: int = pydantic.Field(ge=0)
+
+    class PydanticRAM(pydantic.BaseModel):
+        serial_no: str = pydantic.Field(min_length=36, max_length=36)
+        frequency: int = pydantic.Field(ge=0)
+        size: int = pydantic.Field(ge=0)
+
+    class PydanticDisk(pydantic.BaseModel):
+        serial_no: str = pydantic.Field(min_length=36, max_length=36)
+        size: int = pydantic.Field(ge=0)
+
+    class PydanticComputer(pydantic.BaseModel):
+        serial_no: str = pydantic.Field(min_length=36, max_length=36)
+        cpu: PydanticCPU
+        rams: List[PydanticRAM] = pydantic.Field(min_length=1) if hasattr(pydantic.BaseModel, 'model_dump') \
+            else pydantic.Field(min_items=1)
+        disks: List[PydanticDisk]
+
+    # Pydantic 2 renamed the methods of pydantic 1
+    if hasattr(PydanticComputer, 'model_validate'):
+        from_dict, to_dict = PydanticComputer.model_validate, PydanticComputer.model_dump
+    else:
+        from_dict, to_dict = PydanticComputer.parse_obj, PydanticComputer.dict
+
+    return Subject(
+        'pydantic',
+        lambda data: _build_computer(PydanticComputer, PydanticCPU, PydanticRAM, PydanticDisk, data),
+        from_dict,
+        to_dict,
+        None
+    )
+
+
+def _validate_non_negative(instance: object, attribute: object, value: int) -> None:
+    if value < 0:
+        raise ValueError('%s is less than 0' % attribute.name)
+
+
+def computer_subjects() -> List[Subject]:
+    """
+    Returns the subjects benchmarked with the computer graph, skipping the libraries that are not installed
+    """
+    factories: List[Callable[[], Optional[Subject]]] = [
+        raw_computer, pymodelio_computer, dataclasses_computer, attrs_computer, pydantic_computer
+    ]
+    return [subject for subject in (factory() for factory in factories) if subject is not None]
+
+
+def chain_subjects(depth: int) -> List[Subject]:
+    """
+    Returns the subjects benchmarked with depth levels nested into each other
+    """
+    levels = models.build_pymodelio_chain(depth)
+    return [
+        Subject('raw', partial(_build_chain, [models.RawLevel] * depth, auto_validate=False),
+                models.RawLevel.from_dict, models.RawLevel.to_dict, models.RawLevel.validate),
+        Subject('pymodelio', partial(_build_chain, levels, auto_validate=False), levels[0].from_dict,
+                levels[0].to_dict, levels[0].validate),
+    ]
+
+
+def _build_chain(level_classes: List[type], data: dict, **options) -> object:
+    payloads = [data]
+    while 'child' in payloads[-1]:
+        payloads.append(payloads[-1]['child'])
+    instance = level_classes[len(payloads) - 1](value=payloads[-1]['value'], **options)
+    for level in reversed(range(len(payloads) - 1)):
+        instance = level_classes[level](value=payloads[level]['value'], child=instance, **options)
+    return instance
@@ -0,0 +1,33 @@
+from typing import Callable, Dict, Iterable, Optional
+
+from pymodelio.benchmarks.libraries import computer_payload, computer_subjects, chain_payload, chain_subjects
+from pymodelio.testing.allocations import measure_allocations
+
+MEMORY_OPERATIONS = ('construction', 'from_dict', 'to_dict')
+
+
+def run_memory_benchmarks(list_lengths: Iterable[int], depths: Iterable[int], repeat: int = 100,
+                          log: Optional[Callable[[str], None]] = None) -> Dict[str, dict]:
+    """
+    Measures the memory cost of the construction, from_dict and to_dict operations of the benchmarked models.
+    Returns a JSON serializable dict with the stats of each benchmark.
+    """
+    results = {}
+    scenarios = [('computer[list_length=%s]' % x, computer_subjects(), computer_payload(x)) for x in list_lengths]
+    scenarios += [('chain[depth=%s]' % x, chain_subjects(x), chain_payload(x)) for x in depths]
+    for scenario, subjects, payload in scenarios:
+        for subject in subjects:
+            instance = subject.construct(payload)
+            ops = {
+                'construction': lambda: subject.construct(payload),
+                'from_dict': lambda: subject.from_dict(payload),
+                'to_dict': lambda: subject.to_dict(instance),
+            }
+            for operation in MEMORY_OPERATIONS:
+                name = '%s/%s/%s' % (scenario, subject.library, operation)
+                results[name] = measure_allocations(ops[operation], repeat=repeat)._asdict()
+                if log is not None:
+                    log('%s: %.0f bytes, %.1f allocations retained (peak %.0f bytes, %.1f allocations)' % (
+                        name, results[name]['retained_bytes'], results[name]['retained_blocks'],
+                        results[name]['peak_bytes'], results[name]['allocated_blocks']))
+    return results
@@ -0,0 +1,290 @@
+import re
+from dataclasses import dataclass, asdict
+from typing import List, Optional
+
+from pymodelio import PymodelioModel
+from pymodelio.attribute import Attr
+from pymodelio.validators import ListValidator, StringValidator
+from pymodelio.validators.int_validator import IntValidator
+from pymodelio.validators.validator import Validator
+
+_SERIAL_NO_REGEX = re.compile(r'^[a-z0-9-]+$')
+
+
+# Pymodelio models (the same graph used by the tests)
+class Component(PymodelioModel):
+    __serial_no: Attr(
+        str,
+        validator=StringValidator(fixed_len=36, regex=r'^[a-z0-9-]+$'),  # noqa: F722
+        init_alias='serial_no'
+    )
+
+    @property
+    def serial_no(self) -> str:
+        return self.__serial_no
+
+
+class CPU(Component):
+    _frequency: Attr(int, validator=IntValidator(min_value=0), init_alias='frequency')
+    cores: Attr(int, validator=IntValidator(min_value=0))
+
+    @property
+    def frequency(self) -> int:
+        return self._frequency
+
+
+class RAM(Component):
+    frequency: Attr(int, validator=IntValidator(min_value=0))
+    size: Attr(int, validator=IntValidator(min_value=0))
+
+
+class Disk(Component):
+    size: Attr(int, validator=IntValidator(min_value=0))
+
+
+class Computer(Component):
+    _cpu: Attr(CPU, validator=Validator(expected_type=CPU), init_alias='cpu')
+    _rams: Attr(List[RAM], validator=ListValidator(elements_type=RAM, allow_empty=False), init_alias='rams')
+    _disks: Attr(List[Disk], validator=ListValidator(elements_type=Disk), init_alias='disks')
+
+    @property
+    def cpu(self) -> CPU:
+        return self._cpu
+
+    @property
+    def rams(self) -> List[RAM]:
+        return self._rams
+
+    @property
+    def disks(self) -> List[Disk]:
+        return self._disks
+
+
+# Raw Python models, implementing by hand what pymodelio does for the models above
+def _validate_serial_no(serial_no: str, path: str) -> None:
+    if not isinstance(serial_no, str):
+        raise ValueError('%s.serial_no is not instance of str' % path)
+    if len(serial_no) != 36:
+        raise ValueError('%s.serial_no length is different than 36' % path)
+    if _SERIAL_NO_REGEX.match(serial_no) is None:
+        raise ValueError('%s.serial_no does not match configured regex' % path)
+
+
+def _validate_non_negative_int(value: int, path: str) -> None:
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError('%s is not instance of int' % path)
+    if value < 0:
+        raise ValueError('%s is less than 0' % path)
+
+
+class RawCPU:
+
+    def __init__(self, serial_no: str, frequency: int, cores: int, auto_validate: bool = True) -> None:
+        self.serial_no = serial_no
+        self.frequency = frequency
+        self.cores = cores
+        if auto_validate:
+            self.validate()
+
+    def validate(self, path: str = 'RawCPU') -> None:
+        _validate_serial_no(self.serial_no, path)
+        _validate_non_negative_int(self.frequency, path + '.frequency')
+        _validate_non_negative_int(self.cores, path + '.cores')
+
+    @classmethod
+    def from_dict(cls, data: dict, auto_validate: bool = True) -> 'RawCPU':
+        return cls(data['serial_no'], data['frequency'], data['cores'], auto_validate=auto_validate)
+
+    def to_dict(self) -> dict:
+        return {'serial_no': self.serial_no, 'frequency': self.frequency, 'cores': self.cores}
+
+    def __repr__(self) -> str:
+        return 'RawCPU(cores=%r, frequency=%r, serial_no=%r)' % (self.cores, self.frequency, self.serial_no)
+
+
+class RawRAM:
+
+    def __init__(self, serial_no: str, frequency: int, size: int, auto_validate: bool = True) -> None:
+        self.serial_no = serial_no
+        self.frequency = frequency
+        self.size = size
+        if auto_validate:
+            self.validate()
+
+    def validate(self, path: str = 'RawRAM') -> None:
+        _validate_serial_no(self.serial_no, path)
+        _validate_non_negative_int(self.frequency, path + '.frequency')
+        _validate_non_negative_int(self.size, path + '.size')
+
+    @classmethod
+    def from_dict(cls, data: dict, auto_validate: bool = True) -> 'RawRAM':
+        return cls(data['serial_no'], data['frequency'], data['size'], auto_validate=auto_validate)
+
+    def to_dict(self) -> dict:
+        return {'serial_no': self.serial_no, 'frequency': self.frequency, 'size': self.size}
+
+    def __repr__(self) -> str:
+        return 'RawRAM(frequency=%r, serial_no=%r, size=%r)' % (self.frequency, self.serial_no, self.size)
+
+
+class RawDisk:
+
+    def __init__(self, serial_no: str, size: int, auto_validate: bool = True) -> None:
+        self.serial_no = serial_no
+        self.size = size
+        if auto_validate:
+            self.validate()
+
+    def validate(self, path: str = 'RawDisk') -> None:
+        _validate_serial_no(self.serial_no, path)
+        _validate_non_negative_int(self.size, path + '.size')
+
+    @classmethod
+    def from_dict(cls, data: dict, auto_validate: bool = True) -> 'RawDisk':
+        return cls(data['serial_no'], data['size'], auto_validate=auto_validate)
+
+    def to_dict(self) -> dict:
+        return {'serial_no': self.serial_no, 'size': self.size}
+
+    def __repr__(self) -> str:
+        return 'RawDisk(serial_no=%r, size=%r)' % (self.serial_no, self.size)
+
+
+class RawComputer:
+
+    def __init__(self, serial_no: str, cpu: RawCPU, rams: List[RawRAM], disks: List[RawDisk],
+                 auto_validate: bool = True) -> None:
+        self.serial_no = serial_no
+        self.cpu = cpu
+        self.rams = rams
+        self.disks = disks
+        if auto_validate:
+            self.validate()
+
+    def validate(self, path: str = 'RawComputer') -> None:
+        _validate_serial_no(self.serial_no, path)
+        if not isinstance(self.cpu, RawCPU):
+            raise ValueError('%s.cpu is not instance of RawCPU' % path)
+        self.cpu.validate(path + '.cpu')
+        if not isinstance(self.rams, list):
+            raise ValueError('%s.rams is not instance of list' % path)
+        if len(self.rams) == 0:
+            raise ValueError('%s.rams is empty' % path)
+        for i, ram in enumerate(self.rams):
+            if not isinstance(ram, RawRAM):
+                raise ValueError('%s.rams[%s] is not instance of RawRAM' % (path, i))
+            ram.validate('%s.rams[%s]' % (path, i))
+        if not isinstance(self.disks, list):
+            raise ValueError('%s.disks is not instance of list' % path)
+        for i, disk in enumerate(self.disks):
+            if not isinstance(disk, RawDisk):
+                raise ValueError('%s.disks[%s] is not instance of RawDisk' % (path, i))
+            disk.validate('%s.disks[%s]' % (path, i))
+
+    @classmethod
+    def from_dict(cls, data: dict, auto_validate: bool = True) -> 'RawComputer':
+        return cls(
+            data['serial_no'],
+            RawCPU.from_dict(data['cpu'], auto_validate=False),
+            [RawRAM.from_dict(x, auto_validate=False) for x in data['rams']],
+            [RawDisk.from_dict(x, auto_validate=False) for x in data['disks']],
+            auto_validate=auto_validate
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            'serial_no': self.serial_no,
+            'cpu': self.cpu.to_dict(),
+            'rams': [x.to_dict() for x in self.rams],
+            'disks': [x.to_dict() for x in self.disks]
+        }
+
+    def __repr__(self) -> str:
+        return 'RawComputer(cpu=%r, disks=%r, rams=%r, serial_no=%r)' % (
+            self.cpu, self.disks, self.rams, self.serial_no
+        )
+
+
+# Dataclasses models (without validation, as dataclasses does not validate)
+@dataclass
+class DataclassCPU:
+    serial_no: str
+    frequency: int
+    cores: int
+
+
+@dataclass
+class DataclassRAM:
+    serial_no: str
+    frequency: int
+    size: int
+
+
+@dataclass
+class DataclassDisk:
+    serial_no: str
+    size: int
+
+
+@dataclass
+class DataclassComputer:
+    serial_no: str
+    cpu: DataclassCPU
+    rams: List[DataclassRAM]
+    disks: List[DataclassDisk]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'DataclassComputer':
+        return cls(
+            data['serial_no'],
+            DataclassCPU(**data['cpu']),
+            [DataclassRAM(**x) for x in data['rams']],
+            [DataclassDisk(**x) for x in data['disks']]
+        )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# Models for sweeping the nesting depth, where each level holds the next one
+def build_pymodelio_chain(depth: int) -> List[type]:
+    """
+    Returns depth models (from the outermost one), where each of them holds the next one
+    """
+    levels = []
+    for level in reversed(range(depth)):
+        annotations = {'value': Attr(int)}
+        if levels:
+            annotations['child'] = Attr(levels[0])
+        namespace = {'__annotations__': annotations, '__module__': __name__}
+        levels.insert(0, type('Level%s' % level, (PymodelioModel,), namespace))
+    return levels
+
+
+class RawLevel:
+
+    def __init__(self, value: int, child: Optional['RawLevel'] = None, auto_validate: bool = True) -> None:
+        self.value = value
+        self.child = child
+        if auto_validate:
+            self.validate()
+
+    def validate(self) -> None:
+        if not isinstance(self.value, int):
+            raise ValueError('value is not instance of int')
+        if self.child is not None:
+            if not isinstance(self.child, RawLevel):
+                raise ValueError('child is not instance of RawLevel')
+            self.child.validate()
+
+    @classmethod
+    def from_dict(cls, data: dict, auto_validate: bool = True) -> 'RawLevel':
+        child = data.get('child')
+        return cls(data['value'], None if child is None else cls.from_dict(child, auto_validate=False),
+                   auto_validate=auto_validate)
+
+    def to_dict(self) -> dict:
+        return {'value': self.value, 'child': None if self.child is None else self.child.to_dict()}
+
+    def __repr__(self) -> str:
+        return 'RawLevel(child=%r, value=%r)' % (self.child, self.value)
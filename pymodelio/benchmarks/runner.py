@@ -0,0 +1,164 @@
+import platform
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pymodelio import __version__
+from pymodelio.benchmarks.import_time import measure_import_time
+from pymodelio.benchmarks.libraries import Subject, OPERATIONS, computer_payload, chain_payload, computer_subjects, \
+    chain_subjects
+
+RAW_LIBRARY = 'raw'
+
+DEFAULT_LIST_LENGTHS = (1, 10, 100, 1000)
+DEFAULT_DEPTHS = (1, 4, 16, 64)
+
+# Measured import statements, by benchmark name
+IMPORT_STATEMENTS = {
+    'import/pymodelio/package': 'import pymodelio',
+    'import/pymodelio/model': 'from pymodelio import PymodelioModel, Attr',
+}
+
+# Growth of the per item time between the last two sizes of a sweep considered super-linear
+SUPER_LINEAR_FACTOR = 2
+
+
+def measure(func: Callable[..., object], min_time: float = 0.05, repeat: int = 3,
+            setup: Optional[Callable[[], Any]] = None) -> float:
+    """
+    Returns the best time (in seconds) of a call to func. The amount of calls per measure is increased until they
+    take at least min_time. If setup is provided, func is called with a new value returned by setup on each call
+    (for instance, a new instance to validate), which are created before timing the calls.
+    """
+    number = 1
+    while True:
+        elapsed = _time_calls(func, number, setup)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        best = min(best, _time_calls(func, number, setup))
+    return best / number
+
+
+def _time_calls(func: Callable[..., object], number: int, setup: Optional[Callable[[], Any]]) -> float:
+    if setup is None:
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        return perf_counter() - start
+    values = [setup() for _ in range(number)]
+    start = perf_counter()
+    for value in values:
+        func(value)
+    return perf_counter() - start
+
+
+def _operation_funcs(subject: Subject,
+                     payload: dict) -> Dict[str, Tuple[Callable[..., object], Optional[Callable[[], Any]]]]:
+    """
+    Returns the function measuring each operation, along with the setup of its calls (if any)
+    """
+    instance = subject.construct(payload)
+    funcs = {
+        'construction': (lambda: subject.construct(payload), None),
+        # Validated models are not validated again, so each call validates a new instance
+        'validate': None if subject.validate is None else (subject.validate, lambda: subject.construct(payload)),
+        'revalidate': None if subject.validate is None else (lambda: subject.validate(instance), None),
+        'from_dict': (lambda: subject.from_dict(payload), None),
+        'to_dict': (lambda: subject.to_dict(instance), None),
+        'repr': (lambda: repr(instance), None),
+    }
+    return {operation: funcs[operation] for operation in OPERATIONS if funcs[operation] is not None}
+
+
+def _run_subjects(results: Dict[str, float], scenario: str, subjects: Iterable[Subject], payload: dict,
+                  min_time: float, repeat: int, log: Optional[Callable[[str], None]]) -> None:
+    for subject in subjects:
+        for operation, (func, setup) in _operation_funcs(subject, payload).items():
+            name = result_name(scenario, subject.library, operation)
+            results[name] = measure(func, min_time=min_time, repeat=repeat, setup=setup)
+            if log is not None:
+                log('%s: %.3f us' % (name, results[name] * 1_000_000))
+
+
+def result_name(scenario: str, library: str, operation: str) -> str:
+    return '%s/%s/%s' % (scenario, library, operation)
+
+
+def run_benchmarks(list_lengths: Iterable[int] = DEFAULT_LIST_LENGTHS, depths: Iterable[int] = DEFAULT_DEPTHS,
+                   min_time: float = 0.05, repeat: int = 3, log: Optional[Callable[[str], None]] = None,
+                   import_time: bool = True) -> dict:
+    """
+    Benchmarks the computer graph sweeping the length of its lists, and nested models sweeping the nesting depth.
+    If import_time is True, the time spent importing pymodelio is measured too.
+    Returns a JSON serializable dict with the metadata of the run, the time per call (in seconds) of each benchmark
+    and the scaling of each sweep.
+    """
+    list_lengths, depths = sorted(list_lengths), sorted(depths)
+    results: Dict[str, float] = {}
+    subjects = computer_subjects()
+    for list_length in list_lengths:
+        _run_subjects(results, 'computer[list_length=%s]' % list_length, subjects, computer_payload(list_length),
+                      min_time, repeat, log)
+    for depth in depths:
+        _run_subjects(results, 'chain[depth=%s]' % depth, chain_subjects(depth), chain_payload(depth), min_time,
+                      repeat, log)
+    if import_time:
+        for name, statement in IMPORT_STATEMENTS.items():
+            results[name] = measure_import_time(statement, runs=repeat)
+            if log is not None:
+                log('%s: %.3f ms' % (name, results[name] * 1000))
+    return {
+        'metadata': {
+            'pymodelio_version': __version__,
+            'python_version': platform.python_version(),
+            'python_implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'libraries': [subject.library for subject in subjects],
+        },
+        'results': results,
+        'relative_to_raw': compute_relative_to_raw(results),
+        'scaling': {
+            **compute_scaling(results, 'computer[list_length=%s]', list_lengths),
+            **compute_scaling(results, 'chain[depth=%s]', depths),
+        },
+    }
+
+
+def compute_relative_to_raw(results: Dict[str, float]) -> Dict[str, float]:
+    """
+    Returns how many times slower than the raw Python implementation each benchmark is
+    """
+    relative = {}
+    for name, seconds in results.items():
+        scenario, library, operation = name.split('/')
+        raw_seconds = results.get(result_name(scenario, RAW_LIBRARY, operation))
+        if library != RAW_LIBRARY and raw_seconds:
+            relative[name] = seconds / raw_seconds
+    return relative
+
+
+def compute_scaling(results: Dict[str, float], scenario_format: str, sizes: List[int]) -> Dict[str, float]:
+    """
+    Returns the growth of the time per item between the last two sizes of a sweep, for each library and operation.
+    It is close to 1 (or lower) when the time grows linearly with the size, and greater for super-linear growths.
+    """
+    scaling = {}
+    if len(sizes) < 2:
+        return scaling
+    previous_size, size = sizes[-2], sizes[-1]
+    previous_scenario, scenario = scenario_format % previous_size, scenario_format % size
+    prefix = scenario + '/'
+    for name, seconds in results.items():
+        if not name.startswith(prefix):
+            continue
+        previous_seconds = results.get(previous_scenario + name[len(scenario):])
+        if previous_seconds:
+            sweep = '%s%s' % (scenario_format.split('[')[0], name[len(scenario):])
+            scaling[sweep] = (seconds / size) / (previous_seconds / previous_size)
+    return scaling
+
+
+def super_linear_sweeps(run: dict, factor: float = SUPER_LINEAR_FACTOR) -> Dict[str, float]:
+    return {name: value for name, value in run['scaling'].items() if value > factor}
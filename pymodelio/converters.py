@@ -0,0 +1,100 @@
+import types
+import typing
+from typing import Any, Callable, Optional
+
+from pymodelio import model_registry
+
+Converter = Callable[[Any, bool], Any]
+
+
+class UnresolvedReferenceError(LookupError):
+    """
+    Raised when a converter can't be built yet, because a model it references is not defined
+    """
+
+
+def build_converter(attr_type: Any, owner: Optional[type] = None) -> Optional[Converter]:
+    """
+    Returns a function deserializing the models held by the values of a type, with a single comprehension for each
+    level of the type (for instance, a Dict[str, List[Model]] is deserialized by a dict comprehension whose values are
+    list comprehensions). Tuples and sets are built from the lists holding them in the payloads. None is returned if
+    the values of the type don't need to be converted (they don't hold models nor tuples or sets). Forward references
+    are resolved from the scope of the owner model. The returned function receives the value and whether it is
+    trusted (see from_dict).
+    """
+    if isinstance(attr_type, (str, typing.ForwardRef)):
+        name = attr_type if isinstance(attr_type, str) else attr_type.__forward_arg__
+        resolved = model_registry.lookup(name, owner)
+        if resolved is None:
+            raise UnresolvedReferenceError(name)
+        attr_type = resolved
+    if getattr(attr_type, '__is_pymodelio_model__', False):
+        return _model_converter(attr_type)
+    origin = typing.get_origin(attr_type)
+    args = typing.get_args(attr_type)
+    if not args:
+        return None
+    if origin in (typing.Union, types.UnionType):
+        variants = [x for x in args if x is not type(None)]
+        # Only optionals are converted, as the variant of other unions can't be known by the type
+        return build_converter(variants[0], owner) if len(variants) == 1 else None
+    if origin in (list, set, frozenset) or (origin is tuple and len(args) == 2 and args[1] is Ellipsis):
+        return _sequence_converter(build_converter(args[0], owner), origin)
+    if origin is tuple:
+        return _fixed_tuple_converter([build_converter(x, owner) for x in args])
+    if origin is dict:
+        return _dict_converter(build_converter(args[1], owner))
+    return None
+
+
+def _model_converter(model: type) -> Converter:
+    from_dict = model.from_dict
+
+    def convert(value: Any, trusted: bool) -> Any:
+        return from_dict(value, auto_validate=False, trusted=trusted) if isinstance(value, dict) else value
+
+    return convert
+
+
+def _sequence_converter(elements_converter: Optional[Converter], container: type) -> Optional[Converter]:
+    # Payloads hold collections as lists, so the declared container is built even if the elements are not converted
+    if elements_converter is None:
+        if container is list:
+            return None
+
+        def convert_container(value: Any, trusted: bool) -> Any:
+            return container(value) if isinstance(value, (list, tuple, set, frozenset)) else value
+
+        return convert_container
+
+    def convert(value: Any, trusted: bool) -> Any:
+        if isinstance(value, (list, tuple, set, frozenset)):
+            converted = [elements_converter(x, trusted) for x in value]
+            return converted if container is list else container(converted)
+        return value
+
+    return convert
+
+
+def _fixed_tuple_converter(items_converters: list) -> Converter:
+    items_converters = [(lambda x, trusted: x) if x is None else x for x in items_converters]
+
+    def convert(value: Any, trusted: bool) -> Any:
+        # Values of another length are left as they are, so they fail when validated
+        if isinstance(value, (list, tuple)) and len(value) == len(items_converters):
+            return tuple([c(x, trusted) for c, x in zip(items_converters, value)])
+        return value
+
+    return convert
+
+
+def _dict_converter(values_converter: Optional[Converter]) -> Optional[Converter]:
+    if values_converter is None:
+        return None
+
+    def convert(value: Any, trusted: bool) -> Any:
+        if isinstance(value, dict):
+            return {k: values_converter(v, trusted) for k, v in value.items()}
+        return value
+
+    return convert
@@ -0,0 +1,93 @@
+import types
+import typing
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from pymodelio import model_registry
+from pymodelio.exceptions.discriminator_exception import DiscriminatorException
+
+_UNION_ORIGINS = (typing.Union, types.UnionType)
+
+
+def get_union_variants(attr_type: Any) -> Optional[Tuple[tuple, bool, bool]]:
+    """
+    Returns the variants of a Union type (or of a List of a Union), whether it is a list of them, and whether it is
+    nullable. If the type is not a Union, None is returned.
+    """
+    is_list = typing.get_origin(attr_type) is list
+    union = typing.get_args(attr_type)[0] if is_list and typing.get_args(attr_type) else attr_type
+    if typing.get_origin(union) not in _UNION_ORIGINS:
+        return None
+    args = typing.get_args(union)
+    variants = tuple(x for x in args if x is not type(None))
+    return variants, is_list, len(variants) < len(args)
+
+
+def split_union(attr_type: Any) -> Tuple[tuple, bool, bool]:
+    """
+    Same as get_union_variants, but for the types of discriminated attributes, which must be Unions
+    """
+    union_variants = get_union_variants(attr_type)
+    if union_variants is None:
+        raise DiscriminatorException(
+            'Discriminated attributes must be a Union of models or a List of them, but %s was provided' % attr_type
+        )
+    return union_variants
+
+
+def get_models_union(attr_type: Any) -> Optional[Tuple[tuple, bool, bool]]:
+    """
+    Same as get_union_variants, but only for Unions of more than one model (or forward reference to them)
+    """
+    union_variants = get_union_variants(attr_type)
+    if union_variants is None or len(union_variants[0]) < 2:
+        return None
+    for variant in union_variants[0]:
+        if not isinstance(variant, (str, typing.ForwardRef)) and not getattr(variant, '__is_pymodelio_model__', False):
+            return None
+    return union_variants
+
+
+def resolve_variants(variants: Iterable[Any], owner: Optional[type]) -> tuple:
+    """
+    Returns the variants with their forward references resolved from the scope of the owner model
+    """
+    resolved = []
+    for variant in variants:
+        if isinstance(variant, (str, typing.ForwardRef)):
+            name = variant if isinstance(variant, str) else variant.__forward_arg__
+            variant = model_registry.lookup(name, owner)
+            if variant is None:
+                raise DiscriminatorException('The discriminated variant \'%s\' is not defined' % name)
+        resolved.append(variant)
+    return tuple(resolved)
+
+
+def build_tag_table(variants: Iterable[type], discriminator: str) -> Dict[Any, type]:
+    """
+    Maps the tags of the variants to them. Each variant declares its tags as the Literal values of the attribute it
+    exposes with the discriminator name.
+    """
+    table = {}
+    for variant in variants:
+        for tag in _get_variant_tags(variant, discriminator):
+            if tag in table:
+                raise DiscriminatorException('%s and %s are both tagged as %r' % (
+                    table[tag].__name__, variant.__name__, tag))
+            table[tag] = variant
+    return table
+
+
+def _get_variant_tags(variant: type, discriminator: str) -> tuple:
+    # Imported here, as the models depend on this module
+    from pymodelio.pymodelio_meta import PymodelioMeta
+
+    if not getattr(variant, '__is_pymodelio_model__', False):
+        raise DiscriminatorException('Discriminated variants must be models, but %s was provided' % variant)
+    for attr_name, model_attr in PymodelioMeta.get_model_attrs(variant).items():
+        if attr_name == discriminator or discriminator in model_attr.init_aliases:
+            if typing.get_origin(model_attr.attr_type) is typing.Literal:
+                return typing.get_args(model_attr.attr_type)
+            break
+    raise DiscriminatorException(
+        '%s must declare its %s attribute as a Literal of its tags' % (variant.__name__, discriminator)
+    )
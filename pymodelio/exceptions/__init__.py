@@ -1,3 +1,21 @@
 # flake8: noqa
-from .model_validation_exception import ModelValidationException
-from .auto_validator_creation_exception import AutoValidatorCreationException
+from pymodelio.lazy_imports import lazy_getattr
+
+_LAZY_NAMES = {
+    'ValidationError': ('.validation_error', 'ValidationError'),
+    'ModelValidationException': ('.model_validation_exception', 'ModelValidationException'),
+    'AutoValidatorCreationException': ('.auto_validator_creation_exception', 'AutoValidatorCreationException'),
+    'DiscriminatorException': ('.discriminator_exception', 'DiscriminatorException'),
+}
+
+__all__ = tuple(_LAZY_NAMES)
+
+__getattr__ = lazy_getattr(__name__, globals(), _LAZY_NAMES)
+
+# Imported by type checkers and IDEs only, as typing is expensive to import
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .validation_error import ValidationError
+    from .model_validation_exception import ModelValidationException
+    from .auto_validator_creation_exception import AutoValidatorCreationException
+    from .discriminator_exception import DiscriminatorException
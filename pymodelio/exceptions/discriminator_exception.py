@@ -0,0 +1,2 @@
+class DiscriminatorException(Exception):
+    pass
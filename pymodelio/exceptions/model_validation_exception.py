@@ -1,2 +1,12 @@
+from typing import List, Optional
+
+from pymodelio.exceptions.validation_error import ValidationError
+
+
 class ModelValidationException(Exception):
-    pass
+
+    def __init__(self, message: Optional[str] = None, errors: Optional[List[ValidationError]] = None) -> None:
+        if message is None and errors:
+            message = '\n'.join([str(error) for error in errors])
+        super().__init__(*((message,) if message is not None else ()))
+        self.errors = errors if errors is not None else []
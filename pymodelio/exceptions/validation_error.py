@@ -0,0 +1,31 @@
+from collections import namedtuple
+from typing import Any, Iterable, Tuple, Union
+
+PathKey = Union[str, int]
+
+
+def format_path(root: Any, keys: Iterable[PathKey]) -> str:
+    formatted = ['%s' % (root,)]
+    for key in keys:
+        formatted.append(('[%s]' if isinstance(key, int) else '.%s') % key)
+    return ''.join(formatted)
+
+
+class ValidationError(namedtuple('_ValidationError', 'root path message')):
+    """
+    A single validation failure. `root` is the name of the validated model (or the path provided when validating),
+    `path` is the tuple of attribute names and indexes from the root to the invalid value and `message` describes
+    the failure.
+    """
+    __slots__ = ()
+
+    root: Any
+    path: Tuple[PathKey, ...]
+    message: str
+
+    @property
+    def full_path(self) -> str:
+        return format_path(self.root, self.path)
+
+    def __str__(self) -> str:
+        return '%s %s' % (self.full_path, self.message)
@@ -0,0 +1,46 @@
+from typing import Any, Callable, Dict
+
+from pymodelio.pymodelio_model import PymodelioModel
+
+# Original implementations of the instrumented PymodelioModel methods
+_original_methods: Dict[str, Any] = {}
+# Installed wrappers of each instrumented method, by instrumentation key, in installation order
+_method_wrappers: Dict[str, Dict[str, Callable[[Callable], Callable]]] = {}
+
+
+def install(key: str, method_name: str, wrap: Callable[[Callable], Callable]) -> None:
+    """
+    Replaces the PymodelioModel method by the function returned by wrap, which receives the current implementation
+    (a plain function, even for classmethods). Multiple instrumentations (identified by key) can wrap the same method
+    and be uninstalled in any order.
+    """
+    if method_name not in _original_methods:
+        _original_methods[method_name] = PymodelioModel.__dict__[method_name]
+        _method_wrappers[method_name] = {}
+    _method_wrappers[method_name][key] = wrap
+    _rebuild_method(method_name)
+
+
+def uninstall(key: str) -> None:
+    """
+    Removes the wrappers installed with the provided key. Methods left without wrappers get their original
+    implementation back.
+    """
+    for method_name in list(_method_wrappers):
+        if _method_wrappers[method_name].pop(key, None) is not None:
+            _rebuild_method(method_name)
+
+
+def _rebuild_method(method_name: str) -> None:
+    original = _original_methods[method_name]
+    wrappers = _method_wrappers[method_name]
+    if not wrappers:
+        setattr(PymodelioModel, method_name, original)
+        del _original_methods[method_name]
+        del _method_wrappers[method_name]
+        return
+    is_classmethod = isinstance(original, classmethod)
+    method = original.__func__ if is_classmethod else original
+    for wrap in wrappers.values():
+        method = wrap(method)
+    setattr(PymodelioModel, method_name, classmethod(method) if is_classmethod else method)
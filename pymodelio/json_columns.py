@@ -0,0 +1,46 @@
+import json
+import typing
+from typing import Any, Callable
+
+from pymodelio.converters import build_converter
+from pymodelio.model_serializer import ModelSerializer
+
+_CONTAINERS = (list, tuple, dict, set, frozenset)
+
+
+def is_json_column(inner_cls: type, attr_name: str, attr_type: Any) -> bool:
+    """
+    Returns whether the column of the attribute holds JSON, which is the case of nested models, collections and
+    unions of models (as they can't be stored as scalar values)
+    """
+    return attr_name in inner_cls.__unions__ or getattr(attr_type, '__is_pymodelio_model__', False) or \
+        (typing.get_origin(attr_type) or attr_type) in _CONTAINERS
+
+
+def to_json(value: Any) -> str:
+    """
+    Serializes the value of a column holding nested models or collections, the same way to_dict serializes them
+    """
+    return json.dumps(ModelSerializer.serialize(value))
+
+
+def build_json_converter(inner_cls: type, attr_name: str, attr_type: Any, trusted: bool = True) -> Callable[[Any], Any]:
+    """
+    Returns a function deserializing the values of the attribute from the JSON of their columns. The models they hold
+    are constructed through the trusted path, unless trusted is False (in which case they are initialized like in
+    from_dict, leaving their validation to the model holding them).
+    """
+    union = inner_cls.__unions__.get(attr_name)
+    if union is not None:
+        convert = union.deserialize
+    else:
+        convert = build_converter(attr_type, inner_cls.__pymodelio_parent__)
+
+    def from_json(value: Any) -> Any:
+        if value is None:
+            return None
+        value = json.loads(value)
+        # JSON has no tuples nor sets, so they are built from lists by the converter of the attribute
+        return value if convert is None else convert(value, trusted)
+
+    return from_json
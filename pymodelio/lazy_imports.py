@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from importlib import import_module
+
+# typing is expensive to import, so it is only imported by type checkers
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def lazy_getattr(package: str, package_globals: Dict[str, Any],
+                 lazy_names: Dict[str, Tuple[str, Optional[str]]]) -> Callable[[str], Any]:
+    """
+    Builds a module __getattr__ importing the names of a package on first access. lazy_names maps each name to the
+    (relative) module defining it and its name in that module, or None if the name is the module itself. Resolved
+    names are cached in the package globals, so they are only resolved once.
+    """
+
+    def __getattr__(name: str) -> Any:
+        lazy_name = lazy_names.get(name)
+        if lazy_name is None:
+            raise AttributeError('module %r has no attribute %r' % (package, name))
+        module_name, attr_name = lazy_name
+        module = import_module(module_name, package)
+        value = module if attr_name is None else getattr(module, attr_name)
+        package_globals[name] = value
+        return value
+
+    return __getattr__
@@ -0,0 +1,622 @@
+import struct
+import threading
+import types
+import typing
+from datetime import datetime, date, time, timedelta, timezone
+from enum import Enum
+from typing import Any, Callable, List, Tuple, Type, TypeVar, Union
+from weakref import WeakKeyDictionary
+from zlib import crc32
+
+from pymodelio import model_registry
+from pymodelio.discriminators import get_models_union
+from pymodelio.pymodelio_meta import PymodelioMeta
+
+T = TypeVar('T')
+
+_new = object.__new__
+
+_HEADER = struct.Struct('<I')
+_DOUBLE = struct.Struct('<d')
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_UNION_ORIGINS = (typing.Union, types.UnionType)
+
+# Functions appending the encoding of a value to a buffer, and decoding a value from a buffer at a position (returning
+# it along with the position where its encoding ends)
+Encoder = Callable[[bytearray, Any], None]
+Decoder = Callable[[memoryview, int], Tuple[Any, int]]
+
+# Codecs of the prepared models, by their inner classes
+_codecs: 'WeakKeyDictionary[type, _ModelCodec]' = WeakKeyDictionary()
+
+
+class ModelCodec:
+    """
+    Encodes models to a compact binary format, and decodes them back. The attributes of the models are encoded by
+    position (in the order of __model_attrs__) after a bitmap of the ones that are not None, and each of them is
+    encoded by its declared type: integers as zigzag varints, floats as 8 bytes, strings and bytes prefixed by their
+    length, datetimes as microseconds since the epoch, dates as days, times as microseconds since midnight,
+    timedeltas as microseconds, UUIDs as their 16 bytes, enums by their values, nested models as their attributes and
+    collections prefixed by their length. Values whose type is not known by the declaration (like the ones of Any
+    attributes) are prefixed by a tag of their type, and attributes of other types are rejected when the codec is
+    built. Each encoded model starts with the fingerprint of the schema of its class, so payloads encoded with another
+    version of it are rejected. Models referencing themselves (directly or through their nested models) can't be
+    encoded, so ValueError is raised for them.
+    """
+
+    @staticmethod
+    def to_bytes(model: Any) -> bytes:
+        codec = _get_codec(type(model))
+        buffer = bytearray(_HEADER.pack(codec.fingerprint))
+        codec.encode(buffer, model)
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, pmcls: Type[T], data: Union[bytes, bytearray, memoryview], trusted: bool = False) -> T:
+        codec = _get_codec(pmcls._get_inner_model() or PymodelioMeta.prepare(pmcls))
+        buffer = memoryview(data)
+        model, position = cls.__decode(codec, buffer, 0)
+        if position != len(buffer):
+            raise ValueError('The payload has %s bytes after the encoded %s' % (len(buffer) - position, pmcls.__name__))
+        if not trusted:
+            model.validate()
+        return model
+
+    @classmethod
+    def from_bytes_many(cls, pmcls: Type[T], data: Union[bytes, bytearray, memoryview],
+                        trusted: bool = False) -> List[T]:
+        codec = _get_codec(pmcls._get_inner_model() or PymodelioMeta.prepare(pmcls))
+        buffer = memoryview(data)
+        models = []
+        position = 0
+        while position < len(buffer):
+            model, position = cls.__decode(codec, buffer, position)
+            if not trusted:
+                model.validate()
+            models.append(model)
+        return models
+
+    @staticmethod
+    def __decode(codec: '_ModelCodec', buffer: memoryview, position: int) -> Tuple[Any, int]:
+        try:
+            fingerprint, = _HEADER.unpack_from(buffer, position)
+            if fingerprint != codec.fingerprint:
+                raise ValueError('The payload was not encoded with the current schema of %s' % codec.name)
+            return codec.decode(buffer, position + _HEADER.size)
+        except (IndexError, struct.error, UnicodeDecodeError, OverflowError) as e:
+            raise ValueError('The payload is not a valid encoding of %s (%s)' % (codec.name, e))
+
+
+class _EncodingModels(threading.local):
+    """
+    Ids of the models of a recursive schema being encoded in the current thread, for detecting the cycles of their
+    graphs
+    """
+
+    def __init__(self) -> None:
+        self.ids = set()
+
+
+class _ModelCodec:
+    __slots__ = ('inner_cls', 'name', 'attr_names', 'encoders', 'decoders', 'bitmap_size', 'fingerprint', 'encoding')
+
+    def __init__(self, inner_cls: type) -> None:
+        self.inner_cls = inner_cls
+        self.name = inner_cls.__name__
+        self.attr_names = tuple(x for x, _ in inner_cls.__model_attrs__)
+        self.bitmap_size = (len(self.attr_names) + 7) // 8
+        # None until the codec is built
+        self.encoders = None
+        self.decoders = ()
+        # Only the codecs of recursive schemas (the ones referenced while they are being built) track the models they
+        # are encoding, as the graphs of the other ones can't have cycles
+        self.encoding = None
+        self.fingerprint = crc32(_describe(inner_cls, set()).encode())
+
+    def build(self) -> None:
+        owner = self.inner_cls.__pymodelio_parent__
+        codecs = [_build_codec(model_attr.attr_type, owner) for _, model_attr in self.inner_cls.__model_attrs__]
+        self.encoders = tuple(x[0] for x in codecs)
+        self.decoders = tuple(zip(self.attr_names, [x[1] for x in codecs]))
+
+    def encode(self, buffer: bytearray, model: Any) -> None:
+        if self.encoding is None:
+            self.__encode(buffer, model)
+            return
+        encoding_ids = self.encoding.ids
+        model_id = id(model)
+        if model_id in encoding_ids:
+            raise ValueError('%s references itself, so it can\'t be encoded' % self.name)
+        encoding_ids.add(model_id)
+        try:
+            self.__encode(buffer, model)
+        finally:
+            encoding_ids.discard(model_id)
+
+    def __encode(self, buffer: bytearray, model: Any) -> None:
+        values = [getattr(model, x) for x in self.attr_names]
+        bitmap = 0
+        for i, value in enumerate(values):
+            if value is not None:
+                bitmap |= 1 << i
+        buffer += bitmap.to_bytes(self.bitmap_size, 'little')
+        for encode, value in zip(self.encoders, values):
+            if value is not None:
+                encode(buffer, value)
+
+    def decode(self, buffer: memoryview, position: int) -> Tuple[Any, int]:
+        end = position + self.bitmap_size
+        if end > len(buffer):
+            raise IndexError('the payload is truncated')
+        bitmap = int.from_bytes(buffer[position:end], 'little')
+        position = end
+        # Like when constructing models, the values are assigned without running the initialization hooks
+        instance = _new(self.inner_cls)
+        for attr_name, decode in self.decoders:
+            if bitmap & 1:
+                value, position = decode(buffer, position)
+            else:
+                value = None
+            bitmap >>= 1
+            setattr(instance, attr_name, value)
+        return instance, position
+
+
+def _get_codec(inner_cls: type) -> _ModelCodec:
+    codec = _codecs.get(inner_cls)
+    if codec is None:
+        codec = _codecs[inner_cls] = _ModelCodec(inner_cls)
+        # Built once it is registered, so the codecs of recursive models reference themselves
+        try:
+            codec.build()
+        except Exception:
+            del _codecs[inner_cls]
+            raise
+    elif codec.encoders is None and codec.encoding is None:
+        codec.encoding = _EncodingModels()
+    return codec
+
+
+def _resolve(attr_type: Any, owner: type) -> Any:
+    if isinstance(attr_type, (str, typing.ForwardRef)):
+        name = attr_type if isinstance(attr_type, str) else attr_type.__forward_arg__
+        resolved = model_registry.lookup(name, owner)
+        if resolved is None:
+            raise NameError('%s is not defined' % name)
+        return resolved
+    return attr_type
+
+
+def _describe(attr_type: Any, seen: set, owner: type = None) -> str:
+    """
+    Describes a type for the fingerprint of the schema of the models holding it. Models are described by their
+    attributes, so the fingerprint changes when the schema of any nested model changes.
+    """
+    if owner is None:
+        owner = attr_type.__pymodelio_parent__
+    attr_type = _resolve(attr_type, owner)
+    if getattr(attr_type, '__is_pymodelio_model__', False):
+        inner_cls = attr_type
+        if inner_cls.__pymodelio_parent__ is None:
+            inner_cls = attr_type._get_inner_model() or PymodelioMeta.prepare(attr_type)
+        if inner_cls in seen:
+            return inner_cls.__qualname__
+        seen.add(inner_cls)
+        parent = inner_cls.__pymodelio_parent__
+        return '%s(%s)' % (inner_cls.__qualname__, ','.join(
+            '%s:%s' % (x, _describe(y.attr_type, seen, parent)) for x, y in inner_cls.__model_attrs__))
+    args = typing.get_args(attr_type)
+    if typing.get_origin(attr_type) is typing.Literal:
+        return repr(attr_type)
+    if args:
+        return '%s[%s]' % (typing.get_origin(attr_type), ','.join(_describe(x, seen, owner) for x in args))
+    return str(attr_type)
+
+
+def _build_codec(attr_type: Any, owner: type) -> Tuple[Encoder, Decoder]:  # noqa: C901
+    attr_type = _resolve(attr_type, owner)
+    if getattr(attr_type, '__is_pymodelio_model__', False):
+        codec = _get_codec(attr_type._get_inner_model() or PymodelioMeta.prepare(attr_type))
+        return codec.encode, codec.decode
+    if attr_type in _SCALAR_CODECS:
+        return _SCALAR_CODECS[attr_type]
+    # Decimals and UUIDs are detected by their modules, so they are not imported for encoding models without them
+    module, name = getattr(attr_type, '__module__', None), getattr(attr_type, '__name__', None)
+    if module == 'decimal' and name == 'Decimal':
+        return _decimal_codec(attr_type)
+    if module == 'uuid' and name == 'UUID':
+        return _uuid_codec(attr_type)
+    if isinstance(attr_type, type) and issubclass(attr_type, Enum):
+        return _enum_codec(attr_type)
+    origin = typing.get_origin(attr_type)
+    args = typing.get_args(attr_type)
+    if origin in _UNION_ORIGINS:
+        variants = [x for x in args if x is not type(None)]
+        models_union = get_models_union(attr_type)
+        if models_union is not None and len(variants) == len(args):
+            return _models_union_codec([_build_codec(x, owner) for x in models_union[0]], models_union[0], owner)
+        if len(variants) == 1:
+            # Optional values held by collections are encoded along with whether they are None
+            return _optional_codec(_build_codec(variants[0], owner))
+        return _ANY_CODEC
+    if origin in (list, set, frozenset) and args:
+        return _sequence_codec(_build_codec(args[0], owner), origin)
+    if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        return _sequence_codec(_build_codec(args[0], owner), tuple)
+    if origin is tuple and args:
+        return _fixed_tuple_codec([_build_codec(x, owner) for x in args])
+    if origin is dict and args:
+        return _dict_codec(_build_codec(args[0], owner), _build_codec(args[1], owner))
+    # The values of Any attributes (and the elements of unparameterized collections) are encoded along with their types
+    container = origin or attr_type
+    if not args and container in (list, tuple, set, frozenset):
+        return _sequence_codec(_ANY_CODEC, container)
+    if not args and container is dict:
+        return _dict_codec(_ANY_CODEC, _ANY_CODEC)
+    if attr_type in (Any, object) or origin is typing.Literal:
+        return _ANY_CODEC
+    raise TypeError('%s is not a supported attribute type for encoding models' % _describe(attr_type, set(), owner))
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7f:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(buffer: memoryview, position: int) -> Tuple[int, int]:
+    byte = buffer[position]
+    if byte < 0x80:
+        return byte, position + 1
+    value = byte & 0x7f
+    shift = 7
+    while True:
+        position += 1
+        byte = buffer[position]
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, position + 1
+        shift += 7
+
+
+def _encode_int(buffer: bytearray, value: int) -> None:
+    # Zigzag encoding, so small negative numbers are encoded in a few bytes too
+    _write_varint(buffer, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def _decode_int(buffer: memoryview, position: int) -> Tuple[int, int]:
+    value, position = _read_varint(buffer, position)
+    return (value >> 1 if not value & 1 else -((value + 1) >> 1)), position
+
+
+def _encode_bool(buffer: bytearray, value: bool) -> None:
+    buffer.append(1 if value else 0)
+
+
+def _decode_bool(buffer: memoryview, position: int) -> Tuple[bool, int]:
+    return buffer[position] != 0, position + 1
+
+
+def _encode_float(buffer: bytearray, value: float) -> None:
+    buffer += _DOUBLE.pack(value)
+
+
+def _decode_float(buffer: memoryview, position: int) -> Tuple[float, int]:
+    return _DOUBLE.unpack_from(buffer, position)[0], position + 8
+
+
+def _encode_bytes(buffer: bytearray, value: bytes) -> None:
+    _write_varint(buffer, len(value))
+    buffer += value
+
+
+def _decode_bytes(buffer: memoryview, position: int) -> Tuple[bytes, int]:
+    size, position = _read_varint(buffer, position)
+    end = position + size
+    if end > len(buffer):
+        raise IndexError('the payload is truncated')
+    return bytes(buffer[position:end]), end
+
+
+def _encode_str(buffer: bytearray, value: str) -> None:
+    _encode_bytes(buffer, value.encode())
+
+
+def _decode_str(buffer: memoryview, position: int) -> Tuple[str, int]:
+    size, position = _read_varint(buffer, position)
+    end = position + size
+    if end > len(buffer):
+        raise IndexError('the payload is truncated')
+    # Decoded from the memoryview, so the bytes are not copied
+    return str(buffer[position:end], 'utf-8'), end
+
+
+def _encode_datetime(buffer: bytearray, value: datetime) -> None:
+    offset = value.utcoffset()
+    # Naive datetimes are flagged with a 0, and aware ones with a 1 followed by their UTC offset in seconds
+    if offset is None:
+        buffer.append(0)
+    else:
+        buffer.append(1)
+        _encode_int(buffer, offset // timedelta(seconds=1))
+    _encode_int(buffer, (value.replace(tzinfo=None) - _EPOCH) // _MICROSECOND)
+
+
+def _decode_datetime(buffer: memoryview, position: int) -> Tuple[datetime, int]:
+    if buffer[position] == 0:
+        micros, position = _decode_int(buffer, position + 1)
+        return _EPOCH + timedelta(microseconds=micros), position
+    offset, position = _decode_int(buffer, position + 1)
+    micros, position = _decode_int(buffer, position)
+    return (_EPOCH + timedelta(microseconds=micros)).replace(tzinfo=timezone(timedelta(seconds=offset))), position
+
+
+def _encode_date(buffer: bytearray, value: date) -> None:
+    _encode_int(buffer, value.toordinal())
+
+
+def _decode_date(buffer: memoryview, position: int) -> Tuple[date, int]:
+    days, position = _decode_int(buffer, position)
+    return date.fromordinal(days), position
+
+
+def _encode_time(buffer: bytearray, value: time) -> None:
+    offset = value.utcoffset()
+    # Flagged like datetimes, as they can be aware too
+    if offset is None:
+        buffer.append(0)
+    else:
+        buffer.append(1)
+        _encode_int(buffer, offset // timedelta(seconds=1))
+    _encode_int(buffer, ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond)
+
+
+def _decode_time(buffer: memoryview, position: int) -> Tuple[time, int]:
+    tzinfo = None
+    if buffer[position] != 0:
+        offset, position = _decode_int(buffer, position + 1)
+        tzinfo = timezone(timedelta(seconds=offset))
+    else:
+        position += 1
+    micros, position = _decode_int(buffer, position)
+    seconds, microsecond = divmod(micros, 1000000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return time(hour, minute, second, microsecond, tzinfo), position
+
+
+def _encode_timedelta(buffer: bytearray, value: timedelta) -> None:
+    _encode_int(buffer, value // _MICROSECOND)
+
+
+def _decode_timedelta(buffer: memoryview, position: int) -> Tuple[timedelta, int]:
+    micros, position = _decode_int(buffer, position)
+    return timedelta(microseconds=micros), position
+
+
+_SCALAR_CODECS = {
+    bool: (_encode_bool, _decode_bool),
+    int: (_encode_int, _decode_int),
+    float: (_encode_float, _decode_float),
+    str: (_encode_str, _decode_str),
+    bytes: (_encode_bytes, _decode_bytes),
+    datetime: (_encode_datetime, _decode_datetime),
+    date: (_encode_date, _decode_date),
+    time: (_encode_time, _decode_time),
+    timedelta: (_encode_timedelta, _decode_timedelta),
+}
+
+
+def _decimal_codec(decimal_type: type) -> Tuple[Encoder, Decoder]:
+    def encode(buffer: bytearray, value: Any) -> None:
+        _encode_str(buffer, str(value))
+
+    def decode(buffer: memoryview, position: int) -> Tuple[Any, int]:
+        value, position = _decode_str(buffer, position)
+        return decimal_type(value), position
+
+    return encode, decode
+
+
+def _uuid_codec(uuid_type: type) -> Tuple[Encoder, Decoder]:
+    def encode(buffer: bytearray, value: Any) -> None:
+        buffer += value.bytes
+
+    def decode(buffer: memoryview, position: int) -> Tuple[Any, int]:
+        end = position + 16
+        if end > len(buffer):
+            raise IndexError('the payload is truncated')
+        return uuid_type(bytes=bytes(buffer[position:end])), end
+
+    return encode, decode
+
+
+def _enum_codec(enum_type: Type[Enum]) -> Tuple[Encoder, Decoder]:
+    # Members are encoded by their values, which are encoded along with their types (like the ones of Any attributes)
+    def encode(buffer: bytearray, value: Any) -> None:
+        _encode_any(buffer, value.value)
+
+    def decode(buffer: memoryview, position: int) -> Tuple[Any, int]:
+        value, position = _decode_any(buffer, position)
+        return enum_type(value), position
+
+    return encode, decode
+
+
+def _optional_codec(codec: Tuple[Encoder, Decoder]) -> Tuple[Encoder, Decoder]:
+    encode_value, decode_value = codec
+
+    def encode(buffer: bytearray, value: Any) -> None:
+        if value is None:
+            buffer.append(0)
+        else:
+            buffer.append(1)
+            encode_value(buffer, value)
+
+    def decode(buffer: memoryview, position: int) -> Tuple[Any, int]:
+        if buffer[position] == 0:
+            return None, position + 1
+        return decode_value(buffer, position + 1)
+
+    return encode, decode
+
+
+def _sequence_codec(codec: Tuple[Encoder, Decoder], container: type) -> Tuple[Encoder, Decoder]:
+    encode_element, decode_element = codec
+
+    def encode(buffer: bytearray, value: Any) -> None:
+        _write_varint(buffer, len(value))
+        for x in value:
+            encode_element(buffer, x)
+
+    def decode(buffer: memoryview, position: int) -> Tuple[Any, int]:
+        size, position = _read_varint(buffer, position)
+        elements = []
+        for _ in range(size):
+            element, position = decode_element(buffer, position)
+            elements.append(element)
+        return (elements if container is list else container(elements)), position
+
+    return encode, decode
+
+
+def _fixed_tuple_codec(codecs: List[Tuple[Encoder, Decoder]]) -> Tuple[Encoder, Decoder]:
+    def encode(buffer: bytearray, value: Any) -> None:
+        if len(value) != len(codecs):
+            raise ValueError('%s is not a tuple of %s elements' % (value, len(codecs)))
+        for (encode_item, _), x in zip(codecs, value):
+            encode_item(buffer, x)
+
+    def decode(buffer: memoryview, position: int) -> Tuple[Any, int]:
+        items = []
+        for _, decode_item in codecs:
+            item, position = decode_item(buffer, position)
+            items.append(item)
+        return tuple(items), position
+
+    return encode, decode
+
+
+def _dict_codec(keys_codec: Tuple[Encoder, Decoder], values_codec: Tuple[Encoder, Decoder]) -> Tuple[Encoder, Decoder]:
+    encode_key, decode_key = keys_codec
+    encode_value, decode_value = values_codec
+
+    def encode(buffer: bytearray, value: Any) -> None:
+        _write_varint(buffer, len(value))
+        for k, v in value.items():
+            encode_key(buffer, k)
+            encode_value(buffer, v)
+
+    def decode(buffer: memoryview, position: int) -> Tuple[Any, int]:
+        size, position = _read_varint(buffer, position)
+        items = {}
+        for _ in range(size):
+            k, position = decode_key(buffer, position)
+            items[k], position = decode_value(buffer, position)
+        return items, position
+
+    return encode, decode
+
+
+def _models_union_codec(codecs: List[Tuple[Encoder, Decoder]], variants: tuple,
+                        owner: type) -> Tuple[Encoder, Decoder]:
+    # Values are prefixed by the index of their variant
+    indexes = {}
+    for i, variant in enumerate(variants):
+        variant = _resolve(variant, owner)
+        indexes[variant._get_inner_model() or PymodelioMeta.prepare(variant)] = i
+
+    def encode(buffer: bytearray, value: Any) -> None:
+        i = indexes.get(type(value))
+        if i is None:
+            raise TypeError('%s is not instance of any variant of the union' % type(value).__name__)
+        _write_varint(buffer, i)
+        codecs[i][0](buffer, value)
+
+    def decode(buffer: memoryview, position: int) -> Tuple[Any, int]:
+        i, position = _read_varint(buffer, position)
+        return codecs[i][1](buffer, position)
+
+    return encode, decode
+
+
+# Tags of the types of the values encoded by the codec of the values of unknown types
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _BYTES, _LIST, _TUPLE, _DICT, _DATETIME, _DATE = range(12)
+
+
+def _encode_any(buffer: bytearray, value: Any) -> None:  # noqa: C901
+    value_type = type(value)
+    if value is None:
+        buffer.append(_NONE)
+    elif value_type is bool:
+        buffer.append(_TRUE if value else _FALSE)
+    elif value_type is int:
+        buffer.append(_INT)
+        _encode_int(buffer, value)
+    elif value_type is float:
+        buffer.append(_FLOAT)
+        _encode_float(buffer, value)
+    elif value_type is str:
+        buffer.append(_STR)
+        _encode_str(buffer, value)
+    elif value_type is bytes:
+        buffer.append(_BYTES)
+        _encode_bytes(buffer, value)
+    elif value_type in (list, tuple):
+        buffer.append(_LIST if value_type is list else _TUPLE)
+        _write_varint(buffer, len(value))
+        for x in value:
+            _encode_any(buffer, x)
+    elif value_type is dict:
+        buffer.append(_DICT)
+        _write_varint(buffer, len(value))
+        for k, v in value.items():
+            _encode_any(buffer, k)
+            _encode_any(buffer, v)
+    elif value_type is datetime:
+        buffer.append(_DATETIME)
+        _encode_datetime(buffer, value)
+    elif value_type is date:
+        buffer.append(_DATE)
+        _encode_date(buffer, value)
+    else:
+        raise TypeError('Values of type %s can\'t be encoded without declaring their type' % value_type.__name__)
+
+
+def _decode_any(buffer: memoryview, position: int) -> Tuple[Any, int]:
+    tag = buffer[position]
+    position += 1
+    if tag <= _TRUE:
+        return (None, False, True)[tag], position
+    if tag in (_LIST, _TUPLE):
+        size, position = _read_varint(buffer, position)
+        elements = []
+        for _ in range(size):
+            element, position = _decode_any(buffer, position)
+            elements.append(element)
+        return (elements if tag == _LIST else tuple(elements)), position
+    if tag == _DICT:
+        size, position = _read_varint(buffer, position)
+        items = {}
+        for _ in range(size):
+            k, position = _decode_any(buffer, position)
+            items[k], position = _decode_any(buffer, position)
+        return items, position
+    decode = _TAGGED_DECODERS.get(tag)
+    if decode is None:
+        raise ValueError('%s is not a valid type tag' % tag)
+    return decode(buffer, position)
+
+
+_TAGGED_DECODERS = {
+    _INT: _decode_int,
+    _FLOAT: _decode_float,
+    _STR: _decode_str,
+    _BYTES: _decode_bytes,
+    _DATETIME: _decode_datetime,
+    _DATE: _decode_date,
+}
+
+_ANY_CODEC = (_encode_any, _decode_any)
@@ -0,0 +1,64 @@
+from datetime import datetime, date
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Type, TypeVar
+
+from pymodelio.model_rows import ModelRows
+from pymodelio.pymodelio_meta import PymodelioMeta, _build_attr_values_getter
+
+T = TypeVar('T')
+
+# NumPy types of the columns of the attributes, by their types. Attributes of any other type (including the optional
+# ones, as None can't be represented by the other types) are stored as objects.
+_NUMPY_TYPES = {
+    bool: '?',
+    int: 'i8',
+    float: 'f8',
+    datetime: 'M8[us]',
+    date: 'M8[D]',
+}
+
+
+class ModelColumns:
+    """
+    Maps models from and to columns (sequences holding the values of an attribute of each model), like the ones of
+    NumPy structured arrays and pandas DataFrames
+    """
+
+    @staticmethod
+    def to_columns(pmcls: type, models: Iterable[Any], columns: Optional[Sequence[str]] = None) -> Dict[str, list]:
+        inner_cls = pmcls._get_inner_model() or PymodelioMeta.prepare(pmcls)
+        if columns is None:
+            columns = ModelRows.get_columns(inner_cls)
+        get_values = _build_attr_values_getter(tuple(columns))
+        # The rows are transposed into columns by zip, in a single pass over the models
+        values = list(zip(*map(get_values, models)))
+        if not values:
+            return {x: [] for x in columns}
+        return {x: list(column_values) for x, column_values in zip(columns, values)}
+
+    @classmethod
+    def from_columns(cls, pmcls: Type[T], columns: Mapping[str, Sequence[Any]], trusted: bool = False) -> List[T]:
+        return ModelRows.from_rows(pmcls, zip(*columns.values()), list(columns), trusted)
+
+    @staticmethod
+    def to_numpy(pmcls: type, models: Iterable[Any], columns: Optional[Sequence[str]] = None) -> Any:
+        numpy = _import_numpy()
+        inner_cls = pmcls._get_inner_model() or PymodelioMeta.prepare(pmcls)
+        if columns is None:
+            columns = ModelRows.get_columns(inner_cls)
+        dtype = [(x, _NUMPY_TYPES.get(ModelRows._get_column_type(inner_cls, x), 'O')) for x in columns]
+        get_values = _build_attr_values_getter(tuple(columns))
+        return numpy.array(list(map(get_values, models)), dtype=dtype)
+
+    @classmethod
+    def from_numpy(cls, pmcls: Type[T], array: Any, trusted: bool = False) -> List[T]:
+        # tolist converts the NumPy values to Python ones (for instance, datetime64 values to datetimes), as the
+        # validators expect them
+        return cls.from_columns(pmcls, {x: array[x].tolist() for x in array.dtype.names}, trusted)
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('numpy is required for exporting models to NumPy arrays, but it is not installed')
+    return numpy
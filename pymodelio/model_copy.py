@@ -0,0 +1,70 @@
+import enum
+import types
+import typing
+from datetime import datetime, date, time, timedelta
+from typing import Any, Tuple
+
+# How the values of each attribute are deep copied
+# The values are immutable, so they are shared by the copies
+SHARE = 0
+# The values are models, which are copied by their __deepcopy__
+MODEL = 1
+# The values are lists, sets or dicts of immutable values, so only the containers are copied
+CONTAINER = 2
+# The values are lists of models
+MODELS_LIST = 3
+# The values are copied by copy.deepcopy
+DEEPCOPY = 4
+
+_IMMUTABLE_BUILTINS = frozenset({str, int, float, bool, complex, bytes, type(None), date, datetime, time, timedelta})
+_IMMUTABLE_BY_NAME = frozenset({('decimal', 'Decimal'), ('uuid', 'UUID')})
+_UNION_ORIGINS = (typing.Union, types.UnionType)
+
+
+def build_deepcopy_plan(model_attrs: dict, attr_names: Tuple[str, ...]) -> Tuple[Tuple[str, int], ...]:
+    """
+    Returns how the values of each attribute of a model are deep copied, by the declared types of the attributes
+    """
+    return tuple((x, _get_copy_kind(model_attrs[x].attr_type)) for x in attr_names)
+
+
+def _get_copy_kind(attr_type: Any) -> int:  # noqa: C901
+    if _is_immutable(attr_type):
+        return SHARE
+    if _is_model(attr_type):
+        return MODEL
+    origin = typing.get_origin(attr_type)
+    args = typing.get_args(attr_type)
+    if origin in _UNION_ORIGINS:
+        variants = [x for x in args if x is not type(None)]
+        # None is immutable, so optional values are copied like the other values of their type
+        if len(variants) == 1:
+            return _get_copy_kind(variants[0])
+        if all(_is_model(x) for x in variants):
+            return MODEL
+        return SHARE if all(_is_immutable(x) for x in variants) else DEEPCOPY
+    if origin is list and args:
+        if _is_model(args[0]):
+            return MODELS_LIST
+        return CONTAINER if _is_immutable(args[0]) else DEEPCOPY
+    if origin in (set, dict) and args and all(_is_immutable(x) for x in args):
+        return CONTAINER
+    return DEEPCOPY
+
+
+def _is_model(attr_type: Any) -> bool:
+    # Forward references always reference models
+    return isinstance(attr_type, (str, typing.ForwardRef)) or getattr(attr_type, '__is_pymodelio_model__', False)
+
+
+def _is_immutable(attr_type: Any) -> bool:
+    if attr_type in _IMMUTABLE_BUILTINS:
+        return True
+    origin = typing.get_origin(attr_type)
+    if origin is typing.Literal:
+        return True
+    if origin in (tuple, frozenset):
+        return all(x is Ellipsis or _is_immutable(x) for x in typing.get_args(attr_type))
+    if not isinstance(attr_type, type):
+        return False
+    return issubclass(attr_type, enum.Enum) or (attr_type.__module__, attr_type.__qualname__) in _IMMUTABLE_BY_NAME
@@ -0,0 +1,181 @@
+import csv
+import os
+from datetime import datetime, date
+from decimal import Decimal
+from itertools import chain
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, Optional, Sequence, Type, TypeVar, Union
+
+from pymodelio import PymodelioSettings, PymodelioSetting
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+from pymodelio.exceptions.validation_error import ValidationError
+from pymodelio.json_columns import build_json_converter, is_json_column
+from pymodelio.model_rows import ModelRows, _unwrap_optional
+from pymodelio.pymodelio_meta import PymodelioMeta
+from pymodelio.utils import get_datetime_converter
+from pymodelio.validation_context import ValidationContext, current_context
+from pymodelio.validation_result import ValidationResult
+
+T = TypeVar('T')
+
+_BOOLEANS = {
+    'true': True, 't': True, 'yes': True, 'y': True, '1': True,
+    'false': False, 'f': False, 'no': False, 'n': False, '0': False,
+}
+
+# Parsers of the values of the scalar columns, by the type of their attributes
+_PARSERS: Dict[type, Callable[[str], Any]] = {
+    int: int,
+    float: float,
+    Decimal: Decimal,
+    bool: lambda x: _BOOLEANS[x.lower()],
+}
+
+
+class ModelCSV:
+    """
+    Streams models from and to CSV files, whose columns are converted by the types of the attributes of the model
+    """
+
+    @classmethod
+    def iter_csv(cls, pmcls: Type[T], file: Union[str, os.PathLike, IO[str]], trusted: bool = False,
+                 collect_errors: bool = False, **fmtparams) -> Iterator[T]:
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, newline='') as f:
+                yield from cls.__iter_models(pmcls, f, trusted, collect_errors, True, fmtparams)
+        else:
+            yield from cls.__iter_models(pmcls, file, trusted, collect_errors, True, fmtparams)
+
+    @classmethod
+    def try_iter_csv(cls, pmcls: Type[T], file: Union[str, os.PathLike, IO[str]], collect_errors: bool = False,
+                     **fmtparams) -> Iterator[ValidationResult]:
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, newline='') as f:
+                yield from cls.__iter_models(pmcls, f, False, collect_errors, False, fmtparams)
+        else:
+            yield from cls.__iter_models(pmcls, file, False, collect_errors, False, fmtparams)
+
+    @classmethod
+    def write_csv(cls, models: Iterable[Any], file: Union[str, os.PathLike, IO[str]],
+                  columns: Optional[Sequence[str]] = None, **fmtparams) -> None:
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, 'w', newline='') as f:
+                cls.__write_models(models, f, columns, fmtparams)
+        else:
+            cls.__write_models(models, file, columns, fmtparams)
+
+    @classmethod
+    def __iter_models(cls, pmcls: Type[T], file: IO[str], trusted: bool, collect_errors: bool,  # noqa: C901
+                      raise_errors: bool, fmtparams: dict) -> Iterator[Union[T, ValidationResult]]:
+        """
+        Yields the models of the rows, or a ValidationResult for each row if raise_errors is False (so the rows after
+        an invalid one are still read)
+        """
+        reader = csv.reader(file, **fmtparams)
+        header = next(reader, None)
+        if header is None:
+            return
+        inner_cls = pmcls._get_inner_model() or PymodelioMeta.prepare(pmcls)
+        # Like from_dict does with unknown keys, unknown columns (and the ones of non-initable attributes) are ignored
+        plan = ModelRows._import_plan(
+            inner_cls, header, cls.__get_converters(inner_cls, trusted), ignore_unknown=True, trusted=trusted)
+        columns_count = len(header)
+        for row in reader:
+            if len(row) != columns_count:
+                # Blank lines are skipped
+                if not row:
+                    continue
+                errors = [ValidationError(
+                    '%s[%s]' % (pmcls.__name__, reader.line_num), (),
+                    'has %s values, but the header has %s columns' % (len(row), columns_count)
+                )]
+                if raise_errors:
+                    raise ModelValidationException(errors=errors)
+                yield ValidationResult(None, errors)
+                continue
+            if trusted:
+                yield ModelRows._assign(inner_cls, plan, row)
+                continue
+            # Untrusted models are initialized like in from_rows, but the errors are reported with the number of the
+            # line of their row
+            with ValidationContext('%s[%s]' % (pmcls.__name__, reader.line_num), collect_errors=collect_errors,
+                                   outer=current_context()) as context:
+                try:
+                    instance = ModelRows._init(inner_cls, plan, row, collect_errors, context)
+                except ModelValidationException as e:
+                    # Raised by the user defined initialization hooks
+                    context.record(e)
+            if raise_errors:
+                context.raise_errors()
+                yield instance
+            else:
+                yield ValidationResult(instance if len(context.errors) == 0 else None, context.errors)
+
+    @staticmethod
+    def __write_models(models: Iterable[Any], file: IO[str], columns: Optional[Sequence[str]],
+                       fmtparams: dict) -> None:
+        models = iter(models)
+        first = next(models, None)
+        if first is None:
+            if columns is not None:
+                csv.writer(file, **fmtparams).writerow(columns)
+            return
+        inner_cls = type(first)
+        if columns is None:
+            columns = ModelRows.get_columns(inner_cls)
+        writer = csv.writer(file, **fmtparams)
+        writer.writerow(columns)
+        writer.writerows(ModelRows._export(
+            chain((first,), models), *ModelRows._export_plan(inner_cls, columns, None)))
+
+    @staticmethod
+    def __get_converters(inner_cls: type, trusted: bool) -> Dict[str, Callable[[str], Any]]:
+        """
+        Returns the converters of the values of the columns of the attributes, by attribute name. Empty values of
+        optional attributes are converted to None, and values that can't be converted are left as they are, so they
+        fail when validated.
+        """
+        to_datetime = get_datetime_converter(
+            PymodelioSettings.get_for_model(PymodelioSetting.AUTO_PARSE_DATES_AS_UTC, inner_cls))
+        converters = {}
+        for attr_name, model_attr in inner_cls.__model_attrs__:
+            # Custom deserializers receive the values as they are
+            if any(x in inner_cls.__deserializers__ for x in inner_cls.__exposed_attrs__.get(attr_name)):
+                continue
+            attr_type = _unwrap_optional(model_attr.attr_type)
+            nullable = attr_type is not model_attr.attr_type
+            if is_json_column(inner_cls, attr_name, attr_type):
+                parse = build_json_converter(inner_cls, attr_name, attr_type, trusted)
+            elif attr_type in (datetime, date):
+                parse = ModelRows._get_converter(attr_type, to_datetime)
+            else:
+                parse = _PARSERS.get(attr_type)
+            if parse is None and not nullable:
+                continue
+            converters[attr_name] = _build_converter(parse, nullable)
+        return converters
+
+
+def _build_converter(parse: Optional[Callable[[str], Any]], nullable: bool) -> Callable[[str], Any]:
+    def convert(value: str) -> Any:
+        if value == '' and nullable:
+            return None
+        if parse is None:
+            return value
+        try:
+            return parse(value)
+        except Exception:
+            return value
+
+    return convert
+
+
+def write_csv(models: Iterable[Any], file: Union[str, os.PathLike, IO[str]], columns: Optional[Sequence[str]] = None,
+              **fmtparams) -> None:
+    """
+    Writes the models (of the same class) to a CSV file (or a path), with a header row followed by a row for each of
+    them. By default, the columns are the ones of to_rows. Dates and datetimes are written in ISO format, nested
+    models and collections as JSON and None as empty values, so the file can be read back by iter_csv. The models are
+    written as they are iterated, so generators of them can be written without holding all of them in memory. The
+    format parameters are the ones of csv.writer.
+    """
+    ModelCSV.write_csv(models, file, columns, **fmtparams)
@@ -1,24 +1,37 @@
 from datetime import datetime, date
-from typing import Any, TypeVar, Type
+from typing import Any, TypeVar, Type, Optional, Callable
 
-from pymodelio import UNDEFINED
+from pymodelio import UNDEFINED, PymodelioSettings, PymodelioSetting
 from pymodelio.attribute import PymodelioAttr
+from pymodelio.converters import build_converter, UnresolvedReferenceError
 from pymodelio.pymodelio_meta import PymodelioMeta
-from pymodelio.utils import to_datetime, to_date
+from pymodelio.unions import UntaggedUnion
+from pymodelio.utils import get_datetime_converter, to_date
+from pymodelio.validation_context import ValidationContext, current_context
 
 T = TypeVar('T')
 
 
 class ModelDeserializer:
-    __GENERIC_ALIASES = {'_GenericAlias', '_UnionGenericAlias'}
-
     @classmethod
-    def deserialize(cls, pmcls: Type[T], data: dict, auto_validate: bool) -> T:
+    def deserialize(cls, pmcls: Type[T], data: dict, auto_validate: bool,  # noqa: C901
+                    collect_errors: bool = False, validation_context: Optional[ValidationContext] = None,
+                    trusted: bool = False) -> T:
         inner_cls = pmcls._get_inner_model()
         if inner_cls is None:
             # Generates the inner class
             PymodelioMeta.prepare(pmcls)
             inner_cls = pmcls._get_inner_model()
+        # Resolved once per call, so that values are converted without looking up the settings
+        to_datetime = get_datetime_converter(
+            PymodelioSettings.get_for_model(PymodelioSetting.AUTO_PARSE_DATES_AS_UTC, inner_cls))
+        unions = inner_cls.__unions__
+        if unions and auto_validate and not trusted and validation_context is None and current_context() is None and \
+                any(isinstance(x, UntaggedUnion) for x in unions.values()):
+            # Untagged unions validate the candidates of their payloads, so the model is deserialized within the
+            # validation pass it gets validated in, where the chosen candidates are already marked as validated
+            with ValidationContext(pmcls.__name__, collect_errors=collect_errors):
+                return cls.deserialize(pmcls, data, auto_validate, collect_errors, validation_context, trusted)
         attrs = {}
         for attr_name, model_attr in inner_cls.__model_attrs__:
             if model_attr.initable:
@@ -35,38 +48,39 @@ class ModelDeserializer:
                     else:
                         if exposed_attr_name in data:
                             exposed_attr_name_to_use = exposed_attr_name
-                            attr_value = cls.__map_attribute(data, exposed_attr_name, model_attr)
+                            if unions and attr_name in unions:
+                                attr_value = unions[attr_name].deserialize(data[exposed_attr_name], trusted)
+                            else:
+                                attr_value = cls.__map_attribute(data, exposed_attr_name, model_attr, to_datetime,
+                                                                 pmcls, trusted)
                             break
-                if attr_value == UNDEFINED:
+                if trusted:
+                    # Trusted models are constructed from the attribute names, applying the defaults themselves
+                    if attr_value is not UNDEFINED:
+                        attrs[attr_name] = attr_value
+                elif attr_value == UNDEFINED:
                     attrs[exposed_attr_name_to_use] = model_attr.default_factory()
                 else:
                     attrs[exposed_attr_name_to_use] = attr_value
-        return inner_cls(**attrs, auto_validate=auto_validate)
+        if trusted:
+            return inner_cls._construct(attrs)
+        if validation_context is not None:
+            return inner_cls._init_in_context(attrs, validation_context)
+        return inner_cls(**attrs, auto_validate=auto_validate, collect_errors=collect_errors)
 
     @classmethod
-    def __map_attribute(cls, data: dict, exposed_attr_name: str, model_attr: PymodelioAttr) -> Any:  # noqa: C901
+    def __map_attribute(cls, data: dict, exposed_attr_name: str, model_attr: PymodelioAttr,
+                        to_datetime: Callable[[str], datetime], pmcls: type, trusted: bool) -> Any:
         attr_value = data[exposed_attr_name]
         # Pymodelio models
         if isinstance(attr_value, dict) and getattr(model_attr.attr_type, '__is_pymodelio_model__', False):
-            return model_attr.attr_type.from_dict(attr_value, auto_validate=False)
-        # Lists
-        if isinstance(attr_value, list):
-            if model_attr.attr_type == list or len(model_attr.attr_type.__args__) == 0:
-                list_type = None
-            else:
-                list_type = model_attr.attr_type.__args__[0]
-            # If the type of the list is not specified. For instance -> a: List
-            if list_type is None:
-                return attr_value
-            # If the type is more than one. For instance -> a: List[Union[int, float]]
-            if list_type.__class__.__name__ in cls.__GENERIC_ALIASES:
-                print('WARNING: pymodelio automatic deserialization does not handle multi typed lists of models')
-                return attr_value
-            # If the type is not a model
-            if not getattr(list_type, '__is_pymodelio_model__', False):
-                return attr_value
-            # At this point, the list is a list of models
-            return [list_type.from_dict(x, auto_validate=False) for x in attr_value]
+            return model_attr.attr_type.from_dict(attr_value, auto_validate=False, trusted=trusted)
+        # Containers, which may hold models at any level (for instance, Dict[str, List[Model]])
+        if isinstance(attr_value, (list, dict, tuple)):
+            converter = model_attr.converter
+            if converter is UNDEFINED:
+                converter = cls.__build_converter(model_attr, pmcls)
+            return attr_value if converter is None else converter(attr_value, trusted)
         # Parse datetimes
         if model_attr.attr_type == datetime and isinstance(attr_value, str):
             try:
@@ -80,3 +94,12 @@ class ModelDeserializer:
             except Exception:
                 return attr_value
         return attr_value
+
+    @staticmethod
+    def __build_converter(model_attr: PymodelioAttr, pmcls: type) -> Optional[Callable[[Any], Any]]:
+        try:
+            model_attr.converter = build_converter(model_attr.attr_type, pmcls)
+        except UnresolvedReferenceError:
+            # Built again once the referenced model gets defined
+            return None
+        return model_attr.converter
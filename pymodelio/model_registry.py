@@ -0,0 +1,78 @@
+import sys
+from typing import Dict, List, Optional, Tuple
+from weakref import WeakSet, WeakValueDictionary
+
+from pymodelio.attribute import PymodelioAttr
+
+# Defined models by (module, qualname)
+_models: 'WeakValueDictionary[Tuple[str, str], type]' = WeakValueDictionary()
+# Defined models by name, for resolving references to them from outside of their modules
+_models_by_name: Dict[str, WeakSet] = {}
+# Unresolved forward reference validators, by the last name of the reference
+_pending: Dict[str, WeakSet] = {}
+# Incremented whenever a model is defined, so unresolved references are only looked up again after that
+version = 0
+
+
+def register(pmcls: type) -> None:
+    """
+    Registers a model when it gets defined, binding its forward references to it and resolving the pending ones that
+    may reference it
+    """
+    global version
+    version += 1
+    _models[(pmcls.__module__, pmcls.__qualname__)] = pmcls
+    _models_by_name.setdefault(pmcls.__name__, WeakSet()).add(pmcls)
+    for model_attr in pmcls.__dict__.get('__annotations__', {}).values():
+        if isinstance(model_attr, PymodelioAttr) and hasattr(model_attr.validator, '_bind'):
+            model_attr.validator._bind(pmcls, model_attr)
+    pending = _pending.get(pmcls.__name__)
+    if pending:
+        for validator in list(pending):
+            validator._resolve()
+
+
+def add_pending(validator: object, ref_name: str) -> None:
+    _pending.setdefault(ref_name.rsplit('.', 1)[-1], WeakSet()).add(validator)
+
+
+def remove_pending(validator: object, ref_name: str) -> None:
+    pending = _pending.get(ref_name.rsplit('.', 1)[-1])
+    if pending is not None:
+        pending.discard(validator)
+
+
+def lookup(ref_name: str, owner: Optional[type]) -> Optional[type]:
+    """
+    Returns the type a forward reference made from the owner model refers to. Like Python does, it is looked up in
+    the scopes enclosing the owner and then in its module. References that can't be found that way are resolved to
+    the only model defined with that name (if there is only one).
+    """
+    if owner is not None:
+        scopes = owner.__qualname__.split('.')
+        for i in reversed(range(len(scopes))):
+            model = _models.get((owner.__module__, '.'.join(scopes[:i] + [ref_name])))
+            if model is not None:
+                return model
+        module = sys.modules.get(owner.__module__)
+        if module is not None:
+            try:
+                evaluated = eval(ref_name, vars(module))
+            except Exception:
+                evaluated = None
+            if isinstance(evaluated, type):
+                return evaluated
+    candidates = _models_by_name.get(ref_name)
+    if candidates is not None and len(candidates) == 1:
+        return next(iter(candidates))
+    return None
+
+
+def resolve_refs() -> List[str]:
+    """
+    Resolves all the pending forward references, returning the ones that could not be resolved
+    """
+    for pending in list(_pending.values()):
+        for validator in list(pending):
+            validator._resolve()
+    return sorted(validator.describe() for pending in _pending.values() for validator in pending)
@@ -0,0 +1,271 @@
+import types
+import typing
+from datetime import datetime, date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+from pymodelio import PymodelioSettings, PymodelioSetting
+from pymodelio.pymodelio_meta import PymodelioMeta, _build_attr_values_getter, _overrides_model_method
+from pymodelio.utils import get_datetime_converter, to_date
+from pymodelio.validation_context import ValidationContext
+
+T = TypeVar('T')
+
+_new = object.__new__
+
+_UNION_ORIGINS = (typing.Union, types.UnionType)
+
+# (attribute name, column position, value converter) of the mapped columns, (attribute name, default factory) of the
+# attributes without a column and, for untrusted models overriding __before_init__ (which is called with the values
+# the model is initialized with), the names of the mapped columns
+_RowsPlan = Tuple[List[Tuple[str, int, Optional[Callable[[Any], Any]]]], List[Tuple[str, Callable[[], Any]]],
+                  Optional[Tuple[str, ...]]]
+
+# Adapters of the values of the exported columns, by the type of their attributes. Like when serializing models, dates
+# and datetimes are exported in ISO format.
+DEFAULT_ADAPTERS: Dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+}
+
+
+class ModelRows:
+    """
+    Maps models from and to rows (sequences of values in a fixed column order, like the ones fetched from DB-API
+    cursors)
+    """
+
+    @classmethod
+    def to_rows(cls, pmcls: type, models: Iterable[Any], columns: Optional[Sequence[str]] = None,
+                adapters: Optional[Dict[type, Callable[[Any], Any]]] = None,
+                chunk_size: Optional[int] = None) -> Iterator[Union[tuple, List[tuple]]]:
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('chunk_size must be greater than 0, but %s was provided' % chunk_size)
+        inner_cls = pmcls._get_inner_model() or PymodelioMeta.prepare(pmcls)
+        if columns is None:
+            columns = cls.get_columns(inner_cls)
+        get_values, adapted_columns = cls._export_plan(inner_cls, columns, adapters)
+        rows = cls._export(models, get_values, adapted_columns)
+        if chunk_size is None:
+            return rows
+        return cls.__chunk(rows, chunk_size)
+
+    @staticmethod
+    def get_columns(inner_cls: type) -> List[str]:
+        # Serializable attributes are collected from a set, so they are sorted for the columns to keep their order
+        serializable_attrs = set(inner_cls.__serializable_attrs__)
+        columns = [x for x, _ in inner_cls.__model_attrs__ if x in serializable_attrs]
+        return columns + sorted(serializable_attrs.difference(columns))
+
+    @staticmethod
+    def _export(models: Iterable[Any], get_values: Callable[[Any], tuple],
+                 adapted_columns: List[Tuple[int, Callable[[Any], Any]]]) -> Iterator[tuple]:
+        if not adapted_columns:
+            for model in models:
+                yield get_values(model)
+            return
+        for model in models:
+            row = list(get_values(model))
+            for position, adapt in adapted_columns:
+                value = row[position]
+                if value is not None:
+                    row[position] = adapt(value)
+            yield tuple(row)
+
+    @staticmethod
+    def __chunk(rows: Iterator[tuple], chunk_size: int) -> Iterator[List[tuple]]:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @classmethod
+    def _export_plan(cls, inner_cls: type, columns: Sequence[str],
+                     adapters: Optional[Dict[type, Callable[[Any], Any]]],
+                     column_adapters: Optional[Dict[str, Callable[[Any], Any]]] = None
+                     ) -> Tuple[Callable[[Any], tuple], List[Tuple[int, Callable[[Any], Any]]]]:
+        """
+        Returns the getter of the values of the columns, and the adapter of each column whose type has one (columns
+        holding nested models or collections are adapted to JSON by default). Adapters can also be provided by column,
+        taking precedence over the ones of their types.
+        """
+        # Imported here, as the json support is not needed by most of the models
+        from pymodelio.json_columns import to_json, is_json_column
+        if adapters is None:
+            adapters = DEFAULT_ADAPTERS
+        else:
+            adapters = {**DEFAULT_ADAPTERS, **adapters}
+        adapted_columns = []
+        for position, column in enumerate(columns):
+            attr_type = cls._get_column_type(inner_cls, column)
+            adapt = column_adapters.get(column) if column_adapters is not None else None
+            if adapt is None:
+                attr_type = _unwrap_optional(attr_type)
+                adapt = _get_adapter(attr_type, adapters)
+                # Nested models and collections can't be bound as parameters, so they are exported as JSON
+                if adapt is None and is_json_column(inner_cls, column, attr_type):
+                    adapt = to_json
+            if adapt is not None:
+                adapted_columns.append((position, adapt))
+        return _build_attr_values_getter(tuple(columns)), adapted_columns
+
+    @staticmethod
+    def _get_column_type(inner_cls: type, column: str) -> Any:
+        """
+        Returns the type of an exported column, which is the type of the attribute it is named after, or the type the
+        property it is named after is annotated to return (if any)
+        """
+        for attr_name, model_attr in inner_cls.__model_attrs__:
+            if attr_name == column:
+                return model_attr.attr_type
+        if column in inner_cls.__serializable_attrs__:
+            fget = getattr(getattr(inner_cls, column, None), 'fget', None)
+            return getattr(fget, '__annotations__', {}).get('return')
+        raise NameError('%s is not an attribute of class %s' % (column, inner_cls.__name__))
+
+    @classmethod
+    def from_rows(cls, pmcls: Type[T], rows: Iterable[Sequence[Any]], columns: Sequence[str],
+                  trusted: bool = False) -> List[T]:
+        inner_cls = pmcls._get_inner_model() or PymodelioMeta.prepare(pmcls)
+        return cls._build(inner_cls, cls._import_plan(inner_cls, columns, trusted=trusted), rows, trusted)
+
+    @classmethod
+    def from_cursor(cls, pmcls: Type[T], cursor: Any, batch_size: int = 1000, trusted: bool = False) -> Iterator[T]:
+        inner_cls = pmcls._get_inner_model() or PymodelioMeta.prepare(pmcls)
+        plan = cls._import_plan(inner_cls, [x[0] for x in cursor.description], trusted=trusted)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from inner_cls._from_cursor_batch(plan, rows, trusted)
+
+    @classmethod
+    def _build(cls, inner_cls: type, plan: _RowsPlan, rows: Iterable[Sequence[Any]], trusted: bool) -> List[Any]:
+        if trusted:
+            return [cls._assign(inner_cls, plan, row) for row in rows]
+        # Untrusted models are initialized like from_dict does, so the initialization hooks run too
+        return [cls._init(inner_cls, plan, row, False, None) for row in rows]
+
+    @staticmethod
+    def _assign(inner_cls: type, plan: _RowsPlan, row: Sequence[Any]) -> Any:
+        """
+        Constructs a model from a row, assigning its values by position
+        """
+        mapped_attrs, missing_attrs, _ = plan
+        instance = _new(inner_cls)
+        for attr_name, position, convert in mapped_attrs:
+            value = row[position]
+            setattr(instance, attr_name, value if convert is None else convert(value))
+        for attr_name, default_factory in missing_attrs:
+            setattr(instance, attr_name, default_factory())
+        return instance
+
+    @classmethod
+    def _init(cls, inner_cls: type, plan: _RowsPlan, row: Sequence[Any], collect_errors: bool,
+              context: Optional[ValidationContext]) -> Any:
+        """
+        Initializes a model from a row like __init__ does, validating it in the context (if any). The values are
+        assigned by position, unless the model overrides __before_init__, which needs the values to initialize it with.
+        """
+        mapped_attrs, _, init_names = plan
+        if init_names is not None:
+            kwargs = {
+                name: row[position] if convert is None else convert(row[position])
+                for name, (_, position, convert) in zip(init_names, mapped_attrs)
+            }
+            if context is None:
+                return inner_cls(collect_errors=collect_errors, **kwargs)
+            return inner_cls._init_in_context(kwargs, context)
+        return inner_cls._init_row(plan, row, collect_errors, context)
+
+    @classmethod
+    def _import_plan(cls, inner_cls: type, columns: Sequence[str],  # noqa: C901
+                     converters: Optional[Dict[str, Callable[[Any], Any]]] = None,
+                     ignore_unknown: bool = False, trusted: bool = False) -> _RowsPlan:
+        """
+        Maps the columns to the attributes of the model, and chooses the converter of each of them. Converters can be
+        provided by attribute name, taking precedence over the chosen ones. Unknown columns raise NameError, unless
+        ignore_unknown is True.
+        Untrusted models are initialized from their exposed names, so only the columns of initable attributes are
+        accepted (the ones of non-initable attributes raise NameError, like when initializing the model, or are
+        ignored along with the unknown ones).
+        Trusted models are constructed from their attribute names, so the columns can be named after them too.
+        """
+        attr_names = {}
+        non_initable_attr_names = {}
+        for attr_name, model_attr in inner_cls.__model_attrs__:
+            exposed_attr_names = inner_cls.__exposed_attrs__.get(attr_name)
+            if model_attr.initable:
+                attr_names.update(dict.fromkeys(exposed_attr_names, attr_name))
+            elif not trusted:
+                non_initable_attr_names.update(dict.fromkeys(exposed_attr_names, attr_name))
+            if trusted:
+                attr_names[attr_name] = attr_name
+        model_attrs = dict(inner_cls.__model_attrs__)
+        to_datetime = get_datetime_converter(
+            PymodelioSettings.get_for_model(PymodelioSetting.AUTO_PARSE_DATES_AS_UTC, inner_cls))
+        mapped_attrs = []
+        mapped_names = set()
+        for position, column in enumerate(columns):
+            attr_name = attr_names.get(column)
+            if attr_name is None:
+                if ignore_unknown:
+                    continue
+                if column in non_initable_attr_names:
+                    raise NameError('%s attribute is not initable for class %s' % (
+                        non_initable_attr_names[column], inner_cls.__name__))
+                raise NameError('%s is not an attribute of class %s' % (column, inner_cls.__name__))
+            deserializer = converters.get(attr_name) if converters is not None else None
+            if deserializer is None:
+                deserializer = inner_cls.__deserializers__.get(column)
+            if deserializer is None:
+                deserializer = cls._get_converter(model_attrs[attr_name].attr_type, to_datetime)
+            mapped_attrs.append((attr_name, position, deserializer))
+            mapped_names.add(attr_name)
+        missing_attrs = [(k, v) for k, v in inner_cls.__construct_plan__ if k not in mapped_names]
+        init_names = None
+        if not trusted and _overrides_model_method(inner_cls, '__before_init__'):
+            init_names = tuple(columns[x[1]] for x in mapped_attrs)
+        return mapped_attrs, missing_attrs, init_names
+
+    @staticmethod
+    def _get_converter(attr_type: Any, to_datetime: Callable[[str], datetime]) -> Optional[Callable[[Any], Any]]:
+        # Nullable columns are common, so optional dates are parsed too
+        attr_type = _unwrap_optional(attr_type)
+        if attr_type == datetime:
+            parse = to_datetime
+        elif attr_type == date:
+            parse = to_date
+        else:
+            return None
+
+        # Like when deserializing dicts, values that can't be parsed are left as they are, so they fail when validated
+        def convert(value: Any) -> Any:
+            if not isinstance(value, str):
+                return value
+            try:
+                return parse(value)
+            except Exception:
+                return value
+
+        return convert
+
+
+def _unwrap_optional(attr_type: Any) -> Any:
+    args = typing.get_args(attr_type)
+    if typing.get_origin(attr_type) in _UNION_ORIGINS and len(args) == 2 and type(None) in args:
+        return args[0] if args[1] is type(None) else args[1]
+    return attr_type
+
+
+def _get_adapter(attr_type: Any, adapters: Dict[type, Callable[[Any], Any]]) -> Optional[Callable[[Any], Any]]:
+    # The adapter of the closest parent is used, so adapters registered for a class apply to its subclasses (and the
+    # ones registered for containers apply to their generic aliases, like List[int] for list)
+    for parent in getattr(typing.get_origin(attr_type) or attr_type, '__mro__', ()):
+        adapt = adapters.get(parent)
+        if adapt is not None:
+            return adapt
+    return None
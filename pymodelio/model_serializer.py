@@ -10,6 +10,8 @@ class ModelSerializer:
             return cls._serialize_model(value)
         if isinstance(value, (list, tuple, set)):
             return [cls.serialize(x) for x in value]
+        if isinstance(value, dict):
+            return {k: cls.serialize(x) for k, x in value.items()}
         if isinstance(value, datetime):
             return value.isoformat()
         if isinstance(value, date):
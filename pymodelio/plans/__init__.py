@@ -0,0 +1,3 @@
+# flake8: noqa
+from .model_plan import ModelPlan
+from .plan_cache import compile_module, model_sources, plans_path, cache_dir, flush, clear
@@ -0,0 +1,9 @@
+from collections import namedtuple
+
+# Result of analysing the schema of a model, from which its inner class is generated. It only holds literals, so it
+# can be written to a Python module. Custom deserializers are referenced by the name of the method implementing them.
+# The fingerprint identifies the attributes (their types, aliases and validators) the plan was built for.
+ModelPlan = namedtuple('ModelPlan', (
+    'fingerprint', 'attr_names', 'serializable_attrs', 'exposed_attrs', 'protected_attrs', 'private_attrs',
+    'deserializers', 'validates_attrs_with_hook', 'overrides_validate'
+))
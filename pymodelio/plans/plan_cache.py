@@ -0,0 +1,276 @@
+import atexit
+import marshal
+import os
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Optional, Tuple, get_origin
+from zlib import crc32
+
+from pymodelio.plans.model_plan import ModelPlan
+from pymodelio.settings.pymodelio_setting import PymodelioSetting
+from pymodelio.settings.pymodelio_settings import PymodelioSettings
+
+# Modification time (in nanoseconds) and size of a source file
+SourceKey = Tuple[int, int]
+
+# Bumped when the plans (or the way they are generated) change, so that the compiled plans get invalidated
+PLAN_FORMAT = 4
+
+# Directory, inside the cache directory of the user, where the compiled plans are stored by default
+CACHE_DIR_NAME = 'pymodelio'
+
+# Suffix of the files of the compiled plans, which are named after the modules of their models
+PLANS_SUFFIX = '.plans'
+
+# Compiled plans by module name, as {model qualname: plan}
+_module_plans: Dict[str, Dict[str, ModelPlan]] = {}
+# Keys of the sources the compiled plans of each module depend on, by module name
+_module_sources: Dict[str, Dict[str, SourceKey]] = {}
+# Plans to be written when the interpreter exits, by module name
+_pending_plans: Dict[str, Dict[str, ModelPlan]] = {}
+# Keys of the source files of the modules, by module name
+_source_keys: Dict[str, Optional[SourceKey]] = {}
+
+
+def get_plan(pmcls: type, model_attrs: dict, build: Callable[[type, dict], ModelPlan]) -> ModelPlan:
+    """
+    Returns the compiled plan of the model if the sources of its module (and of the modules of the classes it
+    inherits from) did not change since it was compiled. Otherwise, the plan is built (and compiled when the
+    interpreter exits, if the AUTO_COMPILE_PLANS setting is enabled).
+    """
+    if not PymodelioSettings.get(PymodelioSetting.USE_COMPILED_PLANS) or '<locals>' in pmcls.__qualname__:
+        return build(pmcls, model_attrs)
+    # The compiled plans are validated once per module, so each model only looks its plan up
+    plan = _get_module_plans(pmcls.__module__).get(pmcls.__qualname__)
+    if plan is not None and plan.fingerprint == schema_fingerprint(model_attrs):
+        return plan
+    plan = build(pmcls, model_attrs)
+    if PymodelioSettings.get(PymodelioSetting.AUTO_COMPILE_PLANS):
+        _schedule_write(pmcls, plan)
+    return plan
+
+
+def schema_fingerprint(model_attrs: dict) -> int:
+    """
+    Returns the fingerprint of the attributes of a model: their names, types, aliases and the settings of their
+    validators. A compiled plan is only used if the fingerprint of the model still matches the one it was built for.
+    """
+    return crc32(';'.join('%s:%s' % (name, _describe_attr(attr)) for name, attr in model_attrs.items()).encode())
+
+
+def _describe_attr(attr: Any) -> str:
+    return '%s,%s,%s,%s,%s,%s' % (_describe(attr.attr_type), attr.initable, attr.init_aliases, attr.compare,
+                                  attr.discriminator, _describe(attr.validator))
+
+
+def _describe(value: Any) -> str:
+    # Validators are described by their public attributes (the private ones are caches filled while validating)
+    # and functions and classes by their names, so the descriptions don't depend on memory addresses
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_describe(x) for x in value]
+        return '(%s)' % ','.join(sorted(items) if isinstance(value, (set, frozenset)) else items)
+    if isinstance(value, dict):
+        return '{%s}' % ','.join(sorted('%s:%s' % (_describe(k), _describe(v)) for k, v in value.items()))
+    if get_origin(value) is not None:
+        return repr(value)
+    if isinstance(value, type) or callable(value) and hasattr(value, '__qualname__'):
+        return '%s.%s' % (getattr(value, '__module__', ''), value.__qualname__)
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return repr(value)
+    settings = _public_attrs(value)
+    if settings is None:
+        # Values without attributes (like typing constructs or patterns) are described by their representations
+        return repr(getattr(value, 'pattern', value))
+    return '%s(%s)' % (type(value).__qualname__, ','.join('%s=%s' % (k, _describe(v)) for k, v in settings))
+
+
+def _public_attrs(value: Any) -> Optional[List[Tuple[str, Any]]]:
+    names = [x for cls in type(value).__mro__ for x in getattr(cls, '__slots__', ())]
+    names.extend(getattr(value, '__dict__', ()))
+    if len(names) == 0:
+        return None
+    return [(x, getattr(value, x, None)) for x in sorted(set(names)) if not x.startswith('_')]
+
+
+def model_sources(pmcls: type) -> Optional[Dict[str, SourceKey]]:
+    """
+    Returns the keys of the sources the plan of the model depends on (the ones of the modules of the classes it
+    inherits from), by module name. Models without a source file (or defined inside functions) can't be compiled.
+    """
+    if '<locals>' in pmcls.__qualname__:
+        return None
+    sources = {}
+    for cls in pmcls.__mro__[:-1]:
+        key = _source_key(cls.__module__)
+        if key is None:
+            return None
+        sources[cls.__module__] = key
+    return sources
+
+
+def _source_path(module_name: str) -> Optional[str]:
+    path = getattr(sys.modules.get(module_name), '__file__', None)
+    return path if path is not None and path.endswith('.py') else None
+
+
+def _source_key(module_name: str) -> Optional[SourceKey]:
+    # Sources are identified by their modification time and size, which are read once per module
+    if module_name in _source_keys:
+        return _source_keys[module_name]
+    path = _source_path(module_name)
+    key = None
+    if path is not None:
+        try:
+            stat = os.stat(path)
+            key = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass
+    _source_keys[module_name] = key
+    return key
+
+
+def plans_path(module_name: str) -> Optional[str]:
+    """
+    Returns the path of the compiled plans of the models of a module. Like the bytecode written with
+    sys.pycache_prefix, they are stored in a tree mirroring the one of the sources, inside the directory of the
+    PLANS_CACHE_DIR setting (the pymodelio directory of the cache directory of the user, by default), so nothing is
+    written next to the sources.
+    """
+    path = _source_path(module_name)
+    if path is None:
+        return None
+    source_dir = os.path.splitdrive(os.path.dirname(os.path.abspath(path)))[1].lstrip(os.sep)
+    return os.path.join(cache_dir(), source_dir, os.path.splitext(os.path.basename(path))[0] + PLANS_SUFFIX)
+
+
+def cache_dir() -> str:
+    """
+    Returns the directory where the compiled plans are stored
+    """
+    path = PymodelioSettings.get(PymodelioSetting.PLANS_CACHE_DIR)
+    if path:
+        return path
+    return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                        CACHE_DIR_NAME)
+
+
+def _get_module_plans(module_name: str) -> Dict[str, ModelPlan]:
+    plans = _module_plans.get(module_name)
+    if plans is None:
+        plans, sources = _load_plans(module_name)
+        _module_plans[module_name] = plans
+        _module_sources[module_name] = sources
+    return plans
+
+
+def _load_plans(module_name: str) -> Tuple[Dict[str, ModelPlan], Dict[str, SourceKey]]:
+    path = plans_path(module_name)
+    if path is None or not os.path.isfile(path):
+        return {}, {}
+    try:
+        with open(path, 'rb') as f:
+            header, sources, plans = marshal.load(f)
+        if header != _header():
+            return {}, {}
+        # The plans are discarded if any of the sources they were compiled from changed
+        if any(_source_key(name) != key for name, key in sources.items()):
+            return {}, {}
+        return {qualname: ModelPlan(*plan) for qualname, plan in plans.items()}, sources
+    except Exception:
+        # A corrupted cache is ignored, the plans are built again
+        return {}, {}
+
+
+def _header() -> Tuple[int, bytes]:
+    # The marshal format depends on the version of Python, so the plans are only loaded by the one that wrote them
+    from importlib.util import MAGIC_NUMBER
+    return PLAN_FORMAT, MAGIC_NUMBER
+
+
+def _schedule_write(pmcls: type, plan: ModelPlan) -> None:
+    sources = model_sources(pmcls)
+    if sources is None:
+        return
+    if len(_pending_plans) == 0:
+        atexit.register(flush)
+    _pending_plans.setdefault(pmcls.__module__, {})[pmcls.__qualname__] = plan
+    _get_module_plans(pmcls.__module__)
+    _module_sources[pmcls.__module__].update(sources)
+
+
+def flush() -> None:
+    """
+    Writes the plans built since the last flush, if the AUTO_COMPILE_PLANS setting is enabled. It is called when the
+    interpreter exits. Modules whose plans can not be written (for instance, in read-only directories) are skipped.
+    """
+    while _pending_plans:
+        module_name, pending = _pending_plans.popitem()
+        plans = {**_get_module_plans(module_name), **pending}
+        try:
+            write_plans(module_name, plans, _module_sources[module_name])
+        except OSError:
+            continue
+        _module_plans[module_name] = plans
+    atexit.unregister(flush)
+
+
+def write_plans(module_name: str, plans: Dict[str, ModelPlan], sources: Dict[str, SourceKey]) -> str:
+    """
+    Writes the plans of the models of a module, along with the keys of the sources they depend on, returning its
+    path. As the plans only hold literals, they are written with marshal, so they are loaded without being compiled
+    (even if Python doesn't cache bytecode).
+    """
+    path = plans_path(module_name)
+    if path is None:
+        raise ValueError('%s does not have a source file to compile its models from' % module_name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = '%s.%s.tmp' % (path, os.getpid())
+    with open(tmp_path, 'wb') as f:
+        marshal.dump((_header(), sources, {qualname: tuple(plan) for qualname, plan in plans.items()}), f)
+    os.replace(tmp_path, path)
+    return path
+
+
+def compile_module(module_name: str) -> Tuple[Optional[str], List[str]]:
+    """
+    Compiles the plans of the models defined in a module, returning the path of the compiled plans and the qualnames
+    of the compiled models. Nothing is written for modules that don't define models.
+    """
+    # Imported here, as the models module depends on this one
+    from pymodelio.pymodelio_meta import PymodelioMeta
+    from pymodelio.pymodelio_model import PymodelioModel
+
+    module = import_module(module_name)
+    plans = {}
+    sources = {}
+    for pmcls in _subclasses(PymodelioModel):
+        if pmcls.__module__ != module.__name__ or pmcls.__is_pymodelio_inner_model__:
+            continue
+        model_sources_keys = model_sources(pmcls)
+        if model_sources_keys is not None:
+            plans[pmcls.__qualname__] = PymodelioMeta.build_plan(pmcls, PymodelioMeta.get_model_attrs(pmcls))
+            sources.update(model_sources_keys)
+    if len(plans) == 0:
+        return None, []
+    path = write_plans(module.__name__, plans, sources)
+    _module_plans[module.__name__] = plans
+    _module_sources[module.__name__] = sources
+    return path, sorted(plans)
+
+
+def _subclasses(cls: type) -> List[type]:
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(_subclasses(subclass))
+    return subclasses
+
+
+def clear() -> None:
+    """
+    Forgets the loaded and pending plans
+    """
+    _module_plans.clear()
+    _module_sources.clear()
+    _pending_plans.clear()
+    _source_keys.clear()
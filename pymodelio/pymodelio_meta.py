@@ -1,7 +1,18 @@
-from typing import List, Optional, Tuple, Set
+from operator import attrgetter
+from typing import List, Optional, Tuple, Callable
 
-from pymodelio import shared_vars
+from pymodelio import shared_vars, model_registry
 from pymodelio.attribute import PymodelioAttr
+from pymodelio.model_copy import build_deepcopy_plan
+from pymodelio.plans import plan_cache
+from pymodelio.plans.model_plan import ModelPlan
+from pymodelio.settings.pymodelio_setting import PymodelioSetting
+from pymodelio.unions import build_unions
+
+# Slots of the validation bookkeeping of the models (see PymodelioModel.validate), named as they are mangled in it
+BOOKKEEPING_SLOTS = (
+    '_PymodelioModel__validated_epoch', '_PymodelioModel__validated_values', '_PymodelioModel__used_policies'
+)
 
 
 def _get_annotations(cls: type) -> dict:
@@ -22,11 +33,15 @@ def _get_model_attrs(cls: type) -> dict:
     return validated_attrs
 
 
-def _get_serializable_attr_names(cls: type, attr_names: Set[str]) -> List[str]:
+def _get_serializable_attr_names(cls: type, cls_dir: List[str], attr_names: Tuple[str, ...]) -> List[str]:
     serializable_attr_names = []
-    for attr_name in attr_names:
-        if not attr_name.startswith('_') and not _is_marked_as_do_not_serialize(cls, attr_name):
-            serializable_attr_names.append(attr_name)
+    for attr_name in set(cls_dir).union(attr_names):
+        if attr_name.startswith('_') or _is_marked_as_do_not_serialize(cls, attr_name):
+            continue
+        # Methods (and any other callable of the class) are not serialized, so they are filtered out once, here
+        if attr_name not in attr_names and callable(getattr(cls, attr_name, None)):
+            continue
+        serializable_attr_names.append(attr_name)
     return serializable_attr_names
 
 
@@ -91,22 +106,58 @@ def _generate_exposed_attrs_map(cls: type, attrs: dict) -> dict:
     return exposed_attrs
 
 
-def _get_custom_deserializers(pmcls: type, cls_dir: List[str]) -> dict:
+def _get_custom_deserializer_names(pmcls: type, cls_dir: List[str]) -> dict:
     deserializers = {}
     for attr_name in cls_dir:
         deserializer_function = getattr(pmcls, attr_name)
         if hasattr(deserializer_function, '__deserializes__'):
             for exposed_attr_name in deserializer_function.__deserializes__:
-                deserializers[exposed_attr_name] = deserializer_function
+                deserializers[exposed_attr_name] = attr_name
     return deserializers
 
 
+def _build_attr_values_getter(attr_names: Tuple[str]) -> Callable[[object], tuple]:
+    # attrgetter returns a plain value instead of a tuple when it receives a single name
+    if len(attr_names) == 0:
+        return lambda instance: tuple()
+    if len(attr_names) == 1:
+        getter = attrgetter(attr_names[0])
+        return lambda instance: (getter(instance),)
+    return attrgetter(*attr_names)
+
+
+def _get_validation_policies(pmcls: type, model_attrs: dict) -> Optional[dict]:
+    model_policy = getattr(pmcls, '__settings__', {}).get(PymodelioSetting.VALIDATION_POLICY)
+    policies = {}
+    for attr_name, model_attr in model_attrs.items():
+        policy = model_attr.validation_policy if model_attr.validation_policy is not None else model_policy
+        if policy is not None:
+            policies[attr_name] = policy
+    return policies or None
+
+
+def _overrides_model_method(pmcls: type, method_name: str) -> bool:
+    # PymodelioModel is the only class that declares __is_pymodelio_model__ in its body
+    for cls in pmcls.__mro__:
+        if method_name in cls.__dict__:
+            return '__is_pymodelio_model__' not in cls.__dict__
+    return False
+
+
 class PymodelioMeta(type):
     IS_INNER_MODEL_KEY = '__is_pymodelio_inner_model__'
 
     @classmethod
-    def prepare(cls, pmcls: type) -> type:
-        model_attrs = _get_model_attrs(pmcls)
+    def get_model_attrs(cls, pmcls: type) -> dict:
+        return _get_model_attrs(pmcls)
+
+    @classmethod
+    def build_plan(cls, pmcls: type, model_attrs: Optional[dict] = None) -> ModelPlan:
+        """
+        Analyses the schema of the model
+        """
+        if model_attrs is None:
+            model_attrs = cls.get_model_attrs(pmcls)
         attr_names = tuple(model_attrs.keys())
 
         protected_attrs = set()
@@ -119,24 +170,64 @@ class PymodelioMeta(type):
 
         cls_dir = dir(pmcls)
 
+        return ModelPlan(
+            fingerprint=plan_cache.schema_fingerprint(model_attrs),
+            attr_names=attr_names,
+            serializable_attrs=_get_serializable_attr_names(pmcls, cls_dir, attr_names),
+            exposed_attrs=_generate_exposed_attrs_map(pmcls, model_attrs),
+            protected_attrs=protected_attrs,
+            private_attrs=private_attrs,
+            deserializers=_get_custom_deserializer_names(pmcls, cls_dir),
+            validates_attrs_with_hook=_overrides_model_method(pmcls, '__when_validating_an_attr__'),
+            overrides_validate=_overrides_model_method(pmcls, 'validate')
+        )
+
+    @classmethod
+    def prepare(cls, pmcls: type) -> type:
+        model_attrs = _get_model_attrs(pmcls)
+        # The plan is read from the compiled plans of the module of the model if its schema did not change
+        plan = plan_cache.get_plan(pmcls, model_attrs, cls.build_plan)
+        attr_names = plan.attr_names
+
         inner_dict = {
-            '__slots__': attr_names,
+            # The validation bookkeeping is stored in slots too, so validated models don't get a __dict__
+            '__slots__': attr_names + BOOKKEEPING_SLOTS,
             PymodelioMeta.IS_INNER_MODEL_KEY: True,
             '__pymodelio_parent__': pmcls,
-            '__model_attrs__': [(k, model_attrs[k]) for k in model_attrs],
-            '__serializable_attrs__': _get_serializable_attr_names(pmcls, set(cls_dir + list(attr_names))),
-            '__exposed_attrs__': _generate_exposed_attrs_map(pmcls, model_attrs),
-            '__protected_attrs__': protected_attrs,
-            '__private_attrs__': private_attrs,
-            '__deserializers__': _get_custom_deserializers(pmcls, cls_dir)
+            '__model_attrs__': [(k, model_attrs[k]) for k in attr_names],
+            '__attr_values_getter__': staticmethod(_build_attr_values_getter(attr_names)),
+            # (attribute name, default factory) of each attribute, for constructing trusted models
+            '__construct_plan__': tuple((k, model_attrs[k].default_factory) for k in attr_names),
+            # (attribute name, copy kind) of each attribute, for deep copying models
+            '__deepcopy_plan__': build_deepcopy_plan(model_attrs, attr_names),
+            '__serializable_attrs__': list(plan.serializable_attrs),
+            '__exposed_attrs__': dict(plan.exposed_attrs),
+            '__protected_attrs__': set(plan.protected_attrs),
+            '__private_attrs__': set(plan.private_attrs),
+            '__deserializers__': {k: getattr(pmcls, v) for k, v in plan.deserializers.items()},
+            '__validates_attrs_with_hook__': plan.validates_attrs_with_hook,
+            '__overrides_validate__': plan.overrides_validate,
+            '__unions__': build_unions(pmcls, model_attrs),
+            # Validation policies of the attributes that don't use the one of the validation pass, by attribute name
+            '__validation_policies__': _get_validation_policies(pmcls, model_attrs)
         }
 
         inner_class = type(pmcls.__name__, (pmcls,) + pmcls.__bases__, inner_dict)
 
         pmcls._set_inner_model(inner_class)
 
+        shared_vars.prepared_models.add(inner_class)
+        for listener in shared_vars.model_prepared_listeners:
+            listener(inner_class)
+
         return inner_class
 
+    def __init__(pmcls, name: str, bases: tuple, namespace: dict, **kwargs) -> None:
+        super().__init__(name, bases, namespace, **kwargs)
+        # Inner models and PymodelioModel itself are not registered
+        if not namespace.get(PymodelioMeta.IS_INNER_MODEL_KEY, False) and '__is_pymodelio_model__' not in namespace:
+            model_registry.register(pmcls)
+
     def __call__(pmcls, *args, **kwargs):
         # If it is an inner model
         if hasattr(pmcls, PymodelioMeta.IS_INNER_MODEL_KEY) and pmcls.__is_pymodelio_inner_model__:
@@ -149,6 +240,4 @@ class PymodelioMeta(type):
 
         inner_model = PymodelioMeta.prepare(pmcls)
 
-        shared_vars.model_globals[inner_model.__name__] = inner_model
-
         return inner_model(*args, **kwargs)
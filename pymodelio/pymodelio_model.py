@@ -1,15 +1,66 @@
-from datetime import datetime, date
-from typing import List, Any, Tuple, TypeVar, Callable, Dict, Type, Optional
+from datetime import datetime, date, time, timedelta
+from copy import deepcopy
+from operator import is_
+from typing import List, Any, Tuple, TypeVar, Callable, Dict, Type, Optional, Iterable, Iterator, Sequence, \
+    Union
 
 from pymodelio.attribute import PymodelioAttr
 from pymodelio.constants import UNDEFINED
 from pymodelio.model_deserializer import ModelDeserializer
+from pymodelio.model_columns import ModelColumns
+from pymodelio.model_copy import SHARE as _SHARE, MODEL as _MODEL, MODELS_LIST as _MODELS_LIST, \
+    CONTAINER as _CONTAINER
+from pymodelio.model_rows import ModelRows
 from pymodelio.model_serializer import ModelSerializer
-from pymodelio.pymodelio_meta import PymodelioMeta
+from pymodelio.pymodelio_meta import PymodelioMeta, BOOKKEEPING_SLOTS
+from pymodelio.settings.pymodelio_setting import PymodelioSetting
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+from pymodelio.validation_context import ValidationContext, current_context
+from pymodelio.validation_policy import ValidationPolicy, FULL
+from pymodelio.validation_result import ValidationResult
 
 T = TypeVar('T')
 
 
+class _ImmutableTypes(dict):
+    """
+    Values of the types mapped to True can not be mutated in place, so the result of validating them can not change.
+    Types are classified on first lookup, so modules defining immutable types (like uuid) don't need to be imported.
+    """
+    __BUILTINS = frozenset({str, int, float, bool, complex, bytes, type(None), date, datetime, time, timedelta})
+    __BY_NAME = frozenset({('decimal', 'Decimal'), ('uuid', 'UUID')})
+
+    def __missing__(self, value_type: type) -> bool:
+        is_immutable = value_type in self.__BUILTINS or \
+            (value_type.__module__, value_type.__qualname__) in self.__BY_NAME
+        self[value_type] = is_immutable
+        return is_immutable
+
+
+_new = object.__new__
+
+_IMMUTABLE_TYPES = _ImmutableTypes()
+_is_immutable_type = _IMMUTABLE_TYPES.__getitem__
+
+_NOT_COPIED = object()
+
+_VALIDATED_EPOCH, _VALIDATED_VALUES, _USED_POLICIES = BOOKKEEPING_SLOTS
+
+
+def _restore_model(pmcls: type, attr_names: Tuple[str, ...], values: tuple) -> Any:
+    """
+    Restores a pickled model, without initializing nor validating it
+    """
+    inner_cls = pmcls._get_inner_model() or PymodelioMeta.prepare(pmcls)
+    if attr_names != tuple(x for x, _ in inner_cls.__model_attrs__):
+        # The attributes of the model changed since it was pickled, so the values are assigned by name
+        return inner_cls._construct(dict(zip(attr_names, values)))
+    instance = _new(inner_cls)
+    for attr_name, value in zip(attr_names, values):
+        setattr(instance, attr_name, value)
+    return instance
+
+
 class PymodelioModel(metaclass=PymodelioMeta):
     # Only for intellisense
     __is_pymodelio_model__ = True
@@ -21,13 +72,64 @@ class PymodelioModel(metaclass=PymodelioMeta):
     __protected_attrs__ = set()
     __private_attrs__ = set()
     __deserializers__: Dict[str, Callable] = dict()
+    __attr_values_getter__: Callable[[Any], tuple] = None
+    __construct_plan__: Tuple[Tuple[str, Callable[[], Any]], ...] = tuple()
+    __deepcopy_plan__: Tuple[Tuple[str, int], ...] = tuple()
+    __validates_attrs_with_hook__ = False
+    __overrides_validate__ = False
+    # Deserializers of the attributes holding unions of models, by attribute name
+    __unions__: Dict[str, Any] = {}
+    # Validation policies of the attributes that don't use the one of the validation pass, by attribute name
+    __validation_policies__: Optional[Dict[str, ValidationPolicy]] = None
+
+    # Settings of the model, taking precedence over the global and overridden ones
+    __settings__: Dict[PymodelioSetting, Any] = {}
+
+    # The validation bookkeeping (the epoch of the last validation pass of the model, the values it was validated
+    # with and the policies it was validated with) is stored in the BOOKKEEPING_SLOTS of the inner classes, which are
+    # unset until the model gets validated, so it is read with getattr
+
+    def __init__(self, *args, auto_validate: bool = True, collect_errors: bool = False, **kwargs) -> None:
+        self.__initialize(args, kwargs, auto_validate, collect_errors, None)
+
+    @classmethod
+    def _init_in_context(cls: Type[T], kwargs: dict, context: ValidationContext) -> T:
+        """
+        Initializes a model like __init__ does, but validating it in a running validation context (used by the
+        non-raising API), so the errors are left in the context instead of being raised
+        """
+        instance = _new(cls)
+        instance.__initialize((), kwargs, True, context.collect_errors, context)
+        return instance
+
+    @classmethod
+    def _init_row(cls: Type[T], plan: Any, row: Sequence[Any], collect_errors: bool,
+                  context: Optional[ValidationContext]) -> T:
+        """
+        Initializes a model like __init__ does, but assigning the values of a row by position (with a plan built by
+        ModelRows) instead of passing them by name. If a context is provided, the model is validated in it.
+        """
+        instance = ModelRows._assign(cls, plan, row)
+        instance._complete_init(True, collect_errors, context)
+        return instance
 
-    def __init__(self, *args, auto_validate: bool = True, **kwargs) -> None:
+    def __initialize(self, args: tuple, kwargs: dict, auto_validate: bool, collect_errors: bool,
+                     context: Optional[ValidationContext]) -> None:
         args, kwargs = self.__before_init__(*args, auto_validate=auto_validate, **kwargs)
         self.__set_attributes(kwargs)
+        self._complete_init(auto_validate, collect_errors, context)
+
+    def _complete_init(self, auto_validate: bool, collect_errors: bool,
+                       context: Optional[ValidationContext]) -> None:
+        """
+        Runs the rest of the initialization of a model whose attributes were already set
+        """
         self.__before_validate__()
-        if auto_validate:
-            self.validate()
+        if context is not None:
+            if not self._validate_in_context(context):
+                return
+        elif auto_validate:
+            self.validate(collect_errors=collect_errors)
         self.__once_validated__()
 
     def __set_attributes(self, kwargs: dict) -> None:
@@ -62,28 +164,336 @@ class PymodelioModel(metaclass=PymodelioMeta):
             attr_name not in self.__protected_attrs__ and \
             attr_name in self.__private_attrs__
 
-    def validate(self, path: str = None) -> None:
+    def validate(self, path: str = None, collect_errors: bool = False) -> None:
+        """
+        It must raise ModelValidationException in case of an invalid attribute.
+        If collect_errors is True, all the invalid attributes are reported at once in the errors of the raised
+        exception instead of failing on the first one.
+        A model is validated at most once per validation pass, and it is not validated again if its attributes were
+        not reassigned since its last successful validation and all of them hold immutable values.
+        """
+        context = current_context()
+        if context is None or path is not context.path:
+            root = path if path is not None else self.__class__.__name__
+            with ValidationContext(root, collect_errors=collect_errors, outer=context) as context:
+                self.__validate_attrs(context)
+                context.raise_errors()
+            return
+        # Called with the path of a running validation pass (for instance, from an overridden validate method)
+        errors = context.errors
+        errors_count = len(errors)
+        if not self.__validate_attrs(context):
+            raised_errors = errors[errors_count:]
+            del errors[errors_count:]
+            raise ModelValidationException(errors=raised_errors)
+
+    def check(self, collect_errors: bool = False) -> ValidationResult:
+        """
+        Validates the model without raising. The returned result contains the model if it is valid, and the found
+        errors otherwise.
+        """
+        with ValidationContext(self.__class__.__name__, collect_errors=collect_errors,
+                               outer=current_context()) as context:
+            is_valid = self._validate_in_context(context)
+        return ValidationResult(self if is_valid else None, context.errors)
+
+    def _validate_in_context(self, context: ValidationContext) -> bool:
         """
-        It must raise ModelValidationException in case of an invalid attribute
+        Non-raising validation protocol used for validating nested models. The found errors are added to the context.
         """
+        if self.__overrides_validate__:
+            try:
+                self.validate(context.path)
+            except ModelValidationException as e:
+                context.record(e)
+                return False
+            return True
+        return self.__validate_attrs(context)
+
+    def __validate_attrs(self, context: ValidationContext) -> bool:
+        if getattr(self, _VALIDATED_EPOCH, None) == context.epoch or self.__is_unmodified_since_validated():
+            return True
+        self.__validated_epoch = context.epoch
+        path = context.path
+        collect_errors = context.collect_errors
+        is_valid = True
+        policies = self.__validation_policies__
+        # Paths are only formatted for models that customize the attributes validation
+        parent_path = str(path) if self.__validates_attrs_with_hook__ else None
         for attr_name, model_attr in self.__model_attrs__:
             attr_value = getattr(self, attr_name)
-            parent_path = path if path is not None else self.__class__.__name__
-            attr_path = '%s.%s' % (parent_path, attr_name)
-            model_attr.validate(attr_value, path=attr_path)
-            self.__when_validating_an_attr__(attr_name, attr_value, attr_path, parent_path, model_attr)
+            validator = model_attr.validator
+            path.append(attr_name)
+            if policies is not None and validator is not None and attr_name in policies:
+                is_valid_attr = self.__check_with_policy(validator, attr_value, policies[attr_name], context)
+            else:
+                is_valid_attr = validator is None or validator._check(attr_value, context)
+            if is_valid_attr and parent_path is not None:
+                is_valid_attr = self.__check_with_hook(attr_name, attr_value, parent_path, model_attr, context)
+            path.pop()
+            if not is_valid_attr:
+                is_valid = False
+                if not collect_errors:
+                    break
+        pass_policy = context.policy
+        if policies is not None or (pass_policy is not UNDEFINED and pass_policy is not FULL) or \
+                getattr(self, _USED_POLICIES, None) is not None:
+            self.__record_policies(policies, pass_policy)
+        if is_valid:
+            values = self.__attr_values_getter__(self)
+            if all(map(_is_immutable_type, map(type, values))):
+                self.__validated_values = values
+                # The snapshot of the values already skips the validation of the model in the current pass, so the
+                # epoch (which is a new int of each pass) is not kept
+                self.__validated_epoch = None
+        return is_valid
+
+    @staticmethod
+    def __check_with_policy(validator: Any, attr_value: Any, policy: ValidationPolicy,
+                            context: ValidationContext) -> bool:
+        # The policy also applies to the collections of the models nested in the attribute
+        outer_policy = context.policy
+        context.policy = policy
+        try:
+            return validator._check(attr_value, context)
+        finally:
+            context.policy = outer_policy
+
+    def __record_policies(self, policies: Optional[Dict[str, ValidationPolicy]], pass_policy: Any) -> None:
+        used_policies = {}
+        if pass_policy is not UNDEFINED and not pass_policy.is_full:
+            used_policies = dict.fromkeys([x for x, _ in self.__model_attrs__], pass_policy)
+        for attr_name, policy in (policies or {}).items():
+            if policy.is_full:
+                used_policies.pop(attr_name, None)
+            else:
+                used_policies[attr_name] = policy
+        self.__used_policies = used_policies or None
+
+    def get_validation_policies(self) -> Dict[str, ValidationPolicy]:
+        """
+        Returns the policies the attributes of the model were validated with the last time it got validated, for the
+        attributes whose collections (or the collections of their nested models) may not have been fully checked.
+        """
+        return dict(getattr(self, _USED_POLICIES, None) or {})
+
+    def __check_with_hook(self, attr_name: str, attr_value: Any, parent_path: str, model_attr: PymodelioAttr,
+                          context: ValidationContext) -> bool:
+        try:
+            self.__when_validating_an_attr__(attr_name, attr_value, str(context.path), parent_path, model_attr)
+        except ModelValidationException as e:
+            context.record(e)
+            return False
+        return True
+
+    def __is_unmodified_since_validated(self) -> bool:
+        validated_values = getattr(self, _VALIDATED_VALUES, None)
+        return validated_values is not None and all(map(is_, validated_values, self.__attr_values_getter__(self)))
 
     def __when_validating_an_attr__(self, attr_name: str, attr_value: Any, attr_path: str,
                                     parent_path: str, attr: PymodelioAttr) -> None:
         return
 
     @classmethod
-    def from_dict(cls: Type[T], data: dict, auto_validate: bool = True) -> T:
-        return ModelDeserializer.deserialize(cls, data, auto_validate)
+    def from_dict(cls: Type[T], data: dict, auto_validate: bool = True, collect_errors: bool = False,
+                  trusted: bool = False) -> T:
+        """
+        Deserializes the model. If trusted is True, the data (and the models nested in it) is known to be valid, so the
+        model is constructed without validating it nor running its initialization hooks (see construct).
+        """
+        return ModelDeserializer.deserialize(cls, data, auto_validate, collect_errors, trusted=trusted)
+
+    @classmethod
+    def from_rows(cls: Type[T], rows: Iterable[Sequence[Any]], columns: Sequence[str],
+                  trusted: bool = False) -> List[T]:
+        """
+        Creates models from rows, which are sequences of values in the order of the columns. Columns are the names the
+        models are initialized with (including their init aliases), and they are mapped to the attributes once for all
+        the rows. The models are initialized like in from_dict, running the initialization hooks and validating them.
+        If trusted is True, they are constructed like in construct instead, so the hooks are not run, the models are
+        not validated, and the columns can also be named after the attributes.
+        """
+        return ModelRows.from_rows(cls, rows, columns, trusted)
+
+    @classmethod
+    def from_columns(cls: Type[T], columns: Dict[str, Sequence[Any]], trusted: bool = False) -> List[T]:
+        """
+        Same as from_rows, but for the values of the models by column (like the ones returned by to_columns)
+        """
+        return ModelColumns.from_columns(cls, columns, trusted)
+
+    @classmethod
+    def from_numpy(cls: Type[T], array: Any, trusted: bool = False) -> List[T]:
+        """
+        Same as from_rows, but for the rows of a NumPy structured array (like the ones returned by to_numpy), whose
+        values are converted to Python values
+        """
+        return ModelColumns.from_numpy(cls, array, trusted)
+
+    @classmethod
+    def from_bytes(cls: Type[T], data: Union[bytes, bytearray, memoryview], trusted: bool = False) -> T:
+        """
+        Decodes a model encoded by to_bytes. Memoryviews are decoded without copying them. The payload starts with the
+        fingerprint of the schema of the model, so ValueError is raised if it was encoded with another version of it
+        (or if it is not a valid payload). Like in construct, the initialization hooks are not run, and the model is
+        validated unless trusted is True.
+        """
+        from pymodelio.model_codec import ModelCodec
+        return ModelCodec.from_bytes(cls, data, trusted)
+
+    @classmethod
+    def from_bytes_many(cls: Type[T], data: Union[bytes, bytearray, memoryview], trusted: bool = False) -> List[T]:
+        """
+        Same as from_bytes, but for the concatenated payloads of multiple models
+        """
+        from pymodelio.model_codec import ModelCodec
+        return ModelCodec.from_bytes_many(cls, data, trusted)
+
+    @classmethod
+    def from_cursor(cls: Type[T], cursor: Any, batch_size: int = 1000, trusted: bool = False) -> Iterator[T]:
+        """
+        Same as from_rows, but for the rows of a DB-API cursor, whose columns are read from its description. Rows are
+        fetched in batches of batch_size, so the memory used while iterating large results is bounded.
+        """
+        return ModelRows.from_cursor(cls, cursor, batch_size, trusted)
+
+    @classmethod
+    def _from_cursor_batch(cls: Type[T], plan: Any, rows: Sequence[Sequence[Any]], trusted: bool) -> List[T]:
+        """
+        Creates the models of a batch of rows fetched by from_cursor, so each batch is traced as a from_cursor call
+        """
+        return ModelRows._build(cls, plan, rows, trusted)
+
+    @classmethod
+    def iter_csv(cls: Type[T], file: Any, trusted: bool = False, collect_errors: bool = False,
+                 **fmtparams) -> Iterator[T]:
+        """
+        Returns a generator of models read from a CSV file (or a path) whose first row is the header. Like in from_rows,
+        the columns are mapped to the attributes once, but their values are also converted by the types of the
+        attributes (numbers, booleans, decimals, dates and datetimes, with nested models and collections as JSON),
+        and empty values of optional attributes become None. Unknown columns (and the ones of non-initable attributes)
+        are ignored. The rows are read as the models are iterated, so the memory used doesn't depend on the size of
+        the file. Like in from_rows, the models are initialized like in from_dict unless trusted is True, and the
+        errors are reported with the number of the line of their row (like in Model[3].attr). The format parameters
+        are the ones of csv.reader.
+        """
+        # Imported here, as the csv support is not needed by most of the models
+        from pymodelio.model_csv import ModelCSV
+        return ModelCSV.iter_csv(cls, file, trusted, collect_errors, **fmtparams)
+
+    @classmethod
+    def try_iter_csv(cls: Type[T], file: Any, collect_errors: bool = False, **fmtparams) -> Iterator[ValidationResult]:
+        """
+        Same as iter_csv, but without raising ModelValidationException. A ValidationResult is generated for each row,
+        containing its model if it is valid and the found errors otherwise (including the ones of rows whose number of
+        values doesn't match the header), so the rows after an invalid one are still read.
+        """
+        # Imported here, as the csv support is not needed by most of the models
+        from pymodelio.model_csv import ModelCSV
+        return ModelCSV.try_iter_csv(cls, file, collect_errors, **fmtparams)
+
+    @classmethod
+    def construct(cls: Type[T], _once_validated: bool = False, **fields) -> T:
+        """
+        Creates a model from trusted values, provided by the names of its attributes (not by their init aliases). The
+        values are assigned as they are and the defaults are only applied to the missing attributes. Neither validation
+        nor the initialization hooks are run, except __once_validated__ if _once_validated is True. Unknown names
+        (including the init aliases) raise NameError.
+        """
+        inner_cls = cls._get_inner_model() or PymodelioMeta.prepare(cls)
+        attr_names = inner_cls.__exposed_attrs__
+        for attr_name in fields:
+            if attr_name not in attr_names:
+                raise NameError('%s is not an attribute of class %s' % (attr_name, cls.__name__))
+        return inner_cls._construct(fields, _once_validated)
+
+    @classmethod
+    def _construct(cls: Type[T], fields: dict, once_validated: bool = False) -> T:
+        instance = _new(cls)
+        for attr_name, default_factory in cls.__construct_plan__:
+            setattr(instance, attr_name, fields[attr_name] if attr_name in fields else default_factory())
+        if once_validated:
+            instance.__once_validated__()
+        return instance
+
+    @classmethod
+    def try_from_dict(cls: Type[T], data: dict, collect_errors: bool = False) -> ValidationResult:
+        """
+        Deserializes and validates the model without raising ModelValidationException. The returned result contains
+        the model if it is valid, and the found errors otherwise.
+        """
+        return cls.try_from_dict_many((data,), collect_errors=collect_errors)[0]
+
+    @classmethod
+    def try_from_dict_many(cls: Type[T], rows: Iterable[dict], collect_errors: bool = False) -> List[ValidationResult]:
+        """
+        Same as try_from_dict, but for multiple rows. All of them are validated in the same validation pass.
+        """
+        results = []
+        with ValidationContext(cls.__name__, collect_errors=collect_errors, outer=current_context()) as context:
+            for data in rows:
+                context.errors = []
+                try:
+                    instance = ModelDeserializer.deserialize(cls, data, True, collect_errors, context)
+                except ModelValidationException as e:
+                    # Raised by the user defined initialization hooks
+                    instance = None
+                    context.record(e)
+                results.append(ValidationResult(instance if len(context.errors) == 0 else None, context.errors))
+        return results
 
     def to_dict(self) -> dict:
         return ModelSerializer.serialize(self)
 
+    def to_bytes(self) -> bytes:
+        """
+        Encodes the model to a compact binary format, where its attributes are encoded by position according to their
+        declared types (see from_bytes). Payloads of multiple models can be concatenated and decoded by
+        from_bytes_many.
+        """
+        # Imported here, as the binary format is not needed by most of the models
+        from pymodelio.model_codec import ModelCodec
+        return ModelCodec.to_bytes(self)
+
+    @classmethod
+    def to_rows(cls, models: Iterable[Any], columns: Optional[Sequence[str]] = None,
+                adapters: Optional[Dict[type, Callable[[Any], Any]]] = None,
+                chunk_size: Optional[int] = None) -> Iterator[Union[tuple, List[tuple]]]:
+        """
+        Returns a generator of the values of the models as tuples in the order of the columns, which can be passed
+        directly to executemany. By default, the columns are the serializable attributes of the model (see
+        get_row_columns). The values are adapted by the type of their columns, which is resolved once for all the
+        models: dates and datetimes are exported in ISO format and nested models and collections as JSON, unless other
+        adapters are provided by type (like {datetime: datetime.timestamp}). If chunk_size is provided, lists of up to
+        chunk_size rows are generated instead.
+        """
+        return ModelRows.to_rows(cls, models, columns, adapters, chunk_size)
+
+    @classmethod
+    def to_columns(cls, models: Iterable[Any], columns: Optional[Sequence[str]] = None) -> Dict[str, list]:
+        """
+        Returns the values of the models by column, as lists, in a single pass over them (for instance, for creating
+        a pandas DataFrame). The columns are the ones of to_rows, but the values are not adapted.
+        """
+        return ModelColumns.to_columns(cls, models, columns)
+
+    @classmethod
+    def to_numpy(cls, models: Iterable[Any], columns: Optional[Sequence[str]] = None) -> Any:
+        """
+        Returns a NumPy structured array with the values of the models, whose fields are the columns of to_rows. The
+        type of each field is derived from the type of its attribute: int64, float64, bool, datetime64 (for dates and
+        datetimes) and object for the other ones (including the optional attributes). numpy must be installed.
+        """
+        return ModelColumns.to_numpy(cls, models, columns)
+
+    @classmethod
+    def get_row_columns(cls) -> List[str]:
+        """
+        Returns the columns the models are exported to by to_rows by default: the serializable attributes of the
+        model, starting by the declared ones (in declaration order) and followed by its properties (sorted by name).
+        """
+        return ModelRows.get_columns(cls._get_inner_model() or PymodelioMeta.prepare(cls))
+
     def _get_serializable_attrs(self) -> List[Tuple[str, Any]]:
         attrs = []
         for attr_name in self.__serializable_attrs__:
@@ -123,6 +533,59 @@ class PymodelioModel(metaclass=PymodelioMeta):
                 return False
         return True
 
+    def __copy__(self) -> Any:
+        instance = _new(type(self))
+        for attr_name, _ in self.__model_attrs__:
+            setattr(instance, attr_name, getattr(self, attr_name))
+        state = self.__dict__
+        if len(state) > 0:
+            instance.__dict__.update(state)
+        return instance
+
+    def __deepcopy__(self, memo: dict) -> Any:  # noqa: C901
+        """
+        Copies the attributes by their declared types: immutable values are shared, nested models are copied by their
+        own __deepcopy__ and only the other values go through copy.deepcopy. Like in copy.deepcopy, the values
+        referenced more than once are copied once. The copies are not validated again.
+        """
+        instance = _new(type(self))
+        memo[id(self)] = instance
+        for attr_name, copy_kind in self.__deepcopy_plan__:
+            value = getattr(self, attr_name)
+            if copy_kind != _SHARE and value is not None:
+                copied = memo.get(id(value), _NOT_COPIED)
+                if copied is not _NOT_COPIED:
+                    value = copied
+                elif copy_kind == _MODEL:
+                    value = value.__deepcopy__(memo)
+                elif copy_kind == _MODELS_LIST and type(value) is list:
+                    copied = memo[id(value)] = []
+                    for x in value:
+                        if x is not None:
+                            copied_x = memo.get(id(x), _NOT_COPIED)
+                            x = x.__deepcopy__(memo) if copied_x is _NOT_COPIED else copied_x
+                        copied.append(x)
+                    value = copied
+                elif copy_kind == _CONTAINER and type(value) in (list, set, dict):
+                    value = memo[id(value)] = value.copy()
+                else:
+                    value = deepcopy(value, memo)
+            setattr(instance, attr_name, value)
+        state = self.__dict__
+        if len(state) > 0:
+            instance.__dict__.update(deepcopy(state, memo))
+        return instance
+
+    def __reduce__(self) -> tuple:
+        """
+        Models are instances of inner classes that can't be imported, so they are pickled as their declared class, the
+        names of their attributes and their values. The attributes assigned out of the declared ones (for instance,
+        by __once_validated__) are pickled as the state of the model.
+        """
+        args = (self.__pymodelio_parent__, tuple(x for x, _ in self.__model_attrs__), self.__attr_values_getter__(self))
+        state = self.__dict__
+        return (_restore_model, args, dict(state)) if state else (_restore_model, args)
+
     @classmethod
     def _get_inner_model(cls) -> Optional[type]:
         return getattr(cls, '_%s__inner_pymodelio_model' % cls.__name__, None)
@@ -4,3 +4,7 @@ from enum import Enum
 class PymodelioSetting(Enum):
     AUTO_PARSE_DATES_AS_UTC = 'AUTO_PARSE_DATES_AS_UTC'
     USE_DEFAULT_ATTR_VALIDATOR_IF_NOT_DEFINED = 'USE_DEFAULT_ATTR_VALIDATOR_IF_NOT_DEFINED'
+    USE_COMPILED_PLANS = 'USE_COMPILED_PLANS'
+    AUTO_COMPILE_PLANS = 'AUTO_COMPILE_PLANS'
+    PLANS_CACHE_DIR = 'PLANS_CACHE_DIR'
+    VALIDATION_POLICY = 'VALIDATION_POLICY'
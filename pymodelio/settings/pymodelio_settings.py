@@ -1,27 +1,88 @@
+from contextvars import ContextVar
 from copy import deepcopy
-from typing import Any
+from typing import Any, Dict, Optional
 
 from pymodelio.settings.pymodelio_setting import PymodelioSetting
+from pymodelio.validation_policy import FULL
+
+# Settings overridden by the running PymodelioSettings.override scopes
+_overrides: ContextVar[Optional[Dict[PymodelioSetting, Any]]] = ContextVar('pymodelio_settings', default=None)
+
+
+class PymodelioSettingsOverride:
+    """
+    Scope in which some settings are overridden. As it is backed by a context variable, concurrent threads and
+    asyncio tasks can use different settings at the same time.
+    """
+    __slots__ = ('_settings', '_token')
+
+    def __init__(self, settings: Dict[PymodelioSetting, Any]) -> None:
+        self._settings = settings
+        self._token = None
+
+    def __enter__(self) -> 'PymodelioSettingsOverride':
+        outer = _overrides.get()
+        self._token = _overrides.set(self._settings if outer is None else {**outer, **self._settings})
+        return self
+
+    def __exit__(self, *args) -> None:
+        _overrides.reset(self._token)
 
 
 class PymodelioSettings:
     __initial_settings = {
         PymodelioSetting.AUTO_PARSE_DATES_AS_UTC: False,
-        PymodelioSetting.USE_DEFAULT_ATTR_VALIDATOR_IF_NOT_DEFINED: True
+        PymodelioSetting.USE_DEFAULT_ATTR_VALIDATOR_IF_NOT_DEFINED: True,
+        PymodelioSetting.USE_COMPILED_PLANS: False,
+        PymodelioSetting.AUTO_COMPILE_PLANS: False,
+        # Empty for the default cache directory
+        PymodelioSetting.PLANS_CACHE_DIR: '',
+        PymodelioSetting.VALIDATION_POLICY: FULL
     }
 
     __settings = deepcopy(__initial_settings)
 
     @classmethod
     def set(cls, setting: PymodelioSetting, value: Any) -> None:
-        expected_type = cls.__settings[setting].__class__
-        assert isinstance(value, expected_type), f'Value for setting {setting} must be of type {expected_type}'
+        cls.check(setting, value)
         cls.__settings[setting] = value
 
+    @classmethod
+    def check(cls, setting: PymodelioSetting, value: Any) -> None:
+        expected_type = cls.__initial_settings[setting].__class__
+        assert isinstance(value, expected_type), f'Value for setting {setting} must be of type {expected_type}'
+
     @classmethod
     def get(cls, setting: PymodelioSetting) -> Any:
+        overrides = _overrides.get()
+        if overrides is not None and setting in overrides:
+            return overrides[setting]
         return cls.__settings[setting]
 
+    @classmethod
+    def get_for_model(cls, setting: PymodelioSetting, model_cls: type) -> Any:
+        """
+        Returns the value of a setting for a model. The settings configured in the __settings__ dict of the model take
+        precedence over the overridden and global ones.
+        """
+        model_settings = model_cls.__settings__
+        if setting in model_settings:
+            return model_settings[setting]
+        return cls.get(setting)
+
+    @classmethod
+    def override(cls, settings: Optional[Dict[PymodelioSetting, Any]] = None, **kwargs) -> PymodelioSettingsOverride:
+        """
+        Returns a context manager within which the provided settings are overridden. Settings can be provided as a
+        dict and as keyword arguments named as the setting (like AUTO_PARSE_DATES_AS_UTC=True).
+        """
+        settings = dict(settings or {})
+        for name, value in kwargs.items():
+            settings[PymodelioSetting[name]] = value
+        for setting, value in settings.items():
+            cls.check(setting, value)
+        return PymodelioSettingsOverride(settings)
+
     @classmethod
     def reset(cls) -> None:
         cls.__settings = deepcopy(cls.__initial_settings)
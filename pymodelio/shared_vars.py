@@ -1,2 +1,7 @@
+from weakref import WeakSet
+
 to_do_not_serialize = {}
-model_globals = {}
+# Inner models generated by PymodelioMeta.prepare
+prepared_models = WeakSet()
+# Callables invoked with each inner model right after it is prepared
+model_prepared_listeners = []
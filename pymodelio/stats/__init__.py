@@ -0,0 +1,3 @@
+# flake8: noqa
+from .recorder import enable, disable, is_enabled, reset, snapshot
+from .prometheus_exporter import to_prometheus
@@ -0,0 +1,57 @@
+from collections import deque
+from math import ceil
+from typing import Optional
+
+# Amount of recent durations kept for computing percentiles
+SAMPLES_WINDOW = 1024
+
+PERCENTILES = (50, 90, 99)
+
+
+class OperationStats:
+    """
+    Accumulated statistics of an operation. Percentiles are computed from the most recent durations.
+    """
+    __slots__ = ('count', 'failures', 'total', 'min', 'max', '_samples')
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.failures = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._samples = deque(maxlen=SAMPLES_WINDOW)
+
+    def add(self, duration: float, failed: bool = False) -> None:
+        self.count += 1
+        if failed:
+            self.failures += 1
+        self.total += duration
+        if self.min is None or duration < self.min:
+            self.min = duration
+        if self.max is None or duration > self.max:
+            self.max = duration
+        self._samples.append(duration)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        if len(self._samples) == 0:
+            return None
+        samples = sorted(self._samples)
+        # Nearest-rank method
+        index = max(0, ceil(percentile / 100 * len(samples)) - 1)
+        return samples[index]
+
+    def to_dict(self) -> dict:
+        serialized = {
+            'count': self.count,
+            'failures': self.failures,
+            'total_seconds': self.total,
+            'min_seconds': self.min,
+            'max_seconds': self.max,
+        }
+        for percentile in PERCENTILES:
+            serialized['p%s_seconds' % percentile] = self.percentile(percentile)
+        return serialized
@@ -0,0 +1,52 @@
+from typing import List, Optional
+
+from pymodelio.stats.operation_stats import PERCENTILES
+from pymodelio.stats.recorder import snapshot as take_snapshot
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: dict) -> str:
+    return ','.join(['%s="%s"' % (name, _escape_label_value(str(value))) for name, value in labels.items()])
+
+
+def _add_summary(lines: List[str], metric: str, failures_metric: str, labels: dict, stats: dict) -> None:
+    formatted_labels = _format_labels(labels)
+    for percentile in PERCENTILES:
+        value = stats['p%s_seconds' % percentile]
+        if value is not None:
+            lines.append('%s{%s,quantile="%s"} %r' % (metric, formatted_labels, percentile / 100, value))
+    lines.append('%s_sum{%s} %r' % (metric, formatted_labels, stats['total_seconds']))
+    lines.append('%s_count{%s} %s' % (metric, formatted_labels, stats['count']))
+    lines.append('%s{%s} %s' % (failures_metric, formatted_labels, stats['failures']))
+
+
+def to_prometheus(snapshot: Optional[dict] = None) -> str:
+    """
+    Formats the statistics snapshot (the current one if it is not provided) using the Prometheus text exposition
+    format
+    """
+    snapshot = snapshot if snapshot is not None else take_snapshot()
+    lines = [
+        '# HELP pymodelio_model_operation_seconds Duration of pymodelio model operations.',
+        '# TYPE pymodelio_model_operation_seconds summary',
+        '# HELP pymodelio_model_operation_failures_total Amount of pymodelio model operations that raised.',
+        '# TYPE pymodelio_model_operation_failures_total counter',
+    ]
+    for model, operations in snapshot['models'].items():
+        for operation, stats in operations.items():
+            _add_summary(lines, 'pymodelio_model_operation_seconds', 'pymodelio_model_operation_failures_total',
+                         {'model': model, 'operation': operation}, stats)
+    lines.extend([
+        '# HELP pymodelio_attr_validation_seconds Duration of pymodelio attribute validations.',
+        '# TYPE pymodelio_attr_validation_seconds summary',
+        '# HELP pymodelio_attr_validation_failures_total Amount of invalid pymodelio attribute values.',
+        '# TYPE pymodelio_attr_validation_failures_total counter',
+    ])
+    for model, attrs in snapshot['attrs'].items():
+        for attr, stats in attrs.items():
+            _add_summary(lines, 'pymodelio_attr_validation_seconds', 'pymodelio_attr_validation_failures_total',
+                         {'model': model, 'attr': attr}, stats)
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,155 @@
+from functools import partial, wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+from pymodelio import instrumentation, shared_vars
+from pymodelio.attribute import PymodelioAttr
+from pymodelio.stats.operation_stats import OperationStats
+from pymodelio.validation_context import ValidationContext
+from pymodelio.validators.validator import Validator
+
+# Instrumented PymodelioModel methods and the operation name they are recorded as. Models initialized by the non-raising
+# API and from rows are initialized without calling __init__, so they are recorded as constructions too.
+_MODEL_OPERATIONS = {
+    '__init__': 'construction',
+    '_init_in_context': 'construction',
+    '_init_row': 'construction',
+    'validate': 'validate',
+    'from_dict': 'from_dict',
+    'to_dict': 'to_dict',
+}
+
+_INSTRUMENTATION_KEY = 'stats'
+
+_enabled = False
+_instrumented_attrs: List[PymodelioAttr] = []
+_model_stats: Dict[str, Dict[str, OperationStats]] = {}
+_attr_stats: Dict[str, Dict[str, OperationStats]] = {}
+
+
+def model_name(cls: type) -> str:
+    # Inner models are named after the class they were generated from
+    cls = cls.__pymodelio_parent__ or cls
+    return '%s.%s' % (cls.__module__, cls.__qualname__)
+
+
+class _InstrumentedValidator(Validator):
+    """
+    Validator proxy that records the time spent by the wrapped validator and its failures
+    """
+
+    def __init__(self, validator: Validator, stats: OperationStats) -> None:
+        self.validator = validator
+        self.stats = stats
+
+    def _check(self, value: Any, context: ValidationContext) -> bool:
+        start = perf_counter()
+        is_valid = self.validator._check(value, context)
+        self.stats.add(perf_counter() - start, failed=not is_valid)
+        return is_valid
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.validator, name)
+
+
+def _record_model_operation(model_or_cls: Any, operation: str, duration: float, failed: bool) -> None:
+    cls = model_or_cls if isinstance(model_or_cls, type) else type(model_or_cls)
+    operations = _model_stats.setdefault(model_name(cls), {})
+    stats = operations.get(operation)
+    if stats is None:
+        stats = operations[operation] = OperationStats()
+    stats.add(duration, failed=failed)
+
+
+def _instrument_model_method(operation: str, method: Callable) -> Callable:
+    @wraps(method)
+    def instrumented(model_or_cls: Any, *args, **kwargs) -> Any:
+        start = perf_counter()
+        failed = True
+        try:
+            result = method(model_or_cls, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            _record_model_operation(model_or_cls, operation, perf_counter() - start, failed)
+
+    return instrumented
+
+
+def _declaring_model_name(inner_cls: type, attr_name: str, model_attr: PymodelioAttr) -> str:
+    # Attributes are shared with child models, so they are recorded for the model declaring them
+    for cls in inner_cls.__pymodelio_parent__.__mro__:
+        if cls.__dict__.get('__annotations__', {}).get(attr_name) is model_attr:
+            return model_name(cls)
+    return model_name(inner_cls)
+
+
+def _instrument_model_attrs(inner_cls: type) -> None:
+    for attr_name, model_attr in inner_cls.__model_attrs__:
+        if model_attr.validator is None or isinstance(model_attr.validator, _InstrumentedValidator):
+            continue
+        attrs = _attr_stats.setdefault(_declaring_model_name(inner_cls, attr_name, model_attr), {})
+        stats = attrs.setdefault(attr_name, OperationStats())
+        model_attr.validator = _InstrumentedValidator(model_attr.validator, stats)
+        _instrumented_attrs.append(model_attr)
+
+
+def enable() -> None:
+    """
+    Starts recording statistics. Until it is enabled, models and validators run without any instrumentation.
+    """
+    global _enabled
+    if _enabled:
+        return
+    _enabled = True
+    for method_name, operation in _MODEL_OPERATIONS.items():
+        instrumentation.install(_INSTRUMENTATION_KEY, method_name, partial(_instrument_model_method, operation))
+    for inner_cls in list(shared_vars.prepared_models):
+        _instrument_model_attrs(inner_cls)
+    shared_vars.model_prepared_listeners.append(_instrument_model_attrs)
+
+
+def disable() -> None:
+    """
+    Stops recording statistics and removes the instrumentation. Recorded statistics are kept until reset is called.
+    """
+    global _enabled
+    if not _enabled:
+        return
+    _enabled = False
+    instrumentation.uninstall(_INSTRUMENTATION_KEY)
+    for model_attr in _instrumented_attrs:
+        model_attr.validator = model_attr.validator.validator
+    _instrumented_attrs.clear()
+    shared_vars.model_prepared_listeners.remove(_instrument_model_attrs)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    _model_stats.clear()
+    # Attributes stats are referenced by the instrumented validators
+    for attrs in _attr_stats.values():
+        for stats in attrs.values():
+            stats.reset()
+
+
+def snapshot() -> dict:
+    """
+    Returns the recorded statistics as a dict with the following structure:
+    {
+        'models': {<model name>: {<operation>: <operation stats>}},
+        'attrs': {<model name>: {<attribute name>: <validator stats>}}
+    }
+    """
+    return {
+        'models': {name: _stats_to_dict(operations) for name, operations in _model_stats.items()},
+        'attrs': {name: _stats_to_dict(attrs) for name, attrs in _attr_stats.items()
+                  if any(stats.count > 0 for stats in attrs.values())},
+    }
+
+
+def _stats_to_dict(stats_map: Dict[str, OperationStats]) -> Dict[str, dict]:
+    return {key: stats.to_dict() for key, stats in stats_map.items() if stats.count > 0}
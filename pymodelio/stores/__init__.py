@@ -0,0 +1,2 @@
+# flake8: noqa
+from .sqlite_store import SQLiteStore
@@ -0,0 +1,214 @@
+import sqlite3
+import typing
+from datetime import datetime, date
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, Sequence, Type, TypeVar
+from uuid import UUID
+
+from pymodelio.json_columns import to_json, build_json_converter
+from pymodelio.model_rows import ModelRows, _unwrap_optional
+from pymodelio.pymodelio_meta import PymodelioMeta
+
+T = TypeVar('T')
+
+# SQLite types of the columns of the scalar attributes. Enums and Literals are stored as their values, and attributes
+# of any other type are stored as JSON.
+_COLUMN_TYPES = {
+    bool: 'INTEGER',
+    int: 'INTEGER',
+    float: 'REAL',
+    str: 'TEXT',
+    bytes: 'BLOB',
+    datetime: 'TEXT',
+    date: 'TEXT',
+    Decimal: 'TEXT',
+    UUID: 'TEXT',
+}
+
+# Converters of the values read from the scalar columns whose types are not stored as they are
+_COLUMN_CONVERTERS = {
+    bool: bool,
+    Decimal: Decimal,
+    UUID: UUID,
+}
+
+_COLUMN_ADAPTERS = {
+    Decimal: str,
+    UUID: str,
+}
+
+# The rowid of the rows identifies the models whose store has no key
+_ROWID = 'rowid'
+
+
+class SQLiteStore(Generic[T]):
+    """
+    Stores models of a class in a table of a SQLite database, with a column for each of their attributes. Scalar
+    attributes (like numbers, strings and dates) are stored as they are, and the other ones (like nested models and
+    collections) are stored as JSON, the same way to_dict serializes them. Models are loaded without validating them,
+    as they were valid when they were stored.
+    """
+
+    def __init__(self, model: Type[T], path: str, table: Optional[str] = None, key: Optional[str] = None,
+                 indexes: Iterable[str] = ()) -> None:
+        """
+        The table is named after the model unless another name is provided. The key is the attribute identifying the
+        models (the id attribute by default, if the model has one), and the indexes are the attributes the where
+        queries are usually made by.
+        """
+        self.model = model
+        self.table = model.__name__ if table is None else table
+        self._inner_cls = model._get_inner_model() or PymodelioMeta.prepare(model)
+        self._model_attrs = dict(self._inner_cls.__model_attrs__)
+        if key is None and 'id' in self._model_attrs:
+            key = 'id'
+        if key is not None and key not in self._model_attrs:
+            raise NameError('%s is not an attribute of class %s' % (key, model.__name__))
+        self.key = key
+        self.columns = [attr_name for attr_name, _ in self._inner_cls.__model_attrs__]
+        self.connection = sqlite3.connect(path)
+        self._converters = {}
+        self._adapters = {}
+        self._column_types = {}
+        for attr_name, model_attr in self._inner_cls.__model_attrs__:
+            self._column_types[attr_name] = self.__add_column_mapping(attr_name, _unwrap_optional(model_attr.attr_type))
+        self._import_plan = ModelRows._import_plan(self._inner_cls, self.columns, self._converters, trusted=True)
+        self._export_plan = ModelRows._export_plan(self._inner_cls, self.columns, None, self._adapters)
+        # Adapters of the values of the where queries, by column
+        self._column_adapters = {self.columns[position]: adapt for position, adapt in self._export_plan[1]}
+        self.__create_table(indexes)
+
+    def put(self, model: T) -> None:
+        self.put_many([model])
+
+    def put_many(self, models: Iterable[T]) -> None:
+        """
+        Stores the models in a single transaction, replacing the stored ones with the same key. The models are
+        exported to rows as they are inserted, so any iterable of them can be stored without holding all of them in
+        memory.
+        """
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO %s (%s) VALUES (%s)' % (
+                    _quote(self.table), ', '.join(map(_quote, self.columns)), ', '.join('?' * len(self.columns))),
+                ModelRows._export(models, *self._export_plan)
+            )
+
+    def get(self, key: Any) -> Optional[T]:
+        """
+        Returns the model stored with the key (or with the rowid, if the store has no key), or None if there isn't
+        any
+        """
+        key_column = _ROWID if self.key is None else self.key
+        models = self.__load(self.__select('WHERE %s = ?' % _quote(key_column), [self.__adapt(key_column, key)]), 1)
+        return next(models, None)
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[T]:
+        """
+        Returns a generator of all the stored models, which are loaded in batches of batch_size models
+        """
+        return self.__load(self.__select(), batch_size)
+
+    def where(self, batch_size: int = 1000, **conditions: Any) -> Iterator[T]:
+        """
+        Returns a generator of the stored models whose attributes are equal to the provided values (by attribute
+        name). The models are loaded in batches of batch_size models.
+        """
+        clauses = []
+        params = []
+        for attr_name, value in conditions.items():
+            if attr_name not in self._model_attrs:
+                raise NameError('%s is not an attribute of class %s' % (attr_name, self.model.__name__))
+            if value is None:
+                clauses.append('%s IS NULL' % _quote(attr_name))
+            else:
+                clauses.append('%s = ?' % _quote(attr_name))
+                params.append(self.__adapt(attr_name, value))
+        return self.__load(self.__select('WHERE %s' % ' AND '.join(clauses) if clauses else '', params), batch_size)
+
+    def __len__(self) -> int:
+        return self.connection.execute('SELECT COUNT(*) FROM %s' % _quote(self.table)).fetchone()[0]
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> 'SQLiteStore[T]':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __select(self, clause: str = '', params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        return self.connection.execute('SELECT %s FROM %s %s' % (
+            ', '.join(map(_quote, self.columns)), _quote(self.table), clause), params)
+
+    def __load(self, cursor: sqlite3.Cursor, batch_size: int) -> Iterator[T]:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from ModelRows._build(self._inner_cls, self._import_plan, rows, True)
+
+    def __adapt(self, column: str, value: Any) -> Any:
+        adapt = self._column_adapters.get(column)
+        return value if adapt is None else adapt(value)
+
+    def __create_table(self, indexes: Iterable[str]) -> None:
+        columns = []
+        for attr_name in self.columns:
+            # Columns without a type hold values of any type, as they are
+            column = ' '.join(x for x in (_quote(attr_name), self._column_types[attr_name]) if x)
+            columns.append(column + ' PRIMARY KEY' if attr_name == self.key else column)
+        with self.connection:
+            self.connection.execute('CREATE TABLE IF NOT EXISTS %s (%s)' % (_quote(self.table), ', '.join(columns)))
+            for attr_name in indexes:
+                if attr_name not in self._model_attrs:
+                    raise NameError('%s is not an attribute of class %s' % (attr_name, self.model.__name__))
+                self.connection.execute('CREATE INDEX IF NOT EXISTS %s ON %s (%s)' % (
+                    _quote('%s_%s_index' % (self.table, attr_name)), _quote(self.table), _quote(attr_name)))
+
+    def __add_column_mapping(self, attr_name: str, attr_type: Any) -> str:
+        """
+        Registers the converter and the adapter of the column of the attribute (if its type needs them), and returns
+        the SQLite type of the column
+        """
+        if attr_type in _COLUMN_TYPES:
+            if attr_type in _COLUMN_CONVERTERS:
+                self._converters[attr_name] = _nullable(_COLUMN_CONVERTERS[attr_type])
+            if attr_type in _COLUMN_ADAPTERS:
+                self._adapters[attr_name] = _COLUMN_ADAPTERS[attr_type]
+            return _COLUMN_TYPES[attr_type]
+        if typing.get_origin(attr_type) is typing.Literal:
+            # Literals are stored as they are, in the column of the type of their values (if they share it), so they
+            # can be queried by them
+            values_type = _get_values_type(typing.get_args(attr_type))
+            return '' if values_type is None else self.__add_column_mapping(attr_name, values_type)
+        if isinstance(attr_type, type) and issubclass(attr_type, Enum):
+            self._adapters[attr_name] = _to_enum_value
+            self._converters[attr_name] = _nullable(attr_type)
+            return _COLUMN_TYPES.get(_get_values_type([x.value for x in attr_type]), '')
+        self._adapters[attr_name] = to_json
+        self._converters[attr_name] = build_json_converter(self._inner_cls, attr_name, attr_type)
+        return 'TEXT'
+
+
+def _nullable(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert_value(value: Any) -> Any:
+        return None if value is None else convert(value)
+
+    return convert_value
+
+
+def _to_enum_value(value: Any) -> Any:
+    # The values of the where queries may be provided as the values of the enum members too
+    return value.value if isinstance(value, Enum) else value
+
+
+def _get_values_type(values: Iterable[Any]) -> Optional[type]:
+    types = {type(x) for x in values}
+    return types.pop() if len(types) == 1 else None
+
+
+def _quote(identifier: str) -> str:
+    return '"%s"' % identifier.replace('"', '""')
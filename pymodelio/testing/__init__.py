@@ -0,0 +1,3 @@
+# flake8: noqa
+from .allocations import AllocationStats, measure_allocations, assert_allocations
+from .generator import generate, Violation
@@ -0,0 +1,108 @@
+import gc
+import sys
+import tracemalloc
+from collections import namedtuple
+from typing import Any, Callable, Optional
+
+# Memory cost of a call (averaged over the measured calls):
+# - retained_bytes and retained_blocks: memory still allocated after the call while its result is kept alive (for
+#   instance, the size of the instance built by from_dict). Temporary objects freed before the call ends are not
+#   included.
+# - peak_bytes: the maximum memory allocated during the call, temporary objects included.
+# - allocated_blocks: the blocks allocated during the call, including the temporary dicts, lists, tuples and other
+#   objects recycled by the free lists of Python (up to their capacity). Other temporary objects (like instances freed
+#   before the call ends) are only accounted by peak_bytes.
+AllocationStats = namedtuple('AllocationStats', ('retained_bytes', 'retained_blocks', 'peak_bytes',
+                                                 'allocated_blocks'))
+
+
+def measure_allocations(op: Callable[[], Any], repeat: int = 100) -> AllocationStats:
+    """
+    Measures the memory allocated by calls to op using tracemalloc, and the blocks allocated by them using
+    sys.getallocatedblocks. op is called once before measuring, so lazily initialized caches don't count as
+    allocations of the measured calls. op must be a Python callable (for instance, a lambda), as allocations are
+    attributed to the code making them.
+    """
+    op()
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        retained_bytes, retained_blocks, peak_bytes = _measure_traced_memory(op, repeat)
+        allocated_blocks = _measure_allocated_blocks(op, repeat)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return AllocationStats(retained_bytes, retained_blocks, peak_bytes, allocated_blocks)
+
+
+def _measure_traced_memory(op: Callable[[], Any], repeat: int) -> tuple:
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        results = [None] * repeat
+        tracemalloc.clear_traces()
+        before = tracemalloc.take_snapshot()
+        peak = 0
+        for i in range(repeat):
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            results[i] = op()
+            peak += tracemalloc.get_traced_memory()[1] - size
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    # The memory of the snapshots and of the bookkeeping of this function is excluded
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    diff = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'filename')
+    retained_bytes = sum(stat.size_diff for stat in diff)
+    retained_blocks = sum(stat.count_diff for stat in diff)
+    return retained_bytes / repeat, retained_blocks / repeat, peak / repeat
+
+
+def _measure_allocated_blocks(op: Callable[[], Any], repeat: int) -> float:
+    """
+    tracemalloc only reports the bytes of the peak, so the blocks allocated during a call are counted with
+    sys.getallocatedblocks. The free lists of Python (from which the dicts, lists, tuples, etc. are recycled instead of
+    being allocated) are emptied by a full collection before each call, so the temporary objects of those types are
+    not recycled, and they are kept by the free lists (still allocated) once freed. The existing objects are frozen,
+    so the collections are cheap.
+    """
+    get_blocks = sys.getallocatedblocks
+    results = [None] * repeat
+    blocks = 0
+    was_frozen = gc.get_freeze_count() > 0
+    gc.freeze()
+    try:
+        for i in range(repeat):
+            gc.collect()
+            start = get_blocks()
+            results[i] = op()
+            blocks += get_blocks() - start
+    finally:
+        if not was_frozen:
+            gc.unfreeze()
+    return blocks / repeat
+
+
+def assert_allocations(op: Callable[[], Any], max: Optional[float] = None, max_bytes: Optional[float] = None,
+                       max_retained_blocks: Optional[float] = None, max_retained_bytes: Optional[float] = None,
+                       repeat: int = 100) -> AllocationStats:
+    """
+    Asserts that a call to op allocates at most max blocks (see AllocationStats.allocated_blocks) and max_bytes bytes
+    (counted at the peak of the call, temporary objects included), and that it retains at most max_retained_blocks
+    blocks and max_retained_bytes bytes once it ends. Only the provided bounds are checked. Intended to be used in
+    tests for guarding memory regressions. Returns the measured stats.
+    """
+    stats = measure_allocations(op, repeat=repeat)
+    assert max is None or stats.allocated_blocks <= max, \
+        'Expected at most %s allocations per call, but got %.1f' % (max, stats.allocated_blocks)
+    assert max_bytes is None or stats.peak_bytes <= max_bytes, \
+        'Expected at most %s bytes per call, but got %.1f' % (max_bytes, stats.peak_bytes)
+    assert max_retained_blocks is None or stats.retained_blocks <= max_retained_blocks, \
+        'Expected at most %s retained allocations per call, but got %.1f' % (max_retained_blocks, stats.retained_blocks)
+    assert max_retained_bytes is None or stats.retained_bytes <= max_retained_bytes, \
+        'Expected at most %s retained bytes per call, but got %.1f' % (max_retained_bytes, stats.retained_bytes)
+    return stats
@@ -0,0 +1,327 @@
+import re
+from collections import namedtuple
+from datetime import date, datetime, timedelta, timezone
+from random import Random
+from string import ascii_letters, ascii_lowercase, ascii_uppercase, digits
+from types import UnionType
+from typing import Any, Callable, Dict, ForwardRef, Iterator, List, Optional, Tuple, Type, TypeVar, Union, \
+    get_args, get_origin
+
+from pymodelio.discriminators import get_models_union
+from pymodelio.pymodelio_meta import PymodelioMeta
+from pymodelio.validators import Validator, StringValidator, NumericValidator, FloatValidator, BoolValidator, \
+    DictValidator, IterableValidator, ListValidator, SetValidator, TupleValidator, DatetimeValidator, EmailValidator
+from pymodelio.validators.date_validator import DateValidator
+from pymodelio.validators.default_validators_builder import DefaultValidatorsBuilder
+from pymodelio.validators.discriminated_union_validator import DiscriminatedUnionValidator
+from pymodelio.validators.literal_validator import LiteralValidator
+
+T = TypeVar('T')
+
+# Violation injected into an invalid record. key is the payload key of the invalid attribute.
+Violation = namedtuple('Violation', ('key', 'description'))
+
+# Generates a value using the provided random generator
+ValueFactory = Callable[[Random], Any]
+
+# Default lengths of generated strings and iterables when their validators don't constrain them
+DEFAULT_MAX_LEN = 16
+DEFAULT_MAX_ITEMS = 5
+
+# Nested models deeper than this are generated as None when possible
+MAX_DEPTH = 8
+
+# Alphabets tried for generating strings matching the regex of a StringValidator
+_ALPHABETS = (ascii_lowercase + digits, ascii_letters + digits, ascii_uppercase, ascii_lowercase, digits,
+              ascii_lowercase + digits + '-_')
+_REGEX_ATTEMPTS = 20
+
+# Values used for violating the expected types of validators
+_WRONG_TYPE_VALUES = ('invalid', 1, b'invalid')
+
+_MIN_DATETIME = datetime(2000, 1, 1, tzinfo=timezone.utc)
+_DATETIME_RANGE_SECONDS = 30 * 365 * 24 * 60 * 60
+
+# Attribute of the generated plan of a model
+_AttrPlan = namedtuple('_AttrPlan', ('key', 'factory', 'violations'))
+
+
+def generate(model_cls: Type[T], n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+             as_models: bool = False, stream: bool = False, with_violations: bool = False,
+             factories: Optional[Dict[str, ValueFactory]] = None) -> Union[List[Any], Iterator[Any]]:
+    """
+    Generates n deterministic (for a given seed) payloads for the provided model, following the constraints of the
+    validators of its attributes (or the validators inferred from their types), so they can be deserialized with
+    from_dict. Custom validators are only followed for the constraints of the built-in validators they extend.
+
+    - invalid_ratio: fraction of the payloads that get an invalid value injected in one of their attributes.
+    - as_models: if True, the payloads are deserialized into models (invalid ones are not validated).
+    - stream: if True, returns an iterator generating the payloads on demand instead of a list.
+    - with_violations: if True, each generated item is a tuple with the payload (or model) and the injected Violation
+      (None for valid payloads).
+    - factories: functions receiving a random.Random generating the values of the attributes with the provided
+      names (for instance, for attributes with regexes that can't be satisfied by random strings).
+    """
+    if not 0 <= invalid_ratio <= 1:
+        raise ValueError('invalid_ratio must be between 0 and 1')
+    items = _generate(model_cls, n, Random(seed), invalid_ratio, as_models, with_violations, factories or {})
+    return items if stream else list(items)
+
+
+def _generate(model_cls: type, n: int, rng: Random, invalid_ratio: float, as_models: bool, with_violations: bool,
+              factories: Dict[str, ValueFactory]) -> Iterator[Any]:
+    plan = _ModelPlanner(factories).plan(model_cls, 0)
+    invalidable = [attr for attr in plan if attr.violations]
+    if invalid_ratio > 0 and not invalidable:
+        raise ValueError('%s has no attributes with validators where violations can be injected' % model_cls.__name__)
+    for _ in range(n):
+        payload = {attr.key: attr.factory(rng) for attr in plan}
+        violation = None
+        if invalid_ratio > 0 and rng.random() < invalid_ratio:
+            attr = rng.choice(invalidable)
+            description, factory = rng.choice(attr.violations)
+            payload[attr.key] = factory(rng)
+            violation = Violation(attr.key, description)
+        item = model_cls.from_dict(payload, auto_validate=violation is None) if as_models else payload
+        yield (item, violation) if with_violations else item
+
+
+class _ModelPlanner:
+    """
+    Compiles the models into lists of value factories, so generating each payload is cheap
+    """
+
+    def __init__(self, factories: Dict[str, ValueFactory]) -> None:
+        self._factories = factories
+        self._plans: Dict[Tuple[type, int], List[_AttrPlan]] = {}
+
+    def plan(self, model_cls: type, depth: int) -> List[_AttrPlan]:
+        key = (model_cls, depth)
+        if key not in self._plans:
+            self._plans[key] = self._build_plan(model_cls, depth)
+        return self._plans[key]
+
+    def _build_plan(self, model_cls: type, depth: int) -> List[_AttrPlan]:
+        inner_cls = model_cls._get_inner_model()
+        if inner_cls is None:
+            PymodelioMeta.prepare(model_cls)
+            inner_cls = model_cls._get_inner_model()
+        plan = []
+        for attr_name, model_attr in inner_cls.__model_attrs__:
+            exposed_attr_names = inner_cls.__exposed_attrs__.get(attr_name)
+            if not model_attr.initable or not exposed_attr_names:
+                continue
+            key = exposed_attr_names[0]
+            factory = self._factories.get(key)
+            if factory is not None:
+                plan.append(_AttrPlan(key, factory, []))
+                continue
+            validator = model_attr.validator
+            if validator is None:
+                validator = DefaultValidatorsBuilder.build(model_attr.attr_type)
+            factory, violations = self._compile(validator, depth, _deserializes_nested_dicts(model_attr.attr_type))
+            plan.append(_AttrPlan(key, factory, violations))
+        return plan
+
+    def _compile(self, validator: Optional[Validator], depth: int,
+                 models_as_dicts: bool) -> Tuple[ValueFactory, List[tuple]]:
+        """
+        Returns a factory of valid values for the validator, and the descriptions and factories of its violations.
+        Nested models are generated as dicts if models_as_dicts is True, and as model instances otherwise.
+        """
+        if validator is None:
+            return _int_factory(0, 1000), []
+        factory = self._compile_valid(validator, depth, models_as_dicts)
+        violations = _violations(validator)
+        if validator.nullable:
+            return _nullable(factory), violations
+        return factory, [('must not be None', _constant(None))] + violations
+
+    def _compile_valid(self, validator: Validator, depth: int, models_as_dicts: bool) -> ValueFactory:  # noqa: C901
+        if isinstance(validator, EmailValidator):
+            return lambda rng: 'user%s@example.com' % rng.randrange(1_000_000_000)
+        if isinstance(validator, StringValidator):
+            return _string_factory(validator)
+        if isinstance(validator, BoolValidator):
+            return lambda rng: rng.random() < 0.5
+        if isinstance(validator, NumericValidator):
+            min_value, max_value = _numeric_range(validator)
+            if isinstance(validator, FloatValidator) or float in (validator._expected_types or ()):
+                return lambda rng: rng.uniform(min_value, max_value)
+            return _int_factory(int(min_value), int(max_value))
+        if isinstance(validator, DatetimeValidator):
+            return lambda rng: _random_datetime(rng).isoformat()
+        if isinstance(validator, DateValidator):
+            return lambda rng: _random_datetime(rng).date().isoformat()
+        if isinstance(validator, DiscriminatedUnionValidator):
+            return self._union_factory(validator, depth, models_as_dicts)
+        if isinstance(validator, LiteralValidator):
+            return lambda rng: rng.choice(validator.values)
+        if isinstance(validator, DictValidator):
+            return self._dict_factory(validator, depth, models_as_dicts)
+        if isinstance(validator, IterableValidator):
+            return self._iterable_factory(validator, depth, models_as_dicts)
+        return self._type_factory(validator._expected_types, depth, models_as_dicts)
+
+    def _union_factory(self, validator: DiscriminatedUnionValidator, depth: int,
+                       models_as_dicts: bool) -> ValueFactory:
+        # Variants declare their tags as Literal attributes, so the payload of each variant holds one of its own tags
+        variant_factory = self._type_factory(validator._get_variant_types(), depth, models_as_dicts)
+        if not validator.is_list:
+            return variant_factory
+        min_items = 0 if validator.allow_empty else 1
+        return lambda rng: [variant_factory(rng) for _ in range(rng.randint(min_items, DEFAULT_MAX_ITEMS))]
+
+    def _dict_factory(self, validator: DictValidator, depth: int, models_as_dicts: bool) -> ValueFactory:
+        if not validator._checks_entries:
+            return lambda rng: {'key%s' % i: rng.randrange(1000) for i in range(rng.randint(0, DEFAULT_MAX_ITEMS))}
+        key_factory = self._nested_factory(validator.keys_validator, validator.keys_type, depth, models_as_dicts)
+        value_factory = self._nested_factory(validator.values_validator, validator.values_type, depth, models_as_dicts)
+        # Repeated keys are merged, so the dicts may have less entries than the generated ones
+        return lambda rng: {key_factory(rng): value_factory(rng) for _ in range(rng.randint(0, DEFAULT_MAX_ITEMS))}
+
+    def _iterable_factory(self, validator: IterableValidator, depth: int, models_as_dicts: bool) -> ValueFactory:
+        if isinstance(validator, TupleValidator) and validator.items_validators is not None:
+            items_factories = [self._compile(x, depth, models_as_dicts)[0] for x in validator.items_validators]
+            return lambda rng: tuple(factory(rng) for factory in items_factories)
+        element_types = validator.elements_type if validator.elements_type != (None,) else None
+        element_factory = self._nested_factory(validator.elements_validator, element_types, depth, models_as_dicts)
+        min_items = 0 if validator.allow_empty else 1
+        container = list
+        # Sets of models are generated as lists when the models are dicts (from_dict builds the sets from them)
+        if isinstance(validator, SetValidator) and not models_as_dicts:
+            container = set
+        elif isinstance(validator, TupleValidator):
+            container = tuple
+        return lambda rng: container(element_factory(rng) for _ in range(rng.randint(min_items, DEFAULT_MAX_ITEMS)))
+
+    def _nested_factory(self, validator: Optional[Validator], types: Optional[tuple], depth: int,
+                        models_as_dicts: bool) -> ValueFactory:
+        # Values that are generics themselves (like the lists of a List[List[int]]) are checked by their own validator
+        if validator is not None:
+            return self._compile(validator, depth, models_as_dicts)[0]
+        return self._type_factory(types, depth, models_as_dicts)
+
+    def _type_factory(self, types: Optional[tuple], depth: int, models_as_dicts: bool) -> ValueFactory:
+        if not types:
+            return _int_factory(0, 1000)
+        factories = [self._single_type_factory(t, depth, models_as_dicts) for t in types]
+        if len(factories) == 1:
+            return factories[0]
+        return lambda rng: rng.choice(factories)(rng)
+
+    def _single_type_factory(self, value_type: type, depth: int, models_as_dicts: bool) -> ValueFactory:
+        if getattr(value_type, '__is_pymodelio_model__', False):
+            if depth >= MAX_DEPTH:
+                return _constant(None)
+
+            # Nested plans are built on first use, so self referencing models don't recurse forever
+            def payload_factory(rng: Random) -> dict:
+                return {attr.key: attr.factory(rng) for attr in self.plan(value_type, depth + 1)}
+
+            if models_as_dicts:
+                return payload_factory
+            return lambda rng: value_type.from_dict(payload_factory(rng), auto_validate=False)
+        # Only the dates of the attributes are parsed when deserializing, so the ones in collections are objects
+        if value_type is datetime:
+            return _random_datetime
+        if value_type is date:
+            return lambda rng: _random_datetime(rng).date()
+        if value_type in (str, int, float, bool, dict, list, set, tuple):
+            return self._compile_valid(DefaultValidatorsBuilder.build(value_type), depth, models_as_dicts)
+        return _constant(None)
+
+
+def _deserializes_nested_dicts(attr_type: Any) -> bool:
+    # from_dict deserializes the dicts of the models held at any level of lists, sets, tuples, optionals and the values
+    # of dicts (see build_converter), and of the unions of models (see build_unions)
+    if isinstance(attr_type, (str, ForwardRef)) or getattr(attr_type, '__is_pymodelio_model__', False):
+        return True
+    if get_models_union(attr_type) is not None:
+        return True
+    origin, args = get_origin(attr_type), get_args(attr_type)
+    if origin is dict:
+        return len(args) == 2 and _deserializes_nested_dicts(args[1])
+    if origin in (list, set, frozenset, tuple, Union, UnionType):
+        return any(_deserializes_nested_dicts(x) for x in args if x is not Ellipsis and x is not type(None))
+    return False
+
+
+def _constant(value: Any) -> ValueFactory:
+    return lambda rng: value
+
+
+def _nullable(factory: ValueFactory) -> ValueFactory:
+    return lambda rng: None if rng.random() < 0.1 else factory(rng)
+
+
+def _int_factory(min_value: int, max_value: int) -> ValueFactory:
+    return lambda rng: rng.randint(min_value, max_value)
+
+
+def _numeric_range(validator: NumericValidator) -> Tuple[float, float]:
+    min_value, max_value = validator.min_value, validator.max_value
+    if min_value is None and max_value is None:
+        return 0, 1000
+    if min_value is None:
+        return max_value - 1000, max_value
+    if max_value is None:
+        return min_value, min_value + 1000
+    return min_value, max_value
+
+
+def _length_range(validator: StringValidator) -> Tuple[int, int]:
+    if validator.fixed_len is not None:
+        return validator.fixed_len, validator.fixed_len
+    min_len = validator.min_len if validator.min_len is not None else 1
+    max_len = validator.max_len if validator.max_len is not None else max(min_len, DEFAULT_MAX_LEN)
+    return min_len, max_len
+
+
+def _string_factory(validator: StringValidator) -> ValueFactory:
+    min_len, max_len = _length_range(validator)
+    alphabet = ascii_letters + digits
+    if validator.regex is not None:
+        alphabet = _find_alphabet(validator.regex, min_len, max_len)
+    return lambda rng: ''.join(rng.choices(alphabet, k=rng.randint(min_len, max_len)))
+
+
+def _find_alphabet(regex: str, min_len: int, max_len: int) -> str:
+    pattern = re.compile(regex)
+    rng = Random(0)
+    for alphabet in _ALPHABETS:
+        if all(pattern.match(''.join(rng.choices(alphabet, k=rng.randint(min_len, max_len)))) is not None
+               for _ in range(_REGEX_ATTEMPTS)):
+            return alphabet
+    raise ValueError('Can not generate strings matching %r, provide a factory for the attribute' % regex)
+
+
+def _random_datetime(rng: Random) -> datetime:
+    return _MIN_DATETIME + timedelta(seconds=rng.randrange(_DATETIME_RANGE_SECONDS))
+
+
+def _violations(validator: Validator) -> List[Tuple[str, ValueFactory]]:  # noqa: C901
+    """
+    Returns the descriptions and factories of values violating the constraints of the validator
+    """
+    violations = []
+    expected_types = validator._expected_types
+    if expected_types is not None:
+        wrong_value = next(x for x in _WRONG_TYPE_VALUES if not isinstance(x, expected_types))
+        violations.append(('is not instance of %s' % ' or '.join(t.__name__ for t in expected_types),
+                           _constant(wrong_value)))
+    if isinstance(validator, NumericValidator):
+        step = 1 if not isinstance(validator, FloatValidator) else 0.5
+        if validator.min_value is not None:
+            violations.append(('is less than %s' % validator.min_value, _constant(validator.min_value - step)))
+        if validator.max_value is not None:
+            violations.append(('is greater than %s' % validator.max_value, _constant(validator.max_value + step)))
+    elif isinstance(validator, StringValidator):
+        min_len, max_len = _length_range(validator)
+        if min_len > 0 and (validator.min_len is not None or validator.fixed_len is not None):
+            violations.append(('is too short', _constant('')))
+        if validator.max_len is not None or validator.fixed_len is not None:
+            violations.append(('is too long', _constant('x' * (max_len + 1))))
+    elif isinstance(validator, ListValidator) and not validator.allow_empty:
+        violations.append(('must not be empty', _constant([])))
+    return violations
@@ -0,0 +1,4 @@
+# flake8: noqa
+from .trace_event import TraceEvent
+from .tracer import Tracer
+from .hooks import set_tracer, get_tracer
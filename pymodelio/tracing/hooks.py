@@ -0,0 +1,219 @@
+from contextvars import ContextVar
+from functools import partial, wraps
+from itertools import count
+from time import perf_counter
+from typing import Any, Callable, Iterator, Optional
+
+from pymodelio import instrumentation
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+from pymodelio.tracing.trace_event import TraceEvent
+from pymodelio.tracing.tracer import Tracer
+
+_INSTRUMENTATION_KEY = 'tracing'
+
+# Traced PymodelioModel methods and the operation they are traced as. Bulk methods are traced once per call, except
+# from_cursor, which is traced once per fetched batch of rows.
+_TRACED_OPERATIONS = {
+    'from_dict': 'from_dict',
+    'validate': 'validate',
+    'to_dict': 'to_dict',
+    'construct': 'construct',
+    'try_from_dict_many': 'try_from_dict_many',
+    'from_rows': 'from_rows',
+    '_from_cursor_batch': 'from_cursor',
+    'from_columns': 'from_columns',
+    'from_numpy': 'from_numpy',
+    'from_bytes_many': 'from_bytes_many',
+    'to_columns': 'to_columns',
+    'to_numpy': 'to_numpy',
+}
+
+# Traced PymodelioModel methods returning generators, whose whole iteration is traced as a single call
+_TRACED_ITERATIONS = ('iter_csv', 'try_iter_csv', 'to_rows')
+
+# Arguments holding the payload of the operations, whose size is estimated (for dicts) or is their length (for the
+# batches of the bulk operations)
+_PAYLOAD_ARGS = {'from_dict': 'data', 'from_columns': 'columns'}
+_BATCH_ARGS = {
+    'try_from_dict_many': 'rows', 'from_rows': 'rows', 'from_numpy': 'array', 'from_bytes_many': 'data',
+    'to_columns': 'models', 'to_numpy': 'models', 'to_rows': 'models'
+}
+
+# Depth of the next traced call of the current execution context. Calls made while running an unsampled call are not
+# traced, so the whole call tree of a sampled call is traced.
+_UNSAMPLED = -1
+_depth: ContextVar[int] = ContextVar('pymodelio_tracing_depth', default=0)
+
+_tracer: Optional[Tracer] = None
+_sample_every = 1
+_calls = count()
+
+
+def set_tracer(tracer: Optional[Tracer], sample_every: int = 1) -> None:
+    """
+    Sets the tracer receiving the start and end events of from_dict, validate, to_dict, construct and the bulk
+    operations (like from_rows or iter_csv) calls. Only 1 out of sample_every calls made from outside pymodelio is
+    traced (including the calls it makes to nested models). Setting None (or a plain Tracer) removes the tracing
+    hooks, so models run without any overhead.
+    """
+    global _tracer, _sample_every, _calls
+    if sample_every < 1:
+        raise ValueError('sample_every must be greater than 0')
+    instrumentation.uninstall(_INSTRUMENTATION_KEY)
+    if tracer is None or type(tracer) is Tracer:
+        _tracer = None
+        return
+    _tracer = tracer
+    _sample_every = sample_every
+    _calls = count()
+    for method_name, operation in _TRACED_OPERATIONS.items():
+        instrumentation.install(_INSTRUMENTATION_KEY, method_name, partial(_trace_model_method, operation))
+    for operation in _TRACED_ITERATIONS:
+        instrumentation.install(_INSTRUMENTATION_KEY, operation, partial(_trace_model_iteration, operation))
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def estimate_size(payload: Any) -> Optional[int]:
+    """
+    Cheap estimation of the size of a payload, counting the values in its first two levels
+    """
+    if isinstance(payload, dict):
+        values = payload.values()
+    elif isinstance(payload, (list, tuple)):
+        values = payload
+    else:
+        return None
+    size = len(values)
+    for value in values:
+        if isinstance(value, (dict, list, tuple)):
+            size += len(value)
+    return size
+
+
+def _model_name(model_or_cls: Any) -> str:
+    cls = model_or_cls if isinstance(model_or_cls, type) else type(model_or_cls)
+    cls = cls.__pymodelio_parent__ or cls
+    return '%s.%s' % (cls.__module__, cls.__qualname__)
+
+
+def _payload_size(operation: str, model_or_cls: Any, args: tuple, kwargs: dict) -> Optional[int]:
+    if operation in _PAYLOAD_ARGS:
+        return estimate_size(args[0] if args else kwargs.get(_PAYLOAD_ARGS[operation]))
+    if operation in _BATCH_ARGS:
+        batch = args[0] if args else kwargs.get(_BATCH_ARGS[operation])
+        return len(batch) if hasattr(batch, '__len__') else None
+    if operation == 'from_cursor':
+        # The batch of fetched rows
+        return len(args[1])
+    if operation == 'construct':
+        return estimate_size(kwargs)
+    if operation in ('validate', 'to_dict'):
+        # They work with the attributes of an instance
+        attr_values_getter = model_or_cls.__attr_values_getter__
+        return None if attr_values_getter is None else estimate_size(attr_values_getter(model_or_cls))
+    return None
+
+
+def _outcome(operation: str, result: Any) -> str:
+    if operation == 'try_from_dict_many' and not all(row.is_valid for row in result):
+        return TraceEvent.INVALID
+    return TraceEvent.OK
+
+
+def _trace_model_method(operation: str, method: Callable) -> Callable:
+    @wraps(method)
+    def traced(model_or_cls: Any, *args, **kwargs) -> Any:
+        depth = _depth.get()
+        if depth == _UNSAMPLED:
+            return method(model_or_cls, *args, **kwargs)
+        if depth == 0 and next(_calls) % _sample_every:
+            token = _depth.set(_UNSAMPLED)
+            try:
+                return method(model_or_cls, *args, **kwargs)
+            finally:
+                _depth.reset(token)
+        return _run_traced(operation, method, model_or_cls, depth, args, kwargs)
+
+    return traced
+
+
+def _run_traced(operation: str, method: Callable, model_or_cls: Any, depth: int, args: tuple, kwargs: dict) -> Any:
+    tracer = _tracer
+    event = TraceEvent(operation, _model_name(model_or_cls), _payload_size(operation, model_or_cls, args, kwargs),
+                       depth)
+    tracer.on_start(event)
+    token = _depth.set(depth + 1)
+    start = perf_counter()
+    try:
+        result = method(model_or_cls, *args, **kwargs)
+        event.outcome = _outcome(operation, result)
+        return result
+    except ModelValidationException:
+        event.outcome = TraceEvent.INVALID
+        raise
+    except Exception:
+        event.outcome = TraceEvent.ERROR
+        raise
+    finally:
+        event.duration = perf_counter() - start
+        _depth.reset(token)
+        tracer.on_end(event)
+
+
+def _trace_model_iteration(operation: str, method: Callable) -> Callable:
+    @wraps(method)
+    def traced(model_or_cls: Any, *args, **kwargs) -> Iterator[Any]:
+        return _iterate_traced(operation, model_or_cls, method(model_or_cls, *args, **kwargs), args, kwargs)
+
+    return traced
+
+
+def _iterate_traced(operation: str, model_or_cls: Any, iterator: Iterator[Any], args: tuple,
+                    kwargs: dict) -> Iterator[Any]:
+    # The items are consumed outside of the traced call, so the depth is only set while each item is generated, and
+    # the duration is the time spent generating them
+    depth = _depth.get()
+    if depth == 0 and next(_calls) % _sample_every:
+        depth = _UNSAMPLED
+    if depth == _UNSAMPLED:
+        yield from _iterate_at_depth(iterator, _UNSAMPLED, [0.0])
+        return
+    tracer = _tracer
+    event = TraceEvent(operation, _model_name(model_or_cls), _payload_size(operation, model_or_cls, args, kwargs),
+                       depth)
+    tracer.on_start(event)
+    duration = [0.0]
+    outcome = TraceEvent.OK
+    try:
+        for item in _iterate_at_depth(iterator, depth + 1, duration):
+            if operation == 'try_iter_csv' and not item.is_valid:
+                outcome = TraceEvent.INVALID
+            yield item
+    except ModelValidationException:
+        outcome = TraceEvent.INVALID
+        raise
+    except Exception:
+        outcome = TraceEvent.ERROR
+        raise
+    finally:
+        # Iterations stopped before being exhausted end here too
+        event.outcome = outcome
+        event.duration = duration[0]
+        tracer.on_end(event)
+
+
+def _iterate_at_depth(iterator: Iterator[Any], depth: int, duration: list) -> Iterator[Any]:
+    while True:
+        token = _depth.set(depth)
+        start = perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            duration[0] += perf_counter() - start
+            _depth.reset(token)
+        yield item
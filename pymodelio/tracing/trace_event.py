@@ -0,0 +1,30 @@
+from typing import Any, Optional
+
+
+class TraceEvent:
+    """
+    Traced call of a model operation. The same event is passed to the start and end hooks of the tracer, so tracers
+    can store their own data (for instance, a span) in `span`. `outcome` and `duration` are set before the end hook is
+    called.
+    """
+    __slots__ = ('operation', 'model', 'payload_size', 'depth', 'outcome', 'duration', 'span')
+
+    OK = 'ok'
+    INVALID = 'invalid'
+    ERROR = 'error'
+
+    def __init__(self, operation: str, model: str, payload_size: Optional[int], depth: int) -> None:
+        self.operation = operation
+        self.model = model
+        # Amount of values in the first two levels of the payload (or of rows, models or bytes, for bulk operations)
+        self.payload_size = payload_size
+        # 0 for a call made from outside pymodelio, 1 for the models it deserializes, etc.
+        self.depth = depth
+        self.outcome: Optional[str] = None
+        self.duration: Optional[float] = None
+        self.span: Any = None
+
+    def __repr__(self) -> str:
+        return 'TraceEvent(operation=%r, model=%r, payload_size=%r, depth=%r, outcome=%r, duration=%r)' % (
+            self.operation, self.model, self.payload_size, self.depth, self.outcome, self.duration
+        )
@@ -0,0 +1,14 @@
+from pymodelio.tracing.trace_event import TraceEvent
+
+
+class Tracer:
+    """
+    Interface to be implemented by tracing integrations. This base implementation does nothing, and setting it as the
+    tracer is the same as removing the current one.
+    """
+
+    def on_start(self, event: TraceEvent) -> None:
+        return
+
+    def on_end(self, event: TraceEvent) -> None:
+        return
@@ -0,0 +1,146 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymodelio.discriminators import get_models_union, split_union, resolve_variants, build_tag_table
+from pymodelio.exceptions.discriminator_exception import DiscriminatorException
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+
+# Maximum amount of variants fully deserialized for a payload before giving up on it
+MAX_ATTEMPTS = 3
+
+# Maximum amount of key sets whose candidate variants are remembered by an untagged union
+MAX_FINGERPRINTS = 1024
+
+
+class TaggedUnion:
+    """
+    Deserializes payloads into the variant registered for the tag they hold under the discriminator key
+    """
+    __slots__ = ('discriminator', 'models_by_tag')
+
+    def __init__(self, discriminator: str, models_by_tag: Dict[Any, type]) -> None:
+        self.discriminator = discriminator
+        self.models_by_tag = models_by_tag
+
+    def deserialize(self, value: Any, trusted: bool = False) -> Any:
+        if isinstance(value, list):
+            return [self._deserialize_variant(x, trusted) for x in value]
+        return self._deserialize_variant(value, trusted)
+
+    def _deserialize_variant(self, value: Any, trusted: bool) -> Any:
+        # Values with an unknown tag are left as they are, so they fail when validated
+        if isinstance(value, dict):
+            try:
+                model = self.models_by_tag.get(value.get(self.discriminator))
+            except TypeError:
+                model = None
+            if model is not None:
+                return model.from_dict(value, auto_validate=False, trusted=trusted)
+        return value
+
+
+class UntaggedUnion:
+    """
+    Deserializes payloads into the first variant they are valid for. The variants a payload may be valid for are
+    pre-filtered by its keys (they must contain the keys of the required attributes of the variant), and they are
+    tried in an order learned from the variants that succeeded for payloads with the same keys. Only the first
+    max_attempts candidates are tried, so the cost of payloads that are not valid for any variant is bounded.
+    Trusted payloads are deserialized into their first candidate.
+    """
+    __slots__ = ('variants', 'max_attempts', '_owner', '_keys', '_candidates')
+
+    def __init__(self, variants: tuple, owner: Optional[type] = None, max_attempts: int = MAX_ATTEMPTS) -> None:
+        self.variants = variants
+        self.max_attempts = max_attempts
+        self._owner = owner
+        # (variant, required keys, known keys) of each variant, computed when the first payload is deserialized
+        self._keys: Optional[List[Tuple[type, List[tuple], frozenset]]] = None
+        # Candidates as [variant, successes] lists, by the keys of the payloads
+        self._candidates: Dict[frozenset, List[list]] = {}
+
+    def deserialize(self, value: Any, trusted: bool = False) -> Any:
+        if isinstance(value, list):
+            return [self._deserialize_variant(x, trusted) for x in value]
+        return self._deserialize_variant(value, trusted)
+
+    def _deserialize_variant(self, value: Any, trusted: bool) -> Any:
+        if not isinstance(value, dict):
+            return value
+        candidates = self._get_candidates(value)
+        if len(candidates) == 1 or (trusted and candidates):
+            # The only candidate is validated along with the model holding it, and trusted payloads are not validated,
+            # so they are deserialized into the candidate that is most likely to match them
+            return candidates[0][0].from_dict(value, auto_validate=False, trusted=trusted)
+        # The candidates are validated in the validation pass of the model holding them (see
+        # ModelDeserializer.deserialize), so the one that succeeds is not validated again along with that model
+        for i in range(min(len(candidates), self.max_attempts)):
+            candidate = candidates[i]
+            try:
+                model = candidate[0].try_from_dict(value).value
+            except ModelValidationException:
+                model = None
+            if model is not None:
+                candidate[1] += 1
+                # Variants that succeed more often move towards the front
+                if i > 0 and candidate[1] > candidates[i - 1][1]:
+                    candidates[i - 1], candidates[i] = candidate, candidates[i - 1]
+                return model
+        return value
+
+    def _get_candidates(self, value: dict) -> List[list]:
+        # The order of the keys doesn't matter for finding the candidates
+        fingerprint = frozenset(value)
+        candidates = self._candidates.get(fingerprint)
+        if candidates is None:
+            candidates = self._find_candidates(value)
+            if len(self._candidates) < MAX_FINGERPRINTS:
+                self._candidates[fingerprint] = candidates
+        return candidates
+
+    def _find_candidates(self, value: dict) -> List[list]:
+        if self._keys is None:
+            self._keys = [_get_variant_keys(x) for x in resolve_variants(self.variants, self._owner)]
+        scored = []
+        for i, (variant, required_keys, known_keys) in enumerate(self._keys):
+            if all(any(x in value for x in names) for names in required_keys):
+                # Variants knowing more keys of the payload are tried first
+                scored.append((-len(known_keys.intersection(value)), i, variant))
+        return [[variant, 0] for _, _, variant in sorted(scored)]
+
+
+def _get_variant_keys(variant: type) -> Tuple[type, List[tuple], frozenset]:
+    # Imported here, as the models depend on this module
+    from pymodelio.pymodelio_meta import PymodelioMeta
+
+    if not getattr(variant, '__is_pymodelio_model__', False):
+        raise DiscriminatorException('Union variants must be models, but %s was provided' % variant)
+    inner_cls = variant._get_inner_model() or PymodelioMeta.prepare(variant)
+    required_keys = []
+    known_keys = set()
+    for attr_name, model_attr in inner_cls.__model_attrs__:
+        if not model_attr.initable:
+            continue
+        names = inner_cls.__exposed_attrs__.get(attr_name)
+        known_keys.update(names)
+        validator = model_attr.validator
+        if validator is not None and not validator.nullable and not model_attr.has_default_factory:
+            required_keys.append(names)
+    return variant, required_keys, frozenset(known_keys)
+
+
+def build_unions(pmcls: type, model_attrs: dict) -> dict:
+    """
+    Returns the deserializers of the attributes of the model holding unions of models, by attribute name
+    """
+    unions = {}
+    for attr_name, model_attr in model_attrs.items():
+        if model_attr.discriminator is not None:
+            variants, _, _ = split_union(model_attr.attr_type)
+            unions[attr_name] = TaggedUnion(
+                model_attr.discriminator,
+                build_tag_table(resolve_variants(variants, pmcls), model_attr.discriminator)
+            )
+        else:
+            union_variants = get_models_union(model_attr.attr_type)
+            if union_variants is not None:
+                unions[attr_name] = UntaggedUnion(union_variants[0], owner=pmcls)
+    return unions
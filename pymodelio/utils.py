@@ -1,17 +1,56 @@
 from datetime import timezone, datetime, date
-
-import ciso8601
+from typing import Callable, Dict, Optional
 
 from pymodelio import PymodelioSetting, PymodelioSettings
 
+# Parser of ISO 8601 datetimes, imported the first time a date is parsed
+_parse_datetime: Optional[Callable[[str], datetime]] = None
+
+# Datetime and date converters, specialized once per combination of the settings they depend on
+_datetime_converters: Dict[bool, Callable[[str], datetime]] = {}
+
+
+def _import_datetime_parser() -> Callable[[str], datetime]:
+    try:
+        import ciso8601
+        return ciso8601.parse_datetime
+    except ImportError:
+        return _parse_datetime_from_isoformat
+
+
+def _parse_datetime_from_isoformat(str_datetime: str) -> datetime:
+    # Before Python 3.11, fromisoformat doesn't support the Z suffix
+    if str_datetime.endswith(('Z', 'z')):
+        str_datetime = str_datetime[:-1] + '+00:00'
+    return datetime.fromisoformat(str_datetime)
+
+
+def _get_datetime_parser() -> Callable[[str], datetime]:
+    global _parse_datetime
+    if _parse_datetime is None:
+        _parse_datetime = _import_datetime_parser()
+    return _parse_datetime
+
+
+def get_datetime_converter(parse_dates_as_utc: bool) -> Callable[[str], datetime]:
+    """
+    Returns the function converting strings to datetimes for the AUTO_PARSE_DATES_AS_UTC setting value
+    """
+    converter = _datetime_converters.get(parse_dates_as_utc)
+    if converter is None:
+        parse_datetime = _get_datetime_parser()
+        if parse_dates_as_utc:
+            def converter(str_datetime: str) -> datetime:
+                return parse_datetime(str_datetime).replace(tzinfo=timezone.utc)
+        else:
+            converter = parse_datetime
+        _datetime_converters[parse_dates_as_utc] = converter
+    return converter
+
 
 def to_date(str_date: str) -> date:
-    dt = to_datetime(str_date)
-    return dt.date()
+    return _get_datetime_parser()(str_date).date()
 
 
 def to_datetime(str_datetime: str) -> datetime:
-    dt = ciso8601.parse_datetime(str_datetime)
-    if PymodelioSettings.get(PymodelioSetting.AUTO_PARSE_DATES_AS_UTC):
-        return dt.replace(tzinfo=timezone.utc)
-    return dt
+    return get_datetime_converter(PymodelioSettings.get(PymodelioSetting.AUTO_PARSE_DATES_AS_UTC))(str_datetime)
@@ -0,0 +1,113 @@
+from contextvars import ContextVar
+from itertools import count
+from typing import Any, List, Optional
+
+from pymodelio.constants import UNDEFINED
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+from pymodelio.exceptions.validation_error import ValidationError, format_path
+from pymodelio.settings.pymodelio_setting import PymodelioSetting
+from pymodelio.settings.pymodelio_settings import PymodelioSettings
+from pymodelio.validation_policy import ValidationPolicy
+
+_epochs = count(1)
+
+_current_context: ContextVar[Optional['ValidationContext']] = ContextVar('pymodelio_validation_context',
+                                                                         default=None)
+
+
+class ValidationPath(list):
+    """
+    Path of the value being validated, stored as a stack of keys whose first element is the root of the path.
+    The same instance is passed down to validators while the structure is traversed, so the path is only formatted
+    as a string when a failure is reported.
+    """
+    __slots__ = ()
+
+    @property
+    def root(self) -> Any:
+        return self[0]
+
+    @property
+    def keys(self) -> tuple:
+        return tuple(self[1:])
+
+    def __str__(self) -> str:
+        return format_path(self[0], self[1:])
+
+
+class ValidationContext:
+    """
+    State of a validation pass. Models validated within a pass are marked with its epoch, so they are validated only
+    once even if they are referenced from multiple places of the validated structure. When `collect_errors` is
+    enabled, failures are accumulated in `errors` instead of aborting the pass on the first one. `policy` is the
+    ValidationPolicy applied to the collections being validated, which is read from the settings the first time a
+    collection needs it.
+    """
+    __slots__ = ('epoch', 'path', 'collect_errors', 'errors', 'policy', '_token')
+
+    def __init__(self, root: Any, collect_errors: bool = False,
+                 outer: Optional['ValidationContext'] = None) -> None:
+        self.epoch = next(_epochs) if outer is None else outer.epoch
+        self.path = ValidationPath((root,))
+        self.collect_errors = collect_errors
+        self.errors: List[ValidationError] = []
+        self.policy = UNDEFINED if outer is None else outer.policy
+        self._token = None
+
+    def __enter__(self) -> 'ValidationContext':
+        self._token = _current_context.set(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        _current_context.reset(self._token)
+
+    def get_policy(self) -> ValidationPolicy:
+        policy = self.policy
+        if policy is UNDEFINED:
+            policy = self.policy = PymodelioSettings.get(PymodelioSetting.VALIDATION_POLICY)
+        return policy
+
+    def record(self, exception: ModelValidationException) -> None:
+        if exception.errors:
+            self.errors.extend(exception.errors)
+            return
+        # Exceptions raised manually (for instance, from __when_validating_an_attr__) only contain a message, which
+        # usually starts with the path of the attribute
+        message = exception.args[0] if exception.args else ''
+        prefix = '%s ' % self.path
+        if isinstance(message, str) and message.startswith(prefix):
+            message = message[len(prefix):]
+        self.errors.append(ValidationError(self.path.root, self.path.keys, message))
+
+    def raise_errors(self) -> None:
+        if self.errors:
+            raise ModelValidationException(errors=self.errors)
+
+
+def current_context() -> Optional[ValidationContext]:
+    """
+    Returns the validation context running in the current execution context, or None if there is no validation pass
+    running
+    """
+    return _current_context.get()
+
+
+def path_error(path: Any, message: str) -> ValidationError:
+    if isinstance(path, ValidationPath):
+        return ValidationError(path.root, path.keys, message)
+    return ValidationError(path, tuple(), message)
+
+
+def check_model(value: Any, context: ValidationContext) -> bool:
+    """
+    Validates a nested model (or any other object implementing validate) within the provided context, without raising
+    """
+    validate_in_context = getattr(value, '_validate_in_context', None)
+    if validate_in_context is not None:
+        return validate_in_context(context)
+    try:
+        value.validate(context.path)
+    except ModelValidationException as e:
+        context.record(e)
+        return False
+    return True
@@ -0,0 +1,75 @@
+from collections import namedtuple
+from math import ceil
+from typing import Optional, Sequence, Union
+
+FULL_MODE = 'full'
+SAMPLE_MODE = 'sample'
+FIRST_N_MODE = 'first_n'
+
+
+class ValidationPolicy(namedtuple('_ValidationPolicy', 'mode size seed')):
+    """
+    Policy deciding which elements of a collection are checked when it gets validated. `full()` checks all of them,
+    `sample(size, seed)` checks a random sample of them (`size` is an amount of elements or a fraction of the
+    collection) and `first_n(n)` checks the first n of them.
+    """
+    __slots__ = ()
+
+    mode: str
+    size: Union[int, float, None]
+    seed: Optional[int]
+
+    @classmethod
+    def full(cls) -> 'ValidationPolicy':
+        return FULL
+
+    @classmethod
+    def sample(cls, size: Union[int, float], seed: Optional[int] = None) -> 'ValidationPolicy':
+        if isinstance(size, bool) or not isinstance(size, (int, float)) or size < 0 or \
+                (isinstance(size, float) and size > 1):
+            raise ValueError('The size of a sample must be an amount of elements or a fraction between 0 and 1')
+        return cls(SAMPLE_MODE, size, seed)
+
+    @classmethod
+    def first_n(cls, n: int) -> 'ValidationPolicy':
+        if isinstance(n, bool) or not isinstance(n, int) or n < 0:
+            raise ValueError('The amount of elements to check must be a non negative int')
+        return cls(FIRST_N_MODE, n, None)
+
+    @property
+    def is_full(self) -> bool:
+        return self.mode == FULL_MODE
+
+    def select(self, length: int) -> Optional[Sequence[int]]:
+        """
+        Returns the indexes of the elements to check of a collection of the provided length, or None if all of them
+        must be checked. Sampled indexes are returned in the order they are drawn (which is the same for the same seed)
+        rather than sorted, so selecting them takes O(k) time.
+        """
+        if self.mode == FIRST_N_MODE:
+            return None if length <= self.size else range(self.size)
+        if self.mode != SAMPLE_MODE:
+            return None
+        size = ceil(self.size * length) if isinstance(self.size, float) else self.size
+        if size >= length:
+            return None
+        # Imported here, as it is only needed for sampling
+        from random import Random
+        return Random(self.seed).sample(range(length), size)
+
+    def __copy__(self) -> 'ValidationPolicy':
+        return self
+
+    def __deepcopy__(self, memo: dict) -> 'ValidationPolicy':
+        # Policies are immutable, and FULL is compared by identity
+        return self
+
+    def __str__(self) -> str:
+        if self.mode == SAMPLE_MODE:
+            return 'sample(%s, seed=%s)' % (self.size, self.seed)
+        if self.mode == FIRST_N_MODE:
+            return 'first_n(%s)' % self.size
+        return self.mode
+
+
+FULL = ValidationPolicy(FULL_MODE, None, None)
@@ -0,0 +1,19 @@
+from collections import namedtuple
+from typing import Any, List
+
+from pymodelio.exceptions.validation_error import ValidationError
+
+
+class ValidationResult(namedtuple('_ValidationResult', 'value errors')):
+    """
+    Result of the non-raising validation API. `value` is the validated model (None if it is not valid) and `errors`
+    the list of found ValidationError.
+    """
+    __slots__ = ()
+
+    value: Any
+    errors: List[ValidationError]
+
+    @property
+    def is_valid(self) -> bool:
+        return len(self.errors) == 0
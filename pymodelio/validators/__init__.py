@@ -1,16 +1,47 @@
 # flake8: noqa
-from .validator import Validator
-from .bool_validator import BoolValidator
-from .date_validator import DateValidator
-from .datetime_validator import DatetimeValidator
-from .dict_validator import DictValidator
-from .string_validator import StringValidator
-from .email_validator import EmailValidator
-from .numeric_validator import NumericValidator
-from .float_validator import FloatValidator
-from .int_validator import IntValidator
-from .iterable_validator import IterableValidator
-from .list_validator import ListValidator
-from .set_validator import SetValidator
-from .tuple_validator import TupleValidator
-from .forward_ref_validator import ForwardRefValidator
+from pymodelio.lazy_imports import lazy_getattr
+
+_LAZY_NAMES = {
+    'Validator': ('.validator', 'Validator'),
+    'BoolValidator': ('.bool_validator', 'BoolValidator'),
+    'DateValidator': ('.date_validator', 'DateValidator'),
+    'DatetimeValidator': ('.datetime_validator', 'DatetimeValidator'),
+    'DictValidator': ('.dict_validator', 'DictValidator'),
+    'StringValidator': ('.string_validator', 'StringValidator'),
+    'EmailValidator': ('.email_validator', 'EmailValidator'),
+    'NumericValidator': ('.numeric_validator', 'NumericValidator'),
+    'FloatValidator': ('.float_validator', 'FloatValidator'),
+    'IntValidator': ('.int_validator', 'IntValidator'),
+    'IterableValidator': ('.iterable_validator', 'IterableValidator'),
+    'ListValidator': ('.list_validator', 'ListValidator'),
+    'SetValidator': ('.set_validator', 'SetValidator'),
+    'TupleValidator': ('.tuple_validator', 'TupleValidator'),
+    'ForwardRefValidator': ('.forward_ref_validator', 'ForwardRefValidator'),
+    'LiteralValidator': ('.literal_validator', 'LiteralValidator'),
+    'DiscriminatedUnionValidator': ('.discriminated_union_validator', 'DiscriminatedUnionValidator'),
+}
+
+__all__ = tuple(_LAZY_NAMES)
+
+__getattr__ = lazy_getattr(__name__, globals(), _LAZY_NAMES)
+
+# Imported by type checkers and IDEs only, as typing is expensive to import
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .validator import Validator
+    from .bool_validator import BoolValidator
+    from .date_validator import DateValidator
+    from .datetime_validator import DatetimeValidator
+    from .dict_validator import DictValidator
+    from .string_validator import StringValidator
+    from .email_validator import EmailValidator
+    from .numeric_validator import NumericValidator
+    from .float_validator import FloatValidator
+    from .int_validator import IntValidator
+    from .iterable_validator import IterableValidator
+    from .list_validator import ListValidator
+    from .set_validator import SetValidator
+    from .tuple_validator import TupleValidator
+    from .forward_ref_validator import ForwardRefValidator
+    from .literal_validator import LiteralValidator
+    from .discriminated_union_validator import DiscriminatedUnionValidator
@@ -1,3 +1,4 @@
+import types
 import typing
 from collections import namedtuple
 from datetime import datetime, date
@@ -8,9 +9,13 @@ from pymodelio.validators import Validator, StringValidator, FloatValidator, Int
     DictValidator, ListValidator, DatetimeValidator, SetValidator, TupleValidator
 from pymodelio.validators.date_validator import DateValidator
 from pymodelio.validators.forward_ref_validator import ForwardRefValidator
+from pymodelio.validators.literal_validator import LiteralValidator
 
-# We use namedtuple for performance
-_DestructuredType = namedtuple('_DestructuredType', 'outer outer_nullable inners')
+# We use namedtuple for performance. is_fixed is True for tuples with a type for each position, like Tuple[int, str]
+_DestructuredType = namedtuple('_DestructuredType', 'outer outer_nullable inners is_fixed', defaults=(False,))
+
+# Generics of the builtin types (for instance, list[int]) are destructured like their typing equivalents
+_BUILTIN_GENERICS = {list: typing.List, set: typing.Set, tuple: typing.Tuple, dict: typing.Dict}
 
 
 class DefaultValidatorsBuilder:
@@ -44,6 +49,8 @@ class DefaultValidatorsBuilder:
             return _DestructuredType(outer=attr_type, outer_nullable=False, inners=[])
         if attr_type == typing.Any:
             return _DestructuredType(outer=typing.Any, outer_nullable=False, inners=[])
+        if isinstance(attr_type, types.GenericAlias) and attr_type.__origin__ in _BUILTIN_GENERICS:
+            return cls._destructurate(_BUILTIN_GENERICS[attr_type.__origin__][attr_type.__args__])
         # typing.ForwardRef
         if isinstance(attr_type, typing.ForwardRef):
             return _DestructuredType(outer=typing.ForwardRef, outer_nullable=False, inners=[attr_type])
@@ -72,10 +79,19 @@ class DefaultValidatorsBuilder:
                         else:
                             inners.append(cls._destructurate(x))
                     return _DestructuredType(outer=typing.Union, outer_nullable=is_nullable, inners=inners)
+            if _type == typing.Tuple and isinstance(args, tuple):
+                # Variadic tuple (Tuple[int, ...])
+                if len(args) == 2 and args[1] is Ellipsis:
+                    return _DestructuredType(outer=_type, outer_nullable=True, inners=[cls._destructurate(args[0])])
+                return _DestructuredType(outer=_type, outer_nullable=True, inners=[
+                    cls._destructurate(x) for x in args
+                ], is_fixed=True)
             if _type in (typing.List, typing.Tuple, typing.Set):
                 return _DestructuredType(outer=_type, outer_nullable=True, inners=[cls._destructurate(args)])
             if _type == typing.Dict:
-                return _DestructuredType(outer=dict, outer_nullable=False, inners=[])
+                return _DestructuredType(outer=_type, outer_nullable=False, inners=[
+                    cls._destructurate(x) for x in args
+                ])
         return _DestructuredType(outer=attr_type, outer_nullable=False, inners=[])
 
     @classmethod
@@ -89,26 +105,48 @@ class DefaultValidatorsBuilder:
             return cls._instantiate_from_destructured(destructured.inners[0], nullable=True)
         if destructured.outer == typing.Union:
             return Validator(expected_type=[x.outer for x in destructured.inners], nullable=destructured.outer_nullable)
+        if destructured.is_fixed:
+            return TupleValidator(items_validators=[cls._instantiate_from_destructured(x) for x in destructured.inners],
+                                  nullable=nullable)
         if destructured.outer in (typing.List, typing.Set, typing.Tuple):
-            return cls._instantiate_iterable(
-                destructured.outer,
-                destructured.inners[0].outer if destructured.inners else None,
-                nullable
-            )
+            return cls._instantiate_iterable(destructured.outer, destructured.inners[0], nullable)
+        if destructured.outer == typing.Dict:
+            keys_type, keys_validator = cls._instantiate_element(destructured.inners[0])
+            values_type, values_validator = cls._instantiate_element(destructured.inners[1])
+            return DictValidator(keys_type=keys_type, values_type=values_type, keys_validator=keys_validator,
+                                 values_validator=values_validator, nullable=nullable)
         return Validator(nullable=nullable)
 
     @classmethod
-    def _instantiate_iterable(cls, special_form: _SpecialForm, elements_type: type, nullable: bool) -> Validator:
-        if elements_type in (typing.Optional,):
+    def _instantiate_iterable(cls, special_form: _SpecialForm, elements: _DestructuredType,
+                              nullable: bool) -> Validator:
+        if elements.outer in (typing.Optional,):
             raise AutoValidatorCreationException(
                 f'Can not automatically instantiate a validator for type {str(special_form)} '
-                f'when its elements_type attribute contains {elements_type}'
+                f'when its elements_type attribute contains {elements.outer}'
             )
         validator_class = cls._VALIDATORS_MAPPING[special_form]
-        return validator_class(elements_type=elements_type, nullable=nullable)
+        elements_type, elements_validator = cls._instantiate_element(elements)
+        if elements_validator is not None:
+            return validator_class(elements_validator=elements_validator, nullable=nullable)
+        return validator_class(elements_type=elements.outer, nullable=nullable)
+
+    @classmethod
+    def _instantiate_element(cls, destructured: _DestructuredType) -> typing.Tuple[Optional[type], Optional[Validator]]:
+        """
+        Returns the type the elements of a container must be instances of, or the validator of its elements if they
+        are generics themselves (or can't be checked with isinstance)
+        """
+        if destructured.inners or typing.get_origin(destructured.outer) is typing.Literal:
+            return None, cls._instantiate_from_destructured(destructured)
+        if destructured.outer == typing.Any:
+            return None, None
+        return destructured.outer, None
 
     @classmethod
     def _instantiate_validator(cls, class_type: type, nullable: bool) -> Validator:
         if class_type in cls._VALIDATORS_MAPPING:
             return cls._VALIDATORS_MAPPING[class_type](nullable=nullable)
+        if typing.get_origin(class_type) is typing.Literal:
+            return LiteralValidator(values=typing.get_args(class_type), nullable=nullable)
         return Validator(expected_type=class_type, nullable=nullable)
@@ -1,9 +1,74 @@
-from typing import Optional
+from typing import Any, Union, List, Optional
 
+from pymodelio.validation_context import ValidationContext, check_model
 from pymodelio.validators.validator import Validator
 
 
 class DictValidator(Validator):
+    """
+    Validates a dict, and optionally its keys and values. Keys and values must be instances of keys_type and
+    values_type, or they are validated by keys_validator and values_validator when they are generics themselves (for
+    instance, the lists of a Dict[str, List[int]]). All the entries are checked in a single loop.
+    """
 
-    def __init__(self, nullable: bool = False, message: Optional[str] = None) -> None:
+    def __init__(self, nullable: bool = False, message: Optional[str] = None,
+                 keys_type: Union[type, List[type]] = None, values_type: Union[type, List[type]] = None,
+                 keys_validator: Optional[Validator] = None, values_validator: Optional[Validator] = None) -> None:
         super().__init__(expected_type=dict, nullable=nullable, message=message)
+        self.keys_type = self._to_types(keys_type)
+        self.values_type = self._to_types(values_type)
+        self.keys_validator = keys_validator
+        self.values_validator = values_validator
+        self._checks_entries = any(x is not None for x in (
+            self.keys_type, self.values_type, keys_validator, values_validator))
+
+    @staticmethod
+    def _to_types(types: Union[type, List[type], None]) -> Optional[tuple]:
+        # Any can't be used with isinstance, and it matches every key and value anyway
+        if types is None or types is Any:
+            return None
+        return tuple(types) if isinstance(types, (list, tuple, set)) else (types,)
+
+    def _bind(self, owner: type, attr: Any) -> None:
+        for validator in (self.keys_validator, self.values_validator):
+            if hasattr(validator, '_bind'):
+                validator._bind(owner, attr)
+
+    def _check(self, value: Any, context: ValidationContext) -> bool:  # noqa: C901
+        if not super()._check(value, context):
+            return False
+        if value is None or not self._checks_entries:
+            return True
+        keys_type, keys_validator = self.keys_type, self.keys_validator
+        values_type, values_validator = self.values_type, self.values_validator
+        path = context.path
+        collect_errors = context.collect_errors
+        valid = True
+        # The path is extended once, and its last key is replaced by the key of each entry
+        path.append(None)
+        for k, v in value.items():
+            path[-1] = k
+            if keys_validator is not None:
+                is_valid_entry = keys_validator._native_check(k, context)
+            elif keys_type is not None and not isinstance(k, keys_type):
+                is_valid_entry = self._fail(context, 'is not a key of type %s' % self._names(keys_type))
+            else:
+                is_valid_entry = True
+            if is_valid_entry:
+                if values_validator is not None:
+                    is_valid_entry = values_validator._native_check(v, context)
+                elif values_type is not None and not isinstance(v, values_type):
+                    is_valid_entry = self._fail(context, 'is not instance of %s' % self._names(values_type))
+                # If it is a model
+                elif hasattr(v, 'validate'):
+                    is_valid_entry = check_model(v, context)
+            if not is_valid_entry:
+                valid = False
+                if not collect_errors:
+                    break
+        path.pop()
+        return valid
+
+    @staticmethod
+    def _names(types: tuple) -> str:
+        return ' or '.join([t.__name__ for t in types])
@@ -0,0 +1,72 @@
+from typing import Any, Iterable, Optional
+
+from pymodelio.attribute import PymodelioAttr
+from pymodelio.constants import UNDEFINED
+from pymodelio.validation_context import ValidationContext, check_model
+from pymodelio.validation_policy import FULL
+from pymodelio.validators.iterable_validator import _select_elements
+from pymodelio.validators.validator import Validator
+
+
+class DiscriminatedUnionValidator(Validator):
+    """
+    Validates a value (or a list of values, if is_list is True) that must be an instance of one of the variants. The
+    variant of each value is found by its type, so validating doesn't depend on the number of variants. Like in the
+    other lists, the elements that get checked are selected by the ValidationPolicy of the validation pass.
+    """
+
+    def __init__(self, variants: Iterable[Any], is_list: bool = False, allow_empty: bool = True,
+                 nullable: bool = False, message: Optional[str] = None) -> None:
+        super().__init__(nullable=nullable, message=message)
+        self.variants = tuple(variants)
+        self.is_list = is_list
+        self.allow_empty = allow_empty
+        self._owner = None
+        self._variant_types = None
+        self._variant_set = None
+
+    def _bind(self, owner: type, attr: PymodelioAttr) -> None:
+        # Forward references to the variants are resolved from the scope of the model declaring the attribute
+        self._owner = owner
+
+    def _get_variant_types(self) -> tuple:
+        if self._variant_types is None:
+            # Imported here, as discriminators depend on the models machinery
+            from pymodelio.discriminators import resolve_variants
+            self._variant_types = resolve_variants(self.variants, self._owner)
+            self._variant_set = frozenset(self._variant_types)
+        return self._variant_types
+
+    def _check(self, value: Any, context: ValidationContext) -> bool:
+        if value is None:
+            return self.nullable or self._fail(context, 'must not be None')
+        variant_types = self._get_variant_types()
+        if not self.is_list:
+            return self._check_variant(value, variant_types, context)
+        if not isinstance(value, list):
+            return self._fail(context, 'is not instance of list')
+        if len(value) == 0 and not self.allow_empty:
+            return self._fail(context, 'must not be empty')
+        policy = context.policy
+        if policy is UNDEFINED:
+            policy = context.get_policy()
+        indexes = None if policy is FULL else policy.select(len(value))
+        path = context.path
+        collect_errors = context.collect_errors
+        valid = True
+        for i, x in enumerate(value) if indexes is None else _select_elements(value, indexes):
+            path.append(i)
+            is_valid_element = self._check_variant(x, variant_types, context)
+            path.pop()
+            if not is_valid_element:
+                if not collect_errors:
+                    return False
+                valid = False
+        return valid
+
+    def _check_variant(self, value: Any, variant_types: tuple, context: ValidationContext) -> bool:
+        # Models are instances of their inner classes, whose parent is the declared model
+        if getattr(type(value), '__pymodelio_parent__', None) not in self._variant_set and \
+                not isinstance(value, variant_types):
+            return self._fail(context, 'is not instance of %s' % (' or '.join([t.__name__ for t in variant_types])))
+        return check_model(value, context)
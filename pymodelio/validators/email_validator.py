@@ -1,6 +1,7 @@
 import re
 from typing import Any, Optional
 
+from pymodelio.validation_context import ValidationContext
 from pymodelio.validators import StringValidator
 from pymodelio.validators.validation_patterns import EMAIL_VALIDATION_PATTERN
 
@@ -10,10 +11,12 @@ class EmailValidator(StringValidator):
     def __init__(self, nullable: bool = False, message: Optional[str] = None) -> None:
         super().__init__(nullable=nullable, message=message)
 
-    def validate(self, value: Any, path: str = None) -> None:
-        super().validate(value, path)
+    def _check(self, value: Any, context: ValidationContext) -> bool:
+        if not super()._check(value, context):
+            return False
         if value is None:
-            return
+            return True
         # Is overriden for adding a custom message and validating the string as lowercase
         if re.compile(EMAIL_VALIDATION_PATTERN).match(value.lower()) is None:
-            self._raise_validation_error(path, 'is not a valid email address')
+            return self._fail(context, 'is not a valid email address')
+        return True
@@ -1,25 +1,73 @@
+from time import monotonic
 from typing import Any, Optional, ForwardRef
 
-from pymodelio import shared_vars
+from pymodelio import model_registry
+from pymodelio.attribute import PymodelioAttr
+from pymodelio.validation_context import ValidationContext
 from pymodelio.validators import Validator
 
+# Minimum amount of seconds between the warnings about the same unresolved reference
+UNRESOLVED_WARNING_INTERVAL = 60.0
+
 
 class ForwardRefValidator(Validator):
-    __slots__ = Validator.__slots__ + ('_ref',)
+    """
+    Validator of a reference to a type that may not be defined yet. The reference is resolved as soon as the referenced
+    model gets defined, and the validator is then replaced in its attribute by a plain type validator.
+    """
+    __slots__ = Validator.__slots__ + ('_ref', '_owner', '_attr', '_resolved_version', '_warned_at', '__weakref__')
 
     def __init__(self, ref: ForwardRef, nullable: bool = False, message: Optional[str] = None) -> None:
         self._ref = ref
+        self._owner = None
+        self._attr = None
+        self._resolved_version = None
+        self._warned_at = None
         super().__init__(expected_type=ForwardRef, nullable=nullable, message=message)
+        model_registry.add_pending(self, ref.__forward_arg__)
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._expected_types != (ForwardRef,)
+
+    def _bind(self, owner: type, attr: PymodelioAttr) -> None:
+        """
+        Binds the validator to the attribute of the model declaring it, whose scope is used for resolving the reference
+        """
+        self._owner = owner
+        self._attr = attr
+
+    def _resolve(self) -> bool:
+        if self.is_resolved:
+            return True
+        self._resolved_version = model_registry.version
+        resolved = model_registry.lookup(self._ref.__forward_arg__, self._owner)
+        if resolved is None:
+            return False
+        self._expected_types = (resolved,)
+        model_registry.remove_pending(self, self._ref.__forward_arg__)
+        if self._attr is not None and self._attr.validator is self:
+            self._attr.validator = Validator(expected_type=resolved, nullable=self.nullable, message=self.message)
+        return True
+
+    def describe(self) -> str:
+        owner = '' if self._owner is None else '%s.%s: ' % (self._owner.__module__, self._owner.__qualname__)
+        return owner + self._ref.__forward_arg__
+
+    def _check(self, value: Any, context: ValidationContext) -> bool:
+        # References are only looked up again once new models get defined
+        if not self.is_resolved and (self._resolved_version == model_registry.version or not self._resolve()):
+            self._warn_unresolved()
+            return True
+        return super()._check(value, context)
 
-    def validate(self, value: Any, path: str = None) -> None:
-        if self._expected_types == (ForwardRef,):
-            try:
-                evaluated = self._ref._evaluate({**globals(), **shared_vars.model_globals}, locals())
-                self._expected_types = (evaluated,)
-            except NameError:
-                print(
-                    'Forwarded reference \'%s\' was not loaded at the moment of the validation, skipping validation.'
-                    % self._ref.__forward_arg__
-                )
-                return
-        super().validate(value, path)
+    def _warn_unresolved(self) -> None:
+        now = monotonic()
+        if self._warned_at is not None and now - self._warned_at < UNRESOLVED_WARNING_INTERVAL:
+            return
+        self._warned_at = now
+        import logging
+        logging.getLogger('pymodelio').warning(
+            'Forwarded reference \'%s\' was not loaded at the moment of the validation, skipping validation.',
+            self.describe()
+        )
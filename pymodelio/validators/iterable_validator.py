@@ -1,28 +1,93 @@
-from typing import Any, Union, List, Optional
+from typing import Any, Union, List, Optional, Iterable, Sequence, Tuple
 
+from pymodelio.constants import UNDEFINED
+from pymodelio.validation_context import ValidationContext, check_model
+from pymodelio.validation_policy import FULL
 from pymodelio.validators.validator import Validator
 
 
 class IterableValidator(Validator):
+    """
+    Validates an iterable whose elements must be instances of elements_type. Elements that are generics themselves
+    (for instance, the lists of a List[List[int]]) are validated by elements_validator instead, which checks all of
+    their own elements in a single loop. The elements that get checked are selected by the ValidationPolicy of the
+    validation pass.
+    """
 
     def __init__(self, expected_type: Union[type, List[type]] = None, elements_type: Union[type, List[type]] = None,
-                 allow_empty: bool = True, nullable: bool = False, message: Optional[str] = None) -> None:
+                 allow_empty: bool = True, nullable: bool = False, message: Optional[str] = None,
+                 elements_validator: Optional[Validator] = None) -> None:
         super().__init__(expected_type=expected_type, nullable=nullable, message=message)
         self.elements_type = tuple(elements_type) if isinstance(elements_type, (list, tuple, set)) else (elements_type,)
         self.allow_empty = allow_empty
+        self.elements_validator = elements_validator
+        # Any can't be used with isinstance, and it matches every element anyway
+        self._checked_elements_type = None if self.elements_type == (None,) or Any in self.elements_type else \
+            self.elements_type
 
-    def validate(self, value: Any, path: str = None) -> None:
-        super().validate(value, path)
+    def _bind(self, owner: type, attr: Any) -> None:
+        if hasattr(self.elements_validator, '_bind'):
+            self.elements_validator._bind(owner, attr)
+
+    def _check(self, value: Any, context: ValidationContext) -> bool:  # noqa: C901
+        if not super()._check(value, context):
+            return False
         if value is None:
-            return
+            return True
         if len(value) == 0 and not self.allow_empty:
-            self._raise_validation_error(path, 'must not be empty')
-        for i, x in enumerate(value):
-            sub_path = '%s[%s]' % (path, i)
-            if self.elements_type != (None,) and not isinstance(x, self.elements_type):
-                self._raise_validation_error(
-                    sub_path, 'is not instance of %s' % (' or '.join([t.__name__ for t in self.elements_type]))
+            return self._fail(context, 'must not be empty')
+        policy = context.policy
+        if policy is UNDEFINED:
+            policy = context.get_policy()
+        indexes = None if policy is FULL else policy.select(len(value))
+        elements = enumerate(value) if indexes is None else _select_elements(value, indexes)
+        if self.elements_validator is not None:
+            return self._check_by_elements_validator(elements, context)
+        path = context.path
+        collect_errors = context.collect_errors
+        elements_type = self._checked_elements_type
+        valid = True
+        # Indexes are only pushed to the path when an element is invalid or it is a model
+        for i, x in elements:
+            if elements_type is not None and not isinstance(x, elements_type):
+                path.append(i)
+                is_valid_element = self._fail(
+                    context, 'is not instance of %s' % (' or '.join([t.__name__ for t in elements_type]))
                 )
+                path.pop()
             # If it is a model
-            if hasattr(x, 'validate'):
-                x.validate(sub_path)
+            elif hasattr(x, 'validate'):
+                path.append(i)
+                is_valid_element = check_model(x, context)
+                path.pop()
+            else:
+                continue
+            if not is_valid_element:
+                if not collect_errors:
+                    return False
+                valid = False
+        return valid
+
+    def _check_by_elements_validator(self, elements: Iterable[Tuple[int, Any]], context: ValidationContext) -> bool:
+        check = self.elements_validator._native_check
+        path = context.path
+        collect_errors = context.collect_errors
+        valid = True
+        # The path is extended once, and its last key is replaced by the index of each element
+        path.append(0)
+        for i, x in elements:
+            path[-1] = i
+            if not check(x, context):
+                valid = False
+                if not collect_errors:
+                    break
+        path.pop()
+        return valid
+
+
+def _select_elements(value: Any, indexes: Sequence[int]) -> List[Tuple[int, Any]]:
+    if isinstance(value, (list, tuple)):
+        return [(i, value[i]) for i in indexes]
+    # Elements of other iterables (like sets) can't be accessed by their index
+    selected = set(indexes)
+    return [(i, x) for i, x in enumerate(value) if i in selected]
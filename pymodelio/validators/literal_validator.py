@@ -0,0 +1,18 @@
+from typing import Any, Iterable, Optional
+
+from pymodelio.validation_context import ValidationContext
+from pymodelio.validators.validator import Validator
+
+
+class LiteralValidator(Validator):
+
+    def __init__(self, values: Iterable[Any], nullable: bool = False, message: Optional[str] = None) -> None:
+        self.values = tuple(values)
+        super().__init__(expected_type=list({type(x) for x in self.values}), nullable=nullable, message=message)
+
+    def _check(self, value: Any, context: ValidationContext) -> bool:
+        if not super()._check(value, context):
+            return False
+        if value is None or value in self.values:
+            return True
+        return self._fail(context, 'is not one of %s' % ', '.join(map(repr, self.values)))
@@ -1,6 +1,7 @@
 from numbers import Number
 from typing import Any, Union, List, Optional
 
+from pymodelio.validation_context import ValidationContext
 from pymodelio.validators.validator import Validator
 
 
@@ -13,11 +14,13 @@ class NumericValidator(Validator):
         self.min_value = min_value
         self.max_value = max_value
 
-    def validate(self, value: Any, path: str = None) -> None:
-        super().validate(value, path)
+    def _check(self, value: Any, context: ValidationContext) -> bool:
+        if not super()._check(value, context):
+            return False
         if value is None:
-            return
+            return True
         if self.min_value is not None and value < self.min_value:
-            self._raise_validation_error(path, 'is less than %s' % self.min_value)
+            return self._fail(context, 'is less than %s' % self.min_value)
         if self.max_value is not None and value > self.max_value:
-            self._raise_validation_error(path, 'is greater than %s' % self.max_value)
+            return self._fail(context, 'is greater than %s' % self.max_value)
+        return True
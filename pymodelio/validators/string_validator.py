@@ -1,6 +1,7 @@
 import re
 from typing import Any, Optional
 
+from pymodelio.validation_context import ValidationContext
 from pymodelio.validators.validator import Validator
 
 
@@ -14,15 +15,17 @@ class StringValidator(Validator):
         self.fixed_len = fixed_len
         self.regex = regex
 
-    def validate(self, value: Any, path: str = None) -> None:
-        super().validate(value, path)
+    def _check(self, value: Any, context: ValidationContext) -> bool:
+        if not super()._check(value, context):
+            return False
         if value is None:
-            return
+            return True
         if self.min_len is not None and len(value) < self.min_len:
-            self._raise_validation_error(path, 'is shorter than %s' % self.min_len)
+            return self._fail(context, 'is shorter than %s' % self.min_len)
         if self.max_len is not None and len(value) > self.max_len:
-            self._raise_validation_error(path, 'is longer than %s' % self.max_len)
+            return self._fail(context, 'is longer than %s' % self.max_len)
         if self.fixed_len is not None and len(value) != self.fixed_len:
-            self._raise_validation_error(path, 'length is different than %s' % self.fixed_len)
+            return self._fail(context, 'length is different than %s' % self.fixed_len)
         if self.regex is not None and re.compile(self.regex).match(value) is None:
-            self._raise_validation_error(path, 'does not match configured regex')
+            return self._fail(context, 'does not match configured regex')
+        return True
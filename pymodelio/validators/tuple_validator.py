@@ -1,11 +1,47 @@
-from typing import Union, List, Optional
+from typing import Any, Union, List, Optional, Iterable
 
-from pymodelio.validators import IterableValidator
+from pymodelio.validation_context import ValidationContext
+from pymodelio.validators import IterableValidator, Validator
 
 
 class TupleValidator(IterableValidator):
+    """
+    Validates a tuple. Variadic tuples (Tuple[int, ...]) are validated like any other iterable, while fixed tuples
+    (Tuple[int, str]) are validated by the items_validators, one for each position.
+    """
 
     def __init__(self, elements_type: Union[type, List[type]] = None,
-                 allow_empty: bool = True, nullable: bool = False, message: Optional[str] = None) -> None:
+                 allow_empty: bool = True, nullable: bool = False, message: Optional[str] = None,
+                 elements_validator: Optional[Validator] = None,
+                 items_validators: Optional[Iterable[Validator]] = None) -> None:
         super().__init__(expected_type=tuple, elements_type=elements_type, allow_empty=allow_empty, nullable=nullable,
-                         message=message)
+                         message=message, elements_validator=elements_validator)
+        self.items_validators = None if items_validators is None else tuple(items_validators)
+
+    def _bind(self, owner: type, attr: Any) -> None:
+        super()._bind(owner, attr)
+        for validator in self.items_validators or ():
+            if hasattr(validator, '_bind'):
+                validator._bind(owner, attr)
+
+    def _check(self, value: Any, context: ValidationContext) -> bool:
+        if self.items_validators is None:
+            return super()._check(value, context)
+        if not Validator._check(self, value, context):
+            return False
+        if value is None:
+            return True
+        if len(value) != len(self.items_validators):
+            return self._fail(context, 'must have %d elements' % len(self.items_validators))
+        path = context.path
+        collect_errors = context.collect_errors
+        valid = True
+        path.append(0)
+        for i, x in enumerate(value):
+            path[-1] = i
+            if not self.items_validators[i]._native_check(x, context):
+                valid = False
+                if not collect_errors:
+                    break
+        path.pop()
+        return valid
@@ -1,6 +1,8 @@
 from typing import Any, Union, List, Optional
 
 from pymodelio.exceptions.model_validation_exception import ModelValidationException
+from pymodelio.exceptions.validation_error import ValidationError
+from pymodelio.validation_context import ValidationContext, current_context, path_error, check_model
 
 
 class Validator:
@@ -16,19 +18,65 @@ class Validator:
             self._expected_types = tuple(expected_type) if isinstance(expected_type, (list, tuple, set)) else (
                 expected_type,)
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if '_check' in cls.__dict__:
+            cls._native_check = cls.__dict__['_check']
+        elif 'validate' in cls.__dict__:
+            # Validators that only override validate are checked by calling it and catching the raised exception
+            cls._check = Validator._check_by_validating
+
     def validate(self, value: Any, path: str = None) -> None:
+        context = current_context()
+        if context is None or path is not context.path:
+            with ValidationContext(path, outer=context) as context:
+                self.__check_or_raise(value, context)
+            return
+        self.__check_or_raise(value, context)
+
+    def __check_or_raise(self, value: Any, context: ValidationContext) -> None:
+        errors = context.errors
+        errors_count = len(errors)
+        if not self._native_check(value, context):
+            raised_errors = errors[errors_count:]
+            del errors[errors_count:]
+            raise ModelValidationException(errors=raised_errors)
+
+    def _check(self, value: Any, context: ValidationContext) -> bool:
+        """
+        Non-raising validation protocol. It must add the found errors to the context (at the context path) and
+        return whether the value is valid.
+        """
         if value is None:
             if not self.nullable:
-                self._raise_validation_error(path, 'must not be None')
-            return
+                return self._fail(context, 'must not be None')
+            return True
         if self._expected_types is not None and not isinstance(value, self._expected_types):
-            self._raise_validation_error(
-                path, 'is not instance of %s' % (' or '.join([t.__name__ for t in self._expected_types]))
+            return self._fail(
+                context, 'is not instance of %s' % (' or '.join([t.__name__ for t in self._expected_types]))
             )
         # If it is a model
         if hasattr(value, 'validate'):
-            value.validate(path)
+            return check_model(value, context)
+        return True
+
+    # The non-raising implementation of the closest validator that provides one
+    _native_check = _check
+
+    def _check_by_validating(self, value: Any, context: ValidationContext) -> bool:
+        try:
+            self.validate(value, context.path)
+        except ModelValidationException as e:
+            context.record(e)
+            return False
+        return True
+
+    def _fail(self, context: ValidationContext, message: str) -> bool:
+        context.errors.append(self._build_validation_error(context.path, message))
+        return False
 
     def _raise_validation_error(self, path: str, message: str) -> None:
-        _message = message if self.message is None else self.message
-        raise ModelValidationException('%s %s' % (path, _message))
+        raise ModelValidationException(errors=[self._build_validation_error(path, message)])
+
+    def _build_validation_error(self, path: str, message: str) -> ValidationError:
+        return path_error(path, message if self.message is None else self.message)
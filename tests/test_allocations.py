@@ -0,0 +1,76 @@
+import pytest
+
+from pymodelio import PymodelioModel
+from pymodelio.attribute import Attr
+from pymodelio.testing import assert_allocations, measure_allocations
+
+
+class _Point(PymodelioModel):
+    x: Attr(int)
+    y: Attr(int)
+
+
+def test_measure_allocations_reports_retained_memory():
+    stats = measure_allocations(lambda: [0] * 1000)
+    assert 8000 <= stats.retained_bytes < 9000
+    # The list and its items
+    assert stats.retained_blocks == 2
+    assert stats.peak_bytes >= 8000
+    assert stats.allocated_blocks >= 2
+
+
+def test_measure_allocations_does_not_report_freed_memory():
+    stats = measure_allocations(lambda: len([0] * 1000))
+    assert stats.retained_bytes < 100
+    assert stats.peak_bytes >= 8000
+    # The temporary list is allocated by every call, although it is not retained
+    assert stats.allocated_blocks >= 2
+
+
+def test_assert_allocations_passes_when_under_budget():
+    stats = assert_allocations(lambda: {'key': 'value'}, max=2.5, max_bytes=1000, max_retained_blocks=2,
+                               max_retained_bytes=1000)
+    assert stats.retained_blocks == 2
+
+
+def test_assert_allocations_fails_when_over_budget():
+    with pytest.raises(AssertionError, match='Expected at most 1 allocations per call'):
+        assert_allocations(lambda: [[], [], []], max=1)
+    with pytest.raises(AssertionError, match='Expected at most 10 bytes per call'):
+        assert_allocations(lambda: [0] * 10, max=10, max_bytes=10)
+    with pytest.raises(AssertionError, match='Expected at most 1 retained allocations per call'):
+        assert_allocations(lambda: [[], [], []], max_retained_blocks=1)
+    with pytest.raises(AssertionError, match='Expected at most 10 retained bytes per call'):
+        assert_allocations(lambda: [0] * 10, max_retained_blocks=10, max_retained_bytes=10)
+
+
+def test_assert_allocations_counts_the_temporary_allocations():
+    # Only the returned int is retained, but a temporary list (and its items) is allocated by every call
+    assert_allocations(lambda: len([0] * 1000), max_retained_blocks=1.5)
+    with pytest.raises(AssertionError, match='Expected at most 1 allocations per call'):
+        assert_allocations(lambda: len([0] * 1000), max=1)
+    with pytest.raises(AssertionError, match='Expected at most 1000 bytes per call'):
+        assert_allocations(lambda: len([0] * 1000), max_bytes=1000)
+
+
+def test_assert_allocations_counts_the_temporary_allocations_of_nested_calls():
+    def build_and_discard() -> None:
+        [[] for _ in range(10)]
+
+    stats = assert_allocations(build_and_discard, max=12, max_retained_blocks=0.5)
+    assert stats.allocated_blocks >= 11
+    with pytest.raises(AssertionError, match='Expected at most 5 allocations per call'):
+        assert_allocations(build_and_discard, max=5)
+
+
+def test_model_from_dict_allocations_budget():
+    # The instance (with its inline values) and the snapshot of its validated values, without leftovers of the
+    # deserialization. Enough calls are measured for the blocks kept by the free lists of Python to be negligible.
+    stats = assert_allocations(lambda: _Point.from_dict({'x': 1, 'y': 2}), max_retained_blocks=3.5, repeat=1000)
+    assert stats.peak_bytes >= stats.retained_bytes
+
+
+def test_validated_models_keep_their_bookkeeping_out_of_their_dict():
+    point = _Point(x=1, y=2)
+    point.validate()
+    assert point.__dict__ == {}
@@ -0,0 +1,85 @@
+import json
+
+from pymodelio.benchmarks import run_benchmarks, compare_runs, Regression, measure, super_linear_sweeps
+from pymodelio.benchmarks.__main__ import main
+from pymodelio.benchmarks.memory import run_memory_benchmarks
+from pymodelio.benchmarks.libraries import computer_payload, computer_subjects, chain_payload, chain_subjects
+
+
+def _run(results: dict, scaling: dict = None) -> dict:
+    return {'metadata': {}, 'results': results, 'relative_to_raw': {}, 'scaling': scaling or {}}
+
+
+def test_measure_returns_time_per_call():
+    calls = []
+    seconds = measure(lambda: calls.append(None), min_time=0, repeat=2)
+    assert seconds >= 0
+    assert len(calls) == 2
+
+
+def test_measure_calls_func_with_new_values_of_setup():
+    values = iter(range(100))
+    calls = []
+    measure(calls.append, min_time=0, repeat=3, setup=lambda: next(values))
+    assert calls == [0, 1, 2]
+
+
+def test_benchmarked_subjects_are_equivalent():
+    payload = computer_payload(3)
+    for subject in computer_subjects():
+        instance = subject.construct(payload)
+        assert subject.to_dict(subject.from_dict(payload)) == subject.to_dict(instance)
+        if subject.validate is not None:
+            subject.validate(instance)
+        assert subject.to_dict(instance)['serial_no'] == payload['serial_no']
+    for subject in chain_subjects(3):
+        instance = subject.from_dict(chain_payload(3))
+        assert subject.to_dict(instance)['child']['child']['value'] == 2
+
+
+def test_run_benchmarks_sweeps_list_lengths_and_depths():
+    run = run_benchmarks(list_lengths=(1, 2), depths=(1, 2), min_time=0, repeat=1, import_time=False)
+    assert 'raw' in run['metadata']['libraries'] and 'pymodelio' in run['metadata']['libraries']
+    for operation in ('construction', 'validate', 'revalidate', 'from_dict', 'to_dict', 'repr'):
+        assert run['results']['computer[list_length=2]/pymodelio/%s' % operation] > 0
+        assert run['results']['chain[depth=1]/raw/%s' % operation] > 0
+        assert 'computer[list_length=1]/pymodelio/%s' % operation in run['relative_to_raw']
+        assert 'chain/pymodelio/%s' % operation in run['scaling']
+    json.dumps(run)
+
+
+def test_super_linear_sweeps():
+    run = _run({}, {'computer/pymodelio/from_dict': 3.5, 'computer/raw/from_dict': 1.1})
+    assert super_linear_sweeps(run) == {'computer/pymodelio/from_dict': 3.5}
+
+
+def test_compare_runs_flags_regressions():
+    baseline = _run({'a/pymodelio/from_dict': 1.0, 'a/pymodelio/to_dict': 1.0, 'b/pymodelio/from_dict': 1.0})
+    current = _run({'a/pymodelio/from_dict': 1.5, 'a/pymodelio/to_dict': 1.05, 'c/pymodelio/from_dict': 9.0})
+    assert compare_runs(baseline, current, threshold=0.1) == [Regression('a/pymodelio/from_dict', 1.0, 1.5, 0.5)]
+    assert compare_runs(baseline, current, threshold=0.6) == []
+
+
+def test_main_returns_error_code_when_there_are_regressions(tmp_path):
+    baseline_path, current_path = tmp_path / 'baseline.json', tmp_path / 'current.json'
+    baseline_path.write_text(json.dumps(_run({'a/pymodelio/from_dict': 1.0})))
+    current_path.write_text(json.dumps(_run({'a/pymodelio/from_dict': 2.0})))
+    assert main(['--input', str(current_path), '--compare', str(baseline_path)]) == 1
+    assert main(['--input', str(current_path), '--compare', str(baseline_path), '--threshold', '1.5']) == 0
+
+
+def test_compare_runs_flags_memory_regressions():
+    baseline = _run({}, None)
+    baseline['memory'] = {'a/pymodelio/from_dict': {'retained_bytes': 100, 'retained_blocks': 2, 'peak_bytes': 1}}
+    current = _run({}, None)
+    current['memory'] = {'a/pymodelio/from_dict': {'retained_bytes': 100, 'retained_blocks': 3, 'peak_bytes': 9}}
+    assert compare_runs(baseline, current) == [
+        Regression('a/pymodelio/from_dict[retained_blocks]', 2, 3, 0.5)
+    ]
+
+
+def test_run_memory_benchmarks():
+    results = run_memory_benchmarks(list_lengths=(2,), depths=(2,), repeat=5)
+    for operation in ('construction', 'from_dict', 'to_dict'):
+        assert results['computer[list_length=2]/pymodelio/%s' % operation]['retained_bytes'] > 0
+        assert results['chain[depth=2]/raw/%s' % operation]['retained_blocks'] > 0
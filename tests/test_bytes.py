@@ -0,0 +1,153 @@
+import json
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+from uuid import UUID
+
+import pytest
+
+from pymodelio import PymodelioModel, Attr
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+
+
+class _Card(PymodelioModel):
+    kind: Attr(Literal['card'])
+    number: Attr(str)
+
+
+class _Cash(PymodelioModel):
+    kind: Attr(Literal['cash'])
+    currency: Attr(str)
+
+
+class _Node(PymodelioModel):
+    name: Attr(str)
+    children: Attr(List['_Node'])
+
+
+class _Order(PymodelioModel):
+    id: Attr(int)
+    customer: Attr(str)
+    _total: Attr(Decimal, init_alias='total')
+    paid: Attr(bool)
+    discount: Attr(float)
+    created_at: Attr(datetime)
+    shipped_at: Attr(Optional[datetime])
+    delivery: Attr(date)
+    signature: Attr(bytes)
+    tags: Attr(List[str])
+    totals: Attr(Dict[str, float])
+    point: Attr(Tuple[int, int])
+    payments: Attr(List[Union[_Card, _Cash]])
+    tree: Attr(_Node)
+    extra: Attr(Any)
+
+
+def _order(i=1, **kwargs):
+    return _Order(**{
+        'id': -i,
+        'customer': 'Ñandú %s' % i,
+        'total': Decimal('%s.10' % i),
+        'paid': True,
+        'discount': 0.25,
+        'created_at': datetime(2023, 1, 2, 3, 4, 5, 6, tzinfo=timezone(timedelta(hours=-3))),
+        'shipped_at': None,
+        'delivery': date(2023, 1, 9),
+        'signature': b'\x00\xff',
+        'tags': ['a', 'b'],
+        'totals': {'a': 1.5},
+        'point': (i, 2 ** 70),
+        'payments': [_Card(kind='card', number='123'), _Cash(kind='cash', currency='EUR')],
+        'tree': _Node(name='root', children=[_Node(name='leaf', children=[])]),
+        'extra': {'nested': [1, 'x', None, (True, datetime(2023, 1, 2))]},
+        **kwargs
+    })
+
+
+def test_models_are_decoded_as_they_were_encoded():
+    order = _order()
+    data = order.to_bytes()
+    decoded = _Order.from_bytes(data)
+    assert isinstance(decoded, _Order)
+    assert decoded.to_dict() == order.to_dict()
+    assert decoded._total == Decimal('1.10')
+    assert decoded.point == (1, 2 ** 70)
+    assert isinstance(decoded.payments[1], _Cash)
+    assert decoded.tree.children[0].name == 'leaf'
+    assert decoded.extra == order.extra
+    assert len(data) * 2 < len(json.dumps(order.to_dict(), default=str))
+    assert _Order.from_bytes(memoryview(bytearray(data))).to_dict() == order.to_dict()
+
+
+def test_concatenated_payloads_are_decoded_by_from_bytes_many():
+    orders = [_order(i) for i in range(3)]
+    decoded = _Order.from_bytes_many(b''.join(x.to_bytes() for x in orders))
+    assert [x.to_dict() for x in decoded] == [x.to_dict() for x in orders]
+    assert _Order.from_bytes_many(b'') == []
+
+
+def test_invalid_payloads_are_rejected():
+    data = _order().to_bytes()
+    with pytest.raises(ValueError) as ex_info:
+        _Card.from_bytes(data)
+    assert str(ex_info.value) == 'The payload was not encoded with the current schema of _Card'
+    with pytest.raises(ValueError):
+        _Order.from_bytes(data[:-3])
+    with pytest.raises(ValueError):
+        _Order.from_bytes(data + b'\x00')
+
+
+def test_decoded_models_are_validated_unless_trusted():
+    data = _Card.construct(kind='other', number='1').to_bytes()
+    with pytest.raises(ModelValidationException):
+        _Card.from_bytes(data)
+    assert _Card.from_bytes(data, trusted=True).kind == 'other'
+
+
+class _Color(Enum):
+    RED = 'red'
+    BLUE = 'blue'
+
+
+class _Slot(PymodelioModel):
+    id: Attr(UUID)
+    color: Attr(_Color)
+    starts_at: Attr(time)
+    ends_at: Attr(Optional[time])
+    duration: Attr(timedelta)
+    palette: Attr(List[_Color])
+
+
+def test_enums_uuids_times_and_timedeltas_are_encoded():
+    slot = _Slot(id=UUID(int=2 ** 100), color=_Color.BLUE, starts_at=time(9, 30, 1, 5),
+                 ends_at=time(10, tzinfo=timezone(timedelta(hours=-3))), duration=-timedelta(days=1, microseconds=7),
+                 palette=[_Color.RED, _Color.BLUE])
+    decoded = _Slot.from_bytes(slot.to_bytes())
+    assert decoded.id == slot.id
+    assert decoded.color is _Color.BLUE
+    assert decoded.starts_at == time(9, 30, 1, 5)
+    assert decoded.ends_at == slot.ends_at and decoded.ends_at.utcoffset() == timedelta(hours=-3)
+    assert decoded.duration == slot.duration
+    assert decoded.palette == [_Color.RED, _Color.BLUE]
+
+
+class _Unsupported(PymodelioModel):
+    value: Attr(Optional[Callable], default_factory=lambda: None)
+
+
+def test_unsupported_attribute_types_are_rejected_when_the_codec_is_built():
+    for _ in range(2):
+        with pytest.raises(TypeError) as ex_info:
+            _Unsupported().to_bytes()
+        assert 'is not a supported attribute type' in str(ex_info.value)
+
+
+def test_models_referencing_themselves_are_rejected():
+    node = _Node(name='root', children=[])
+    node.children.append(_Node(name='child', children=[node]))
+    with pytest.raises(ValueError) as ex_info:
+        node.to_bytes()
+    assert str(ex_info.value) == '_Node references itself, so it can\'t be encoded'
+    shared = _Node(name='leaf', children=[])
+    assert len(_Node.from_bytes(_Node(name='root', children=[shared, shared]).to_bytes()).children) == 2
@@ -0,0 +1,76 @@
+from datetime import date, datetime
+from typing import List, Optional
+
+import pytest
+
+from pymodelio import PymodelioModel, Attr
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+
+
+class _Component(PymodelioModel):
+    name: Attr(str)
+
+
+class _Product(PymodelioModel):
+    name: Attr(str)
+    _price: Attr(float, init_alias='price')
+    stock: Attr(int)
+    available: Attr(bool)
+    released: Attr(date)
+    updated_at: Attr(Optional[datetime])
+    components: Attr(List[_Component])
+
+    @property
+    def price(self) -> float:
+        return self._price
+
+
+def _products(n):
+    return [
+        _Product(name='P%s' % i, price=i / 2, stock=i, available=i % 2 == 0, released=date(2023, 1, 2),
+                 updated_at=datetime(2023, 1, 2, 3, 4, 5) if i else None, components=[_Component(name='C')])
+        for i in range(n)
+    ]
+
+
+def test_to_columns_returns_the_values_of_the_models_by_column():
+    columns = _Product.to_columns(_products(2))
+    assert list(columns) == ['name', 'stock', 'available', 'released', 'updated_at', 'components', 'price']
+    assert columns['stock'] == [0, 1]
+    assert columns['price'] == [0.0, 0.5]
+    assert isinstance(columns['components'][0][0], _Component)
+    assert _Product.to_columns([], columns=['name']) == {'name': []}
+
+
+def test_from_columns_creates_the_models_from_their_columns():
+    products = _Product.from_columns(_Product.to_columns(_products(3)))
+    assert [x.to_dict() for x in products] == [x.to_dict() for x in _products(3)]
+    with pytest.raises(ModelValidationException):
+        _Product.from_columns({**_Product.to_columns(_products(1)), 'stock': ['many']})
+
+
+
+class _Order(PymodelioModel):
+    quantity: Attr(int)
+    total: Attr(Optional[int], initable=False, default_factory=lambda: None)
+
+    def __once_validated__(self) -> None:
+        self.total = self.quantity * 2
+
+
+def test_from_columns_initializes_the_models_like_from_dict_unless_trusted():
+    assert _Order.from_columns({'quantity': [3]})[0].total == 6
+    assert _Order.from_columns({'quantity': [3]}, trusted=True)[0].total is None
+    with pytest.raises(NameError) as ex_info:
+        _Order.from_columns({'quantity': [3], 'total': [10]})
+    assert str(ex_info.value) == 'total attribute is not initable for class _Order'
+
+def test_to_numpy_derives_the_types_of_the_fields_from_the_attributes():
+    numpy = pytest.importorskip('numpy')
+    array = _Product.to_numpy(_products(2))
+    assert array.dtype == numpy.dtype([
+        ('name', 'O'), ('stock', 'i8'), ('available', '?'), ('released', 'M8[D]'), ('updated_at', 'O'),
+        ('components', 'O'), ('price', 'f8')
+    ])
+    assert array['stock'].tolist() == [0, 1]
+    assert [x.to_dict() for x in _Product.from_numpy(array)] == [x.to_dict() for x in _products(2)]
@@ -0,0 +1,71 @@
+from typing import Dict, List
+
+import pytest
+
+from pymodelio import PymodelioModel, Attr
+
+
+class _Item(PymodelioModel):
+    name: Attr(str)
+    _price: Attr(int, init_alias='price')
+    tags: Attr(List[str], default_factory=list)
+
+    def __once_validated__(self) -> None:
+        self.name = self.name.upper()
+
+
+class _Order(PymodelioModel):
+    items: Attr(List[_Item])
+    by_name: Attr(Dict[str, _Item], default_factory=dict)
+
+
+def test_construct_assigns_the_values_by_attribute_name_without_validating():
+    item = _Item.construct(name='apple', _price='not validated')
+    assert isinstance(item, _Item)
+    assert item.name == 'apple'
+    assert item._price == 'not validated'
+    assert item.tags == []
+    assert _Item.construct(name='apple', _price=1, _once_validated=True).name == 'APPLE'
+
+
+def test_construct_does_not_accept_unknown_attributes():
+    with pytest.raises(NameError) as ex_info:
+        _Item.construct(name='apple', _price=1, color='red')
+    assert str(ex_info.value) == 'color is not an attribute of class _Item'
+    # Attributes are provided by their names, not by their init aliases
+    with pytest.raises(NameError):
+        _Item.construct(name='apple', price=1)
+
+
+def test_construct_does_not_run_the_initialization_hooks():
+    calls = []
+
+    class TestCaseModel(PymodelioModel):
+        attr: Attr(int)
+
+        def __before_init__(self, *args, **kwargs):
+            calls.append('before_init')
+            return args, kwargs
+
+        def __before_validate__(self) -> None:
+            calls.append('before_validate')
+
+    assert TestCaseModel.construct(attr=1).attr == 1
+    assert calls == []
+
+
+def test_constructed_models_are_validated_when_required():
+    item = _Item.construct(name='apple', _price='1')
+    assert not item.check().is_valid
+
+
+def test_from_dict_with_trusted_data_constructs_the_nested_models():
+    data = {'items': [{'name': 'apple', 'price': 3}], 'by_name': {'pear': {'name': 'pear', 'price': 'x'}}}
+    order = _Order.from_dict(data, trusted=True)
+    assert order.items[0].name == 'apple'
+    assert order.items[0].tags == []
+    assert order.by_name['pear']._price == 'x'
+    assert order.to_dict() == {
+        'items': [{'name': 'apple', 'tags': []}],
+        'by_name': {'pear': {'name': 'pear', 'tags': []}},
+    }
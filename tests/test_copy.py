@@ -0,0 +1,64 @@
+import copy
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pymodelio import PymodelioModel, Attr
+
+
+class _Item(PymodelioModel):
+    name: Attr(str)
+    tags: Attr(List[str], default_factory=list)
+
+
+class _Cart(PymodelioModel):
+    owner: Attr(str)
+    created_at: Attr(datetime)
+    items: Attr(List[_Item])
+    favorite: Attr(Optional[_Item], default_factory=lambda: None)
+    quantities: Attr(Dict[str, int], default_factory=dict)
+    metadata: Attr(Any, default_factory=dict)
+
+
+def _cart():
+    item = _Item(name='apple', tags=['fruit'])
+    return _Cart(owner='Rick', created_at=datetime(2023, 1, 2), items=[item, _Item(name='pear')], favorite=item,
+                 quantities={'apple': 1}, metadata={'notes': ['a']})
+
+
+def test_deepcopy_copies_the_mutable_values_and_shares_the_immutable_ones():
+    cart = _cart()
+    copied = copy.deepcopy(cart)
+    assert type(copied) is type(cart)
+    assert copied == cart
+    assert copied.owner is cart.owner
+    assert copied.created_at is cart.created_at
+    assert copied.items is not cart.items
+    assert copied.items[0] is not cart.items[0]
+    assert copied.items[0].tags is not cart.items[0].tags
+    assert copied.quantities is not cart.quantities
+    assert copied.metadata['notes'] is not cart.metadata['notes']
+
+
+def test_deepcopy_copies_the_values_referenced_more_than_once_once():
+    cart = _cart()
+    copied = copy.deepcopy(cart)
+    assert copied.favorite is copied.items[0]
+    carts = copy.deepcopy([cart, cart])
+    assert carts[0] is carts[1]
+
+
+def test_copy_shares_the_values_of_the_attributes():
+    cart = _cart()
+    cart.note = 'extra'
+    copied = copy.copy(cart)
+    assert copied is not cart
+    assert copied.items is cart.items
+    assert copied.note == 'extra'
+    assert copy.deepcopy(cart).note == 'extra'
+
+
+def test_copies_are_valid_models():
+    copied = copy.deepcopy(_cart())
+    assert copied.check().is_valid
+    copied.items.append(_Item(name='banana'))
+    assert len(_cart().items) == 2
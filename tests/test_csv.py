@@ -0,0 +1,108 @@
+import io
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
+
+import pytest
+
+from pymodelio import PymodelioModel, Attr, write_csv
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+
+
+class _Component(PymodelioModel):
+    name: Attr(str)
+
+
+class _Product(PymodelioModel):
+    name: Attr(str)
+    _price: Attr(Decimal, init_alias='price')
+    stock: Attr(int)
+    rating: Attr(Optional[float])
+    available: Attr(bool)
+    released: Attr(date)
+    updated_at: Attr(Optional[datetime])
+    components: Attr(List[_Component])
+
+    @property
+    def price(self) -> Decimal:
+        return self._price
+
+
+_CSV = '''name,price,stock,rating,available,released,updated_at,components,notes
+Portal gun,999.90,3,4.5,true,2023-01-02,2023-01-02T03:04:05,"[{""name"": ""Fluid""}]",ignored
+Plumbus,6.50,10,,False,2023-02-03,,[],
+'''
+
+
+def test_iter_csv_converts_the_columns_by_the_types_of_the_attributes():
+    products = list(_Product.iter_csv(io.StringIO(_CSV)))
+    assert len(products) == 2
+    assert products[0]._price == Decimal('999.90')
+    assert products[0].stock == 3
+    assert products[0].rating == 4.5
+    assert products[0].available is True
+    assert products[0].released == date(2023, 1, 2)
+    assert products[0].updated_at == datetime(2023, 1, 2, 3, 4, 5)
+    assert isinstance(products[0].components[0], _Component)
+    assert products[1].rating is None
+    assert products[1].available is False
+    assert products[1].updated_at is None
+
+
+def test_iter_csv_reports_the_line_of_the_invalid_rows():
+    invalid = _CSV.replace('10', 'ten')
+    products = _Product.iter_csv(io.StringIO(invalid))
+    assert next(products).name == 'Portal gun'
+    with pytest.raises(ModelValidationException) as ex_info:
+        next(products)
+    assert str(ex_info.value) == '_Product[3].stock is not instance of int'
+    assert list(_Product.iter_csv(io.StringIO(invalid), trusted=True))[1].stock == 'ten'
+    with pytest.raises(ModelValidationException) as ex_info:
+        list(_Product.iter_csv(io.StringIO(_CSV + 'Other,1\n')))
+    assert str(ex_info.value) == '_Product[4] has 2 values, but the header has 9 columns'
+
+
+def test_try_iter_csv_continues_past_the_invalid_rows():
+    invalid = _CSV.replace('10', 'ten') + 'Other,1\n' + _CSV.splitlines()[1] + '\n'
+    results = list(_Product.try_iter_csv(io.StringIO(invalid)))
+    assert [result.is_valid for result in results] == [True, False, False, True]
+    assert results[0].value.name == results[3].value.name == 'Portal gun'
+    assert results[1].value is None
+    assert str(results[1].errors[0]) == '_Product[3].stock is not instance of int'
+    assert str(results[2].errors[0]) == '_Product[4] has 2 values, but the header has 9 columns'
+
+
+class _Order(PymodelioModel):
+    quantity: Attr(int)
+    total: Attr(Optional[int], initable=False, default_factory=lambda: None)
+
+    def __before_validate__(self) -> None:
+        if self.quantity == 0:
+            raise ModelValidationException('quantity must not be zero')
+
+    def __once_validated__(self) -> None:
+        self.total = self.quantity * 2
+
+
+def test_iter_csv_initializes_the_models_like_from_dict_unless_trusted():
+    orders = list(_Order.iter_csv(io.StringIO('quantity,total\n3,10\n')))
+    assert orders[0].total == _Order.from_dict({'quantity': 3, 'total': 10}).total == 6
+    assert list(_Order.iter_csv(io.StringIO('quantity\n3\n'), trusted=True))[0].total is None
+    with pytest.raises(ModelValidationException) as ex_info:
+        list(_Order.iter_csv(io.StringIO('quantity\n3\n0\n')))
+    assert str(ex_info.value) == '_Order[3] quantity must not be zero'
+    results = list(_Order.try_iter_csv(io.StringIO('quantity\n0\n3\n')))
+    assert str(results[0].errors[0]) == '_Order[2] quantity must not be zero'
+    assert results[1].value.total == 6
+
+
+def test_write_csv_writes_files_that_can_be_read_back(tmp_path):
+    products = list(_Product.iter_csv(io.StringIO(_CSV)))
+    path = tmp_path / 'products.csv'
+    write_csv(iter(products), path)
+    with open(path) as f:
+        assert f.readline().strip() == 'name,stock,rating,available,released,updated_at,components,price'
+    assert [x.to_dict() for x in _Product.iter_csv(path)] == [x.to_dict() for x in products]
+    output = io.StringIO()
+    write_csv(products, output, columns=['name', 'price'], delimiter=';')
+    assert output.getvalue().splitlines() == ['name;price', 'Portal gun;999.90', 'Plumbus;6.50']
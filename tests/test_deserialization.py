@@ -1,5 +1,5 @@
 from datetime import datetime, timezone, date
-from typing import List, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 from unittest.mock import patch
 
 from pymodelio import PymodelioModel, Attr, UNDEFINED, PymodelioSettings, PymodelioSetting
@@ -102,3 +102,54 @@ def test_from_dict_does_not_deserialize_list_items_when_items_are_not_a_pymodeli
 
     instance = TestCaseModel.from_dict({'attr': [{'index': 1}]})
     assert instance.attr == [{'index': 1}]
+
+
+def test_from_dict_deserializes_models_nested_in_generic_containers():
+    class Item(PymodelioModel):
+        name: Attr(str)
+
+    class TestCaseModel(PymodelioModel):
+        grid: Attr(List[List[Item]])
+        index: Attr(Dict[str, List[Item]])
+        pair: Attr(Tuple[Item, int])
+        optional: Attr(Optional[Item])
+
+    instance = TestCaseModel.from_dict({
+        'grid': [[{'name': 'a'}], []],
+        'index': {'b': [{'name': 'b'}, {'name': 'c'}]},
+        'pair': ({'name': 'd'}, 1),
+        'optional': {'name': 'e'},
+    })
+    assert instance.grid[0][0].name == 'a'
+    assert [x.name for x in instance.index['b']] == ['b', 'c']
+    assert instance.pair[0].name == 'd'
+    assert instance.optional.name == 'e'
+    assert instance.to_dict()['index'] == {'b': [{'name': 'b'}, {'name': 'c'}]}
+
+
+def test_from_dict_builds_tuples_and_sets_from_lists():
+    class Item(PymodelioModel):
+        x: Attr(int)
+
+    class TestCaseModel(PymodelioModel):
+        items: Attr(Tuple[Item, ...])
+        pair: Attr(Tuple[int, str])
+        numbers: Attr(Tuple[int, ...])
+        tags: Attr(Set[str])
+        grid: Attr(Dict[str, Tuple[int, int]])
+
+    instance = TestCaseModel.from_dict({
+        'items': [{'x': 3}],
+        'pair': [1, 's'],
+        'numbers': [1, 2],
+        'tags': ['a', 'b', 'a'],
+        'grid': {'a': [1, 2]},
+    })
+    assert isinstance(instance.items, tuple)
+    assert instance.items[0].x == 3
+    assert instance.pair == (1, 's')
+    assert instance.numbers == (1, 2)
+    assert instance.tags == {'a', 'b'}
+    assert instance.grid == {'a': (1, 2)}
+    assert TestCaseModel.from_dict({'items': [], 'pair': [1, 's'], 'numbers': [], 'tags': [], 'grid': {}},
+                                   trusted=True).pair == (1, 's')
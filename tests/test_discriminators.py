@@ -0,0 +1,92 @@
+from typing import List, Literal, Optional, Union
+
+import pytest
+
+from pymodelio import PymodelioModel, Attr
+from pymodelio.exceptions import DiscriminatorException, ModelValidationException
+from pymodelio.validators import DiscriminatedUnionValidator
+
+
+class _Click(PymodelioModel):
+    type: Attr(Literal['click'])
+    x: Attr(int)
+
+
+class _Scroll(PymodelioModel):
+    type: Attr(Literal['scroll', 'wheel'])
+    delta: Attr(int)
+
+
+class _Session(PymodelioModel):
+    events: Attr(List[Union[_Click, _Scroll, '_Key']], discriminator='type')
+    last_event: Attr(Optional[Union[_Click, _Scroll]], discriminator='type')
+
+
+class _Key(PymodelioModel):
+    type: Attr(Literal['key'])
+    key: Attr(str)
+
+
+_PAYLOAD = {
+    'events': [
+        {'type': 'click', 'x': 1}, {'type': 'wheel', 'delta': 3}, {'type': 'key', 'key': 'a'},
+        {'type': 'scroll', 'delta': -1}
+    ],
+    'last_event': {'type': 'click', 'x': 2},
+}
+
+
+def test_from_dict_deserializes_each_variant_by_its_tag():
+    session = _Session.from_dict(_PAYLOAD)
+    assert [type(x).__name__ for x in session.events] == ['_Click', '_Scroll', '_Key', '_Scroll']
+    assert session.events[1].delta == 3
+    assert isinstance(session.last_event, _Click)
+    assert session.to_dict() == _PAYLOAD
+    assert _Session.from_dict({'events': [], 'last_event': None}).last_event is None
+
+
+def test_from_dict_fails_validation_for_unknown_tags():
+    with pytest.raises(ModelValidationException) as ex_info:
+        _Session.from_dict({'events': [{'type': 'hover'}], 'last_event': None})
+    assert ex_info.value.args[0] == '_Session.events[0] is not instance of _Click or _Scroll or _Key'
+
+
+def test_variants_are_validated_against_their_own_model():
+    with pytest.raises(ModelValidationException) as ex_info:
+        _Session.from_dict({'events': [{'type': 'scroll', 'delta': 'a'}], 'last_event': None})
+    assert ex_info.value.args[0] == '_Session.events[0].delta is not instance of int'
+
+
+def test_discriminated_attrs_use_a_discriminated_union_validator():
+    validator = _Session.__annotations__['events'].validator
+    assert isinstance(validator, DiscriminatedUnionValidator)
+    assert validator.is_list
+    assert _Session.__annotations__['last_event'].validator.nullable
+
+
+def test_discriminated_attrs_must_be_unions():
+    with pytest.raises(DiscriminatorException):
+        Attr(List[_Click], discriminator='type')
+
+
+def test_variants_must_declare_their_tags_as_literals():
+    class Untagged(PymodelioModel):
+        type: Attr(str)
+
+    class Model(PymodelioModel):
+        event: Attr(Union[_Click, Untagged], discriminator='type')
+
+    with pytest.raises(DiscriminatorException) as ex_info:
+        Model.from_dict({'event': {'type': 'click', 'x': 1}})
+    assert ex_info.value.args[0] == 'Untagged must declare its type attribute as a Literal of its tags'
+
+
+def test_variants_can_not_share_tags():
+    class OtherClick(PymodelioModel):
+        type: Attr(Literal['click'])
+
+    class Model(PymodelioModel):
+        event: Attr(Union[_Click, OtherClick], discriminator='type')
+
+    with pytest.raises(DiscriminatorException):
+        Model.from_dict({'event': {'type': 'click', 'x': 1}})
@@ -0,0 +1,74 @@
+import logging
+from typing import Optional, ForwardRef
+
+import pytest
+
+from pymodelio import PymodelioModel, Attr, resolve_refs
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+from pymodelio.validators import ForwardRefValidator, Validator
+
+
+class _Tree(PymodelioModel):
+    leaf: Attr(Optional['_Leaf'])
+
+
+class _Leaf(PymodelioModel):
+    value: Attr(int)
+
+
+def _define_node_model(value_type: type) -> type:
+    class Node(PymodelioModel):
+        value: Attr(value_type)
+        child: Attr(Optional['Node'])
+
+    return Node
+
+
+def test_self_references_are_resolved_when_the_model_is_defined():
+    class Person(PymodelioModel):
+        name: Attr(str)
+        grandchild: Attr(Optional['Person'])
+
+    validator = Person.__annotations__['grandchild'].validator
+    assert type(validator) is Validator
+    assert validator._expected_types == (Person,)
+    assert validator.nullable
+    Person(name='Rick', grandchild=Person(name='Morty'))
+    with pytest.raises(ModelValidationException):
+        Person(name='Rick', grandchild='Morty')
+
+
+def test_references_are_resolved_when_the_referenced_model_is_defined():
+    validator = _Tree.__annotations__['leaf'].validator
+    assert type(validator) is Validator
+    assert validator._expected_types == (_Leaf,)
+
+
+def test_models_with_the_same_name_resolve_their_own_references():
+    int_node, str_node = _define_node_model(int), _define_node_model(str)
+    assert int_node.__annotations__['child'].validator._expected_types == (int_node,)
+    assert str_node.__annotations__['child'].validator._expected_types == (str_node,)
+    with pytest.raises(ModelValidationException):
+        int_node(value=1, child=str_node(value='a'))
+
+
+def test_unresolved_references_are_warned_with_rate_limiting(caplog):
+    class Order(PymodelioModel):
+        customer: Attr(Optional['_UndefinedCustomer'])
+
+    validator = Order.__annotations__['customer'].validator
+    assert isinstance(validator, ForwardRefValidator)
+    with caplog.at_level(logging.WARNING, logger='pymodelio'):
+        Order(customer=1)
+        Order(customer=2)
+    assert len(caplog.records) == 1
+    assert '_UndefinedCustomer' in caplog.records[0].getMessage()
+    assert any(x.endswith('Order: _UndefinedCustomer') for x in resolve_refs())
+
+
+def test_resolve_refs_resolves_pending_references():
+    validator = ForwardRefValidator(ref=ForwardRef('_Leaf'))
+    assert not validator.is_resolved
+    resolve_refs()
+    assert validator.is_resolved
+    assert validator._expected_types == (_Leaf,)
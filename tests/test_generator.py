@@ -0,0 +1,134 @@
+from datetime import date, datetime
+from typing import Dict, List, Literal, Optional, Set, Tuple, Union
+
+import pytest
+
+from pymodelio import PymodelioModel
+from pymodelio.attribute import Attr
+from pymodelio.testing import generate, Violation
+from pymodelio.validators import IntValidator, StringValidator, EmailValidator, FloatValidator, ListValidator
+from tests.test_models.computer import Computer
+
+
+class _Child(PymodelioModel):
+    name: Attr(str, validator=StringValidator(min_len=2, max_len=4))
+
+
+class _GeneratedModel(PymodelioModel):
+    _int: Attr(int, validator=IntValidator(min_value=3, max_value=5), init_alias='int')
+    optional_str: Attr(Optional[str])
+    code: Attr(str, validator=StringValidator(fixed_len=6, regex=r'^[A-Z]+$'))
+    email: Attr(str, validator=EmailValidator())
+    negative_float: Attr(float, validator=FloatValidator(max_value=0))
+    datetimes: Attr(List[datetime])
+    date: Attr(date)
+    ints: Attr(Set[int])
+    data: Attr(dict)
+    child: Attr(_Child)
+    children: Attr(List[_Child], validator=ListValidator(elements_type=_Child, allow_empty=False))
+    optional_child: Attr(Optional[_Child])
+    non_initable: Attr(int, initable=False, default_factory=lambda: 1)
+
+
+def test_generate_valid_payloads():
+    payloads = generate(_GeneratedModel, 200, seed=1)
+    assert len(payloads) == 200
+    for payload in payloads:
+        assert 'non_initable' not in payload
+        assert 3 <= payload['int'] <= 5
+        assert len(payload['code']) == 6 and payload['code'].isupper()
+        assert 2 <= len(payload['child']['name']) <= 4
+        assert len(payload['children']) > 0
+        _GeneratedModel.from_dict(payload)
+
+
+class _NestedGeneratedModel(PymodelioModel):
+    matrix: Attr(List[List[int]])
+    labels: Attr(Dict[str, str])
+    children_by_name: Attr(Dict[str, List[_Child]])
+    pair: Attr(Tuple[int, str])
+    kind: Attr(Literal['x', 'y'])
+    kinds: Attr(List[Literal['x', 'y']])
+    pairs: Attr(Set[Tuple[int, str]])
+    optional_children: Attr(Optional[Dict[int, Tuple[_Child, ...]]])
+
+
+def test_generate_valid_payloads_for_nested_types():
+    payloads = generate(_NestedGeneratedModel, 50, seed=1)
+    assert all(result.is_valid for result in _NestedGeneratedModel.try_from_dict_many(payloads))
+    assert all(payload['kind'] in ('x', 'y') for payload in payloads)
+    assert all(len(payload['pair']) == 2 for payload in payloads)
+
+
+class _Click(PymodelioModel):
+    type: Attr(Literal['click'])
+    x: Attr(int)
+
+
+class _Scroll(PymodelioModel):
+    type: Attr(Literal['scroll', 'wheel'])
+    delta: Attr(int)
+
+
+class _Resize(PymodelioModel):
+    width: Attr(int)
+
+
+class _UnionsGeneratedModel(PymodelioModel):
+    tagged: Attr(List[Union[_Click, _Scroll]], discriminator='type')
+    untagged: Attr(List[Union[_Click, _Resize]])
+    last: Attr(Optional[Union[_Click, _Scroll]], discriminator='type')
+
+
+def test_generate_valid_payloads_for_unions():
+    payloads = generate(_UnionsGeneratedModel, 50, seed=1)
+    assert all(result.is_valid for result in _UnionsGeneratedModel.try_from_dict_many(payloads))
+    assert all(x['type'] in ('click', 'scroll', 'wheel') for payload in payloads for x in payload['tagged'])
+    models = generate(_UnionsGeneratedModel, 10, seed=1, as_models=True)
+    assert all(isinstance(x, (_Click, _Scroll)) for model in models for x in model.tagged)
+
+
+def test_generate_is_deterministic():
+    assert generate(Computer, 10, seed=7) == generate(Computer, 10, seed=7)
+    assert generate(Computer, 10, seed=7) != generate(Computer, 10, seed=8)
+
+
+def test_generate_models():
+    computers = generate(Computer, 5, seed=1, as_models=True)
+    assert all(isinstance(computer, Computer) for computer in computers)
+
+
+def test_generate_streams_payloads():
+    payloads = generate(Computer, 3, seed=1, stream=True)
+    assert not isinstance(payloads, list)
+    assert list(payloads) == generate(Computer, 3, seed=1)
+
+
+def test_generate_injects_violations():
+    items = generate(_GeneratedModel, 500, seed=1, invalid_ratio=0.3, with_violations=True)
+    violations = [violation for _, violation in items if violation is not None]
+    assert 100 < len(violations) < 200
+    assert all(isinstance(violation, Violation) for violation in violations)
+    for payload, violation in items:
+        result = _GeneratedModel.try_from_dict(payload)
+        assert result.is_valid == (violation is None)
+        if violation is not None:
+            assert result.errors[0].path[0] in (violation.key, '_' + violation.key)
+
+
+def test_generate_with_factories():
+    payloads = generate(_Child, 3, seed=1, factories={'name': lambda rng: 'Rick'})
+    assert payloads == [{'name': 'Rick'}] * 3
+
+
+def test_generate_fails_for_unsatisfiable_regexes():
+    class Model(PymodelioModel):
+        attr: Attr(str, validator=StringValidator(regex=r'^a[!]+$'))
+
+    with pytest.raises(ValueError, match='provide a factory for the attribute'):
+        generate(Model, 1)
+
+
+def test_generate_validates_invalid_ratio():
+    with pytest.raises(ValueError):
+        generate(Computer, 1, invalid_ratio=2)
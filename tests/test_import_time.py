@@ -0,0 +1,62 @@
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+import pymodelio
+from pymodelio import validators, exceptions
+from pymodelio.benchmarks.import_time import measure_import_time, main
+from pymodelio.utils import _parse_datetime_from_isoformat
+
+
+def _modules_loaded_by(statement: str) -> set:
+    code = '%s\nimport sys\nprint("\\n".join(sys.modules))' % statement
+    process = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return set(process.stdout.splitlines())
+
+
+def test_importing_pymodelio_does_not_import_its_submodules_nor_its_dependencies():
+    loaded = _modules_loaded_by('import pymodelio')
+    assert 'pymodelio' in loaded
+    for module in ('pymodelio.pymodelio_model', 'pymodelio.validators', 'typing', 'ciso8601', 'uuid', 'decimal'):
+        assert module not in loaded
+
+
+def test_importing_a_model_does_not_import_the_datetime_parser():
+    loaded = _modules_loaded_by('from pymodelio import PymodelioModel, Attr')
+    assert 'pymodelio.pymodelio_model' in loaded
+    assert 'ciso8601' not in loaded
+
+
+def test_lazy_names_are_resolved_on_access():
+    assert pymodelio.PymodelioModel.__name__ == 'PymodelioModel'
+    assert validators.IntValidator.__name__ == 'IntValidator'
+    assert exceptions.ModelValidationException.__name__ == 'ModelValidationException'
+    assert 'PymodelioModel' in dir(pymodelio)
+
+
+def test_unknown_names_raise_attribute_error():
+    with pytest.raises(AttributeError):
+        pymodelio.NonExistent  # noqa
+    with pytest.raises(AttributeError):
+        validators.NonExistent  # noqa
+
+
+def test_fallback_datetime_parser_supports_utc_designator():
+    assert _parse_datetime_from_isoformat('2020-01-01T10:20:30Z') == datetime(2020, 1, 1, 10, 20, 30,
+                                                                               tzinfo=timezone.utc)
+    assert _parse_datetime_from_isoformat('2020-01-01T10:20:30') == datetime(2020, 1, 1, 10, 20, 30)
+
+
+def test_measure_import_time_and_budget_check():
+    assert measure_import_time(runs=1) > 0
+    assert main(['--budget-ms', '10000', '--runs', '1']) == 0
+    assert main(['--budget-ms', '0', '--runs', '1']) == 1
+
+
+def test_run_benchmarks_includes_import_time():
+    from pymodelio.benchmarks import run_benchmarks
+    run = run_benchmarks(list_lengths=(), depths=(), min_time=0, repeat=1)
+    assert run['results']['import/pymodelio/package'] > 0
+    assert run['results']['import/pymodelio/model'] > 0
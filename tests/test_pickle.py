@@ -0,0 +1,60 @@
+import pickle
+from datetime import datetime
+from typing import List, Optional
+
+from pymodelio import PymodelioModel, Attr
+
+
+class _Component(PymodelioModel):
+    name: Attr(str)
+
+
+class _Product(PymodelioModel):
+    name: Attr(str)
+    _price: Attr(float, init_alias='price')
+    created_at: Attr(datetime)
+    components: Attr(List[_Component])
+    parent: Attr(Optional['_Product'], default_factory=lambda: None)
+
+    def __once_validated__(self) -> None:
+        self.label = self.name.upper()
+
+
+def _product(**kwargs):
+    return _Product(**{
+        'name': 'Portal gun', 'price': 9.5, 'created_at': datetime(2023, 1, 2), 'components': [_Component(name='a')],
+        **kwargs
+    })
+
+
+def test_models_are_pickled_by_their_declared_class():
+    product = _product(parent=_product(name='Plumbus'))
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        loaded = pickle.loads(pickle.dumps(product, protocol=protocol))
+        assert type(loaded) is type(product)
+        assert loaded == product
+        assert loaded._price == 9.5
+        assert isinstance(loaded.components[0], _Component)
+        assert loaded.parent.name == 'Plumbus'
+        assert loaded.label == 'PORTAL GUN'
+
+
+def test_loading_pickled_models_does_not_initialize_them():
+    calls = []
+    _Product.__once_validated__, once_validated = lambda self: calls.append(self), _Product.__once_validated__
+    try:
+        product = _product()
+        calls.clear()
+        loaded = pickle.loads(pickle.dumps(product))
+    finally:
+        _Product.__once_validated__ = once_validated
+    assert calls == []
+    assert loaded.check().is_valid
+
+
+def test_pickled_values_are_assigned_by_name_if_the_attributes_changed():
+    restore, (pmcls, attr_names, values), state = _product().__reduce__()
+    assert state == {'label': 'PORTAL GUN'}
+    loaded = restore(pmcls, tuple(reversed(attr_names))[1:], tuple(reversed(values))[1:])
+    assert loaded.name == 'Portal gun'
+    assert loaded.parent is None
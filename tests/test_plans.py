@@ -0,0 +1,172 @@
+import os
+import sys
+from itertools import count
+
+import pytest
+
+from pymodelio import PymodelioSettings, PymodelioSetting
+from pymodelio.__main__ import main
+from pymodelio.plans import compile_module, plans_path, flush, clear
+from pymodelio.pymodelio_meta import PymodelioMeta
+
+_MODELS_SOURCE = '''
+from typing import List
+
+from pymodelio import Attr, PymodelioModel
+from pymodelio.decorators.deserializes import deserializes
+
+
+class Item(PymodelioModel):
+    name: Attr(str)
+    _price: Attr(int, init_alias='price')
+
+    @property
+    def price(self) -> int:
+        return self._price
+
+    @deserializes('name')
+    def _deserialize_name(cls, value: str) -> str:
+        return value.upper()
+
+
+class Cart(PymodelioModel):
+    items: Attr(List[Item])
+'''
+
+_PAYLOAD = {'items': [{'name': 'apple', 'price': 3}]}
+
+_package_ids = count()
+
+
+@pytest.fixture
+def package(tmp_path):
+    name = '_plans_package_%s' % next(_package_ids)
+    package_dir = tmp_path / name
+    package_dir.mkdir()
+    (package_dir / '__init__.py').write_text('')
+    (package_dir / 'models.py').write_text(_MODELS_SOURCE)
+    sys.path.insert(0, str(tmp_path))
+    PymodelioSettings.set(PymodelioSetting.USE_COMPILED_PLANS, True)
+    PymodelioSettings.set(PymodelioSetting.PLANS_CACHE_DIR, str(tmp_path / 'cache'))
+    clear()
+    try:
+        yield name
+    finally:
+        sys.path.remove(str(tmp_path))
+        for module_name in [x for x in sys.modules if x.startswith(name)]:
+            del sys.modules[module_name]
+        clear()
+        PymodelioSettings.reset()
+
+
+def _import_models(package: str):
+    __import__('%s.models' % package)
+    return sys.modules['%s.models' % package]
+
+
+def _fail_building_plans(monkeypatch):
+    def build_plan(cls, pmcls, model_attrs=None):
+        raise AssertionError('the plan of %s was built' % pmcls.__name__)
+
+    monkeypatch.setattr(PymodelioMeta, 'build_plan', classmethod(build_plan))
+
+
+def test_compiled_plans_are_used_instead_of_analysing_the_models(package, monkeypatch, tmp_path):
+    path, models = compile_module('%s.models' % package)
+    assert models == ['Cart', 'Item']
+    assert path == plans_path('%s.models' % package)
+    # The plans are stored in the cache directory, in a tree mirroring the one of the sources
+    assert path.startswith(str(tmp_path / 'cache')) and path.endswith(os.path.join(package, 'models.plans'))
+    assert set(os.listdir(tmp_path / package)).issubset({'__init__.py', '__pycache__', 'models.py'})
+    clear()
+    _fail_building_plans(monkeypatch)
+    cart = _import_models(package).Cart.from_dict(_PAYLOAD)
+    assert cart.to_dict() == {'items': [{'name': 'APPLE', 'price': 3}]}
+
+
+def test_plans_are_built_if_the_schema_changed_since_compiling(package, monkeypatch):
+    compile_module('%s.models' % package)
+    models = _import_models(package)
+    with open(models.__file__, 'a') as f:
+        f.write('\n\nclass Other(PymodelioModel):\n    value: Attr(int)\n')
+    clear()
+    built = []
+    build_plan = PymodelioMeta.build_plan
+    monkeypatch.setattr(PymodelioMeta, 'build_plan',
+                        classmethod(lambda cls, pmcls, attrs=None: built.append(pmcls) or build_plan(pmcls, attrs)))
+    assert models.Cart.from_dict(_PAYLOAD).items[0].name == 'APPLE'
+    assert sorted(x.__name__ for x in built) == ['Cart', 'Item']
+
+
+def test_plans_are_built_if_the_attributes_changed_since_compiling(package, monkeypatch):
+    compile_module('%s.models' % package)
+    clear()
+    # The sources did not change, but the models are declared again with other validators
+    del sys.modules['%s.models' % package]
+    PymodelioSettings.set(PymodelioSetting.USE_DEFAULT_ATTR_VALIDATOR_IF_NOT_DEFINED, False)
+    _fail_building_plans(monkeypatch)
+    with pytest.raises(AssertionError):
+        _import_models(package).Cart.from_dict(_PAYLOAD)
+
+
+def test_compiled_plans_are_not_used_by_default(package, monkeypatch):
+    compile_module('%s.models' % package)
+    clear()
+    PymodelioSettings.reset()
+    _fail_building_plans(monkeypatch)
+    with pytest.raises(AssertionError):
+        _import_models(package).Cart.from_dict(_PAYLOAD)
+
+
+def test_corrupted_compiled_plans_are_ignored(package):
+    path, _ = compile_module('%s.models' % package)
+    with open(path, 'w') as f:
+        f.write('PLANS = {')
+    clear()
+    assert _import_models(package).Cart.from_dict(_PAYLOAD).items[0].price == 3
+
+
+def test_compiled_plans_are_ignored_if_disabled(package, monkeypatch):
+    compile_module('%s.models' % package)
+    clear()
+    PymodelioSettings.set(PymodelioSetting.USE_COMPILED_PLANS, False)
+    _fail_building_plans(monkeypatch)
+    with pytest.raises(AssertionError):
+        _import_models(package).Cart.from_dict(_PAYLOAD)
+
+
+def test_plans_are_compiled_automatically_if_enabled(package, monkeypatch):
+    PymodelioSettings.set(PymodelioSetting.AUTO_COMPILE_PLANS, True)
+    models = _import_models(package)
+    models.Cart.from_dict(_PAYLOAD)
+    flush()
+    clear()
+    _fail_building_plans(monkeypatch)
+    models.Item._set_inner_model(None)
+    models.Cart._set_inner_model(None)
+    assert models.Cart.from_dict(_PAYLOAD).items[0].name == 'APPLE'
+
+
+def test_models_defined_in_functions_are_not_compiled(package, monkeypatch):
+    compile_module('%s.models' % package)
+    models = _import_models(package)
+
+    def define_model():
+        class Local(models.Item):
+            pass
+
+        return Local
+
+    built = []
+    build_plan = PymodelioMeta.build_plan
+    monkeypatch.setattr(PymodelioMeta, 'build_plan',
+                        classmethod(lambda cls, pmcls, attrs=None: built.append(pmcls) or build_plan(pmcls, attrs)))
+    define_model()(name='a', price=1)
+    assert [x.__name__ for x in built] == ['Local']
+
+
+def test_compile_command_compiles_the_modules_of_packages(package, capsys):
+    assert main(['compile', package]) == 0
+    output = capsys.readouterr().out
+    assert '%s: no models found' % package in output
+    assert '%s.models: 2 models compiled to %s' % (package, plans_path('%s.models' % package)) in output
@@ -1,3 +1,4 @@
+import inspect
 from datetime import datetime, date
 from typing import Any, Optional, List, Set, Tuple, Dict, Union
 
@@ -7,7 +8,9 @@ from pymodelio import PymodelioModel, PymodelioSettings, PymodelioSetting
 from pymodelio.attribute import Attr, PymodelioAttr
 from pymodelio.constants import UNDEFINED
 from pymodelio.decorators.deserializes import deserializes
+from pymodelio.exceptions import ValidationError
 from pymodelio.exceptions.model_validation_exception import ModelValidationException
+from pymodelio.validators import Validator
 from tests.test_models.computer import Computer
 
 
@@ -482,3 +485,219 @@ def test_model_inner_model_class_is_created_correctly_when_parent_model_was_alre
     assert isinstance(child_instance, TestCaseChildModel)
     assert child_instance._attr_1 == 123
     assert child_instance._attr_2 == 456
+
+
+class _CountingValidator(Validator):
+
+    def __init__(self) -> None:
+        super().__init__(expected_type=str)
+        self.calls = 0
+
+    def validate(self, value: Any, path: str = None) -> None:
+        self.calls += 1
+        super().validate(value, path)
+
+
+def test_validate_validates_shared_submodels_only_once_per_validation_pass():
+    validator = _CountingValidator()
+
+    class ChildModel(PymodelioModel):
+        attr: Attr(str, validator=validator)
+
+    class ParentModel(PymodelioModel):
+        children: Attr(List[ChildModel])
+
+    shared_child = ChildModel(attr='shared', auto_validate=False)
+
+    ParentModel(children=[shared_child, shared_child, shared_child])
+    assert validator.calls == 1
+
+
+def test_validate_does_not_revalidate_submodels_that_were_not_modified_since_their_last_validation():
+    validator = _CountingValidator()
+
+    class ChildModel(PymodelioModel):
+        attr: Attr(str, validator=validator)
+
+    class ParentModel(PymodelioModel):
+        child: Attr(ChildModel)
+
+    child = ChildModel(attr='child')
+    assert validator.calls == 1
+
+    parent = ParentModel(child=child)
+    assert validator.calls == 1
+
+    child.attr = 12345
+    with pytest.raises(ModelValidationException) as ex_info:
+        parent.validate()
+    assert ex_info.value.args[0] == 'ParentModel.child.attr is not instance of str'
+    assert validator.calls == 2
+
+
+def test_validate_revalidates_models_holding_mutable_values():
+    class TestCaseModel(PymodelioModel):
+        attr: Attr(List[int])
+
+    instance = TestCaseModel(attr=[1, 2, 3])
+    instance.attr.append('4')
+    with pytest.raises(ModelValidationException) as ex_info:
+        instance.validate()
+    assert ex_info.value.args[0] == 'TestCaseModel.attr[3] is not instance of int'
+
+
+def test_validate_collects_all_the_errors_with_structured_paths_when_collect_errors_is_enabled():
+    class ChildModel(PymodelioModel):
+        name: Attr(str)
+        age: Attr(int)
+
+    class ParentModel(PymodelioModel):
+        name: Attr(str)
+        child: Attr(ChildModel)
+        children: Attr(List[ChildModel])
+        numbers: Attr(List[int])
+
+    instance = ParentModel(
+        name=1,
+        child=ChildModel(name='child', age='1', auto_validate=False),
+        children=[ChildModel(name='child', age=1, auto_validate=False),
+                  ChildModel(name=2, age=None, auto_validate=False)],
+        numbers=[1, '2', 3, '4'],
+        auto_validate=False
+    )
+
+    with pytest.raises(ModelValidationException) as ex_info:
+        instance.validate(collect_errors=True)
+
+    assert ex_info.value.errors == [
+        ValidationError('ParentModel', ('name',), 'is not instance of str'),
+        ValidationError('ParentModel', ('child', 'age'), 'is not instance of int'),
+        ValidationError('ParentModel', ('children', 1, 'name'), 'is not instance of str'),
+        ValidationError('ParentModel', ('children', 1, 'age'), 'must not be None'),
+        ValidationError('ParentModel', ('numbers', 1), 'is not instance of int'),
+        ValidationError('ParentModel', ('numbers', 3), 'is not instance of int'),
+    ]
+    assert ex_info.value.args[0] == '\n'.join([
+        'ParentModel.name is not instance of str',
+        'ParentModel.child.age is not instance of int',
+        'ParentModel.children[1].name is not instance of str',
+        'ParentModel.children[1].age must not be None',
+        'ParentModel.numbers[1] is not instance of int',
+        'ParentModel.numbers[3] is not instance of int',
+    ])
+
+
+def test_from_dict_collects_all_the_errors_when_collect_errors_is_enabled():
+    class TestCaseModel(PymodelioModel):
+        attr_1: Attr(str)
+        attr_2: Attr(int)
+
+    with pytest.raises(ModelValidationException) as ex_info:
+        TestCaseModel.from_dict({'attr_1': 1, 'attr_2': '2'}, collect_errors=True)
+    assert [error.full_path for error in ex_info.value.errors] == ['TestCaseModel.attr_1', 'TestCaseModel.attr_2']
+
+
+def test_validate_collects_errors_raised_when_validating_an_attr():
+    class ChildModel(PymodelioModel):
+        name: Attr(str)
+
+        def __when_validating_an_attr__(self, attr_name: str, attr_value: Any, attr_path: str, parent_path: str,
+                                        attr: PymodelioAttr) -> None:
+            if len(attr_value) == 0:
+                raise ModelValidationException(f'{attr_path} must not be blank')
+
+    class ParentModel(PymodelioModel):
+        children: Attr(List[ChildModel])
+
+    instance = ParentModel(children=[ChildModel(name='', auto_validate=False)], auto_validate=False)
+
+    with pytest.raises(ModelValidationException) as ex_info:
+        instance.validate()
+    assert ex_info.value.args[0] == 'ParentModel.children[0].name must not be blank'
+
+    with pytest.raises(ModelValidationException) as ex_info:
+        instance.validate(collect_errors=True)
+    assert ex_info.value.errors == [ValidationError('ParentModel', ('children', 0, 'name'), 'must not be blank')]
+
+
+def test_try_from_dict_returns_the_model_or_the_validation_errors_without_raising():
+    class TestCaseModel(PymodelioModel):
+        attr_1: Attr(str)
+        attr_2: Attr(int)
+
+    result = TestCaseModel.try_from_dict({'attr_1': '1', 'attr_2': 2})
+    assert result.is_valid
+    assert result.value == TestCaseModel(attr_1='1', attr_2=2)
+    assert result.errors == []
+
+    value, errors = TestCaseModel.try_from_dict({'attr_1': 1, 'attr_2': '2'})
+    assert value is None
+    assert errors == [ValidationError('TestCaseModel', ('attr_1',), 'is not instance of str')]
+
+    result = TestCaseModel.try_from_dict({'attr_1': 1, 'attr_2': '2'}, collect_errors=True)
+    assert not result.is_valid
+    assert len(result.errors) == 2
+
+
+def test_try_from_dict_runs_the_initialization_hooks_without_exposing_the_validation_context():
+    class TestCaseModel(PymodelioModel):
+        attr: Attr(int)
+        _validation_context: Attr(Optional[str], init_alias='validation_context', default_factory=lambda: None)
+
+        def __once_validated__(self) -> None:
+            self.doubled = self.attr * 2
+
+    assert '_validation_context' not in inspect.signature(TestCaseModel.__init__).parameters
+    result = TestCaseModel.try_from_dict({'attr': 3, 'validation_context': 'x'})
+    assert result.value.doubled == 6
+    assert result.value._validation_context == 'x'
+
+
+def test_try_from_dict_many_returns_a_result_per_row():
+    class ChildModel(PymodelioModel):
+        attr: Attr(int)
+
+    class TestCaseModel(PymodelioModel):
+        children: Attr(List[ChildModel])
+
+    results = TestCaseModel.try_from_dict_many([
+        {'children': [{'attr': 1}]},
+        {'children': [{'attr': 1}, {'attr': '2'}]},
+        {'children': []},
+    ])
+
+    assert [result.is_valid for result in results] == [True, False, True]
+    assert results[0].value.children[0].attr == 1
+    assert results[1].value is None
+    assert results[1].errors == [ValidationError('TestCaseModel', ('children', 1, 'attr'), 'is not instance of int')]
+
+
+def test_check_validates_the_model_without_raising():
+    class TestCaseModel(PymodelioModel):
+        attr: Attr(int)
+
+    instance = TestCaseModel(attr='1', auto_validate=False)
+    assert instance.check().errors == [ValidationError('TestCaseModel', ('attr',), 'is not instance of int')]
+
+    instance.attr = 1
+    assert instance.check().value is instance
+
+
+def test_nested_models_overriding_validate_are_validated_with_their_own_method():
+    class ChildModel(PymodelioModel):
+        attr: Attr(int)
+
+        def validate(self, path: str = None, collect_errors: bool = False) -> None:
+            super().validate(path, collect_errors)
+            if self.attr < 0:
+                raise ModelValidationException(f'{path} must not be negative')
+
+    class ParentModel(PymodelioModel):
+        child: Attr(ChildModel)
+
+    with pytest.raises(ModelValidationException) as ex_info:
+        ParentModel(child=ChildModel(attr=-1, auto_validate=False))
+    assert ex_info.value.args[0] == 'ParentModel.child must not be negative'
+
+    result = ParentModel(child=ChildModel(attr=-1, auto_validate=False), auto_validate=False).check()
+    assert result.errors == [ValidationError('ParentModel', ('child',), 'must not be negative')]
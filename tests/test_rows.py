@@ -0,0 +1,187 @@
+import json
+import sqlite3
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional
+
+import pytest
+
+from pymodelio import PymodelioModel, Attr
+from pymodelio.decorators.deserializes import deserializes
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+from pymodelio.testing import assert_allocations
+
+
+class _Event(PymodelioModel):
+    name: Attr(str)
+    _seats: Attr(int, init_alias='seats')
+    starts_at: Attr(datetime)
+    day: Attr(Optional[date], default_factory=lambda: None)
+
+    @deserializes('name')
+    def _deserialize_name(cls, value: str) -> str:
+        return value.strip()
+
+
+def _cursor(rows):
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE events (name TEXT, seats INTEGER, starts_at TEXT, day TEXT)')
+    connection.executemany('INSERT INTO events VALUES (?, ?, ?, ?)', rows)
+    return connection.execute('SELECT * FROM events ORDER BY seats')
+
+
+def test_from_rows_maps_the_columns_to_the_attributes():
+    events = _Event.from_rows([(' Concert ', 100, '2023-01-02T03:04:05+00:00')], ['name', 'seats', 'starts_at'])
+    assert len(events) == 1
+    assert isinstance(events[0], _Event)
+    assert events[0].name == 'Concert'
+    assert events[0]._seats == 100
+    assert events[0].starts_at == datetime(2023, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert events[0].day is None
+    events = _Event.from_rows([('Concert', 100, datetime(2023, 1, 2))], ['name', '_seats', 'starts_at'], trusted=True)
+    assert events[0]._seats == 100
+
+
+def test_from_rows_validates_the_models_unless_trusted():
+    rows = [('Concert', 'many', 'not a date')]
+    with pytest.raises(ModelValidationException):
+        _Event.from_rows(rows, ['name', 'seats', 'starts_at'])
+    assert _Event.from_rows(rows, ['name', 'seats', 'starts_at'], trusted=True)[0]._seats == 'many'
+
+
+def test_from_rows_does_not_accept_unknown_columns():
+    with pytest.raises(NameError) as ex_info:
+        _Event.from_rows([], ['name', 'price'])
+    assert str(ex_info.value) == 'price is not an attribute of class _Event'
+
+
+class _Order(PymodelioModel):
+    quantity: Attr(int)
+    total: Attr(Optional[int], initable=False, default_factory=lambda: None)
+
+    def __before_validate__(self) -> None:
+        self.quantity = abs(self.quantity)
+
+    def __once_validated__(self) -> None:
+        self.total = self.quantity * 2
+
+
+def test_from_rows_initializes_the_models_like_from_dict_unless_trusted():
+    assert _Order.from_rows([(-3,)], ['quantity'])[0].total == _Order.from_dict({'quantity': -3}).total == 6
+    assert _Order.from_rows([(-3,)], ['quantity'], trusted=True)[0].total is None
+    with pytest.raises(NameError) as ex_info:
+        _Order.from_rows([(3, 10)], ['quantity', 'total'])
+    assert str(ex_info.value) == 'total attribute is not initable for class _Order'
+    with pytest.raises(NameError):
+        _Event.from_rows([], ['name', '_seats'])
+
+
+class _Point(PymodelioModel):
+    x: Attr(int)
+    y: Attr(int)
+
+
+class _Reading(PymodelioModel):
+    value: Attr(int)
+
+    def __before_init__(self, *args, **kwargs):
+        kwargs['value'] = int(kwargs['value'])
+        return args, kwargs
+
+
+def test_from_rows_does_not_build_a_dict_per_row():
+    rows = [(i, i) for i in range(100)]
+    # The values are assigned by position, so each row only allocates its model and the objects of its validation
+    assert_allocations(lambda: _Point.from_rows(rows, ['x', 'y']), max=100 * 3 + 30)
+
+
+def test_from_rows_calls_overridden_before_init_with_the_values_of_the_row():
+    assert _Reading.from_rows([('3',)], ['value'])[0].value == 3
+
+
+def test_from_cursor_fetches_the_rows_in_batches():
+    cursor = _cursor([('Event %s' % i, i, '2023-01-02T03:04:05', '2023-01-02') for i in range(5)])
+    fetched = []
+    fetchmany = cursor.fetchmany
+
+    class _Cursor:
+        description = cursor.description
+
+        def fetchmany(self, size):
+            rows = fetchmany(size)
+            fetched.append(len(rows))
+            return rows
+
+    events = _Event.from_cursor(_Cursor(), batch_size=2)
+    assert fetched == []
+    assert [x._seats for x in events] == [0, 1, 2, 3, 4]
+    assert fetched == [2, 2, 1, 0]
+    assert _Event.from_cursor(_cursor([('Concert', 1, '2023-01-02T03:04:05', '2023-01-02')])).__next__().day == \
+        date(2023, 1, 2)
+
+
+class _Ticket(PymodelioModel):
+    code: Attr(str)
+    _price: Attr(float, init_alias='price')
+    sold_at: Attr(Optional[datetime])
+
+    @property
+    def price(self) -> float:
+        return self._price
+
+    def describe(self) -> str:
+        return self.code
+
+
+def _tickets(n):
+    return [_Ticket(code='T%s' % i, price=i / 2, sold_at=datetime(2023, 1, 2) if i % 2 else None) for i in range(n)]
+
+
+def test_to_rows_exports_the_serializable_attributes_as_tuples():
+    assert _Ticket.get_row_columns() == ['code', 'sold_at', 'price']
+    rows = _Ticket.to_rows(_tickets(2))
+    assert not isinstance(rows, list)
+    assert list(rows) == [('T0', None, 0.0), ('T1', '2023-01-02T00:00:00', 0.5)]
+    assert list(_Ticket.to_rows(_tickets(2), columns=['_price'])) == [(0.0,), (0.5,)]
+    with pytest.raises(NameError):
+        list(_Ticket.to_rows(_tickets(1), columns=['describe']))
+
+
+def test_to_rows_adapts_the_values_by_the_type_of_their_columns():
+    rows = _Ticket.to_rows(_tickets(2), adapters={datetime: datetime.timestamp, float: lambda x: int(x * 100)})
+    assert list(rows) == [('T0', None, 0), ('T1', datetime(2023, 1, 2).timestamp(), 50)]
+
+
+
+class _Basket(PymodelioModel):
+    owner: Attr(str)
+    tickets: Attr(List[_Ticket])
+    tags: Attr(Optional[Dict[str, int]])
+    first: Attr(Optional[_Ticket])
+
+
+def test_to_rows_exports_nested_models_and_collections_as_json():
+    tickets = _tickets(2)
+    basket = _Basket(owner='Rick', tickets=tickets, tags={'a': 1}, first=tickets[1])
+    rows = list(_Basket.to_rows([basket, _Basket(owner='Morty', tickets=[], tags=None, first=None)]))
+    assert rows[0][1] == json.dumps([x.to_dict() for x in tickets])
+    assert rows[0][2:] == ('{"a": 1}', json.dumps(tickets[1].to_dict()))
+    assert rows[1] == ('Morty', '[]', None, None)
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE baskets (owner TEXT, tickets TEXT, tags TEXT, first TEXT)')
+    connection.executemany('INSERT INTO baskets VALUES (?, ?, ?, ?)', rows)
+    assert list(_Basket.to_rows([basket], adapters={dict: len}))[0][2] == 1
+
+def test_to_rows_generates_chunks_of_rows():
+    chunks = list(_Ticket.to_rows(_tickets(5), columns=['code'], chunk_size=2))
+    assert chunks == [[('T0',), ('T1',)], [('T2',), ('T3',)], [('T4',)]]
+    with pytest.raises(ValueError):
+        _Ticket.to_rows([], chunk_size=0)
+
+
+def test_to_rows_round_trips_through_a_database():
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE tickets (code TEXT, sold_at TEXT, price REAL)')
+    for chunk in _Ticket.to_rows(_tickets(3), chunk_size=2):
+        connection.executemany('INSERT INTO tickets VALUES (?, ?, ?)', chunk)
+    tickets = list(_Ticket.from_cursor(connection.execute('SELECT * FROM tickets ORDER BY code')))
+    assert [x.to_dict() for x in tickets] == [x.to_dict() for x in _tickets(3)]
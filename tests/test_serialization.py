@@ -98,3 +98,21 @@ def test_to_dict_serializes_dates_to_strings():
     instance = TestCaseModel(d=date(2023, 4, 24))
 
     assert instance.to_dict() == {'d': '2023-04-24'}
+
+
+def test_serializable_attrs_only_hold_the_public_attributes_and_properties_of_the_model():
+    class TestCaseModel(PymodelioModel):
+        name: Attr(str)
+        _code: Attr(str, init_alias='code')
+
+        @property
+        def upper_name(self) -> str:
+            return self.name.upper()
+
+        def describe(self) -> str:
+            return self.name
+
+    instance = TestCaseModel(name='Test Name', code='T')
+
+    assert sorted(instance.__serializable_attrs__) == ['name', 'upper_name']
+    assert instance.to_dict() == {'name': 'Test Name', 'upper_name': 'TEST NAME'}
@@ -0,0 +1,84 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from pymodelio import PymodelioModel, PymodelioSettings, PymodelioSetting
+from pymodelio.attribute import Attr
+from pymodelio.utils import get_datetime_converter
+
+_DATETIME = '2023-04-15T10:37:10'
+
+
+class _Event(PymodelioModel):
+    at: Attr(datetime)
+
+
+class _UTCEvent(PymodelioModel):
+    __settings__ = {PymodelioSetting.AUTO_PARSE_DATES_AS_UTC: True}
+    at: Attr(datetime)
+
+
+@pytest.fixture(autouse=True)
+def _reset_settings():
+    try:
+        yield
+    finally:
+        PymodelioSettings.reset()
+
+
+def test_override_sets_settings_within_its_scope():
+    with PymodelioSettings.override(AUTO_PARSE_DATES_AS_UTC=True):
+        assert PymodelioSettings.get(PymodelioSetting.AUTO_PARSE_DATES_AS_UTC) is True
+        assert _Event.from_dict({'at': _DATETIME}).at.tzinfo == timezone.utc
+        with PymodelioSettings.override({PymodelioSetting.USE_DEFAULT_ATTR_VALIDATOR_IF_NOT_DEFINED: False}):
+            assert PymodelioSettings.get(PymodelioSetting.AUTO_PARSE_DATES_AS_UTC) is True
+            assert PymodelioSettings.get(PymodelioSetting.USE_DEFAULT_ATTR_VALIDATOR_IF_NOT_DEFINED) is False
+        assert PymodelioSettings.get(PymodelioSetting.USE_DEFAULT_ATTR_VALIDATOR_IF_NOT_DEFINED) is True
+    assert PymodelioSettings.get(PymodelioSetting.AUTO_PARSE_DATES_AS_UTC) is False
+    assert _Event.from_dict({'at': _DATETIME}).at.tzinfo is None
+
+
+def test_overridden_settings_take_precedence_over_global_ones():
+    PymodelioSettings.set(PymodelioSetting.AUTO_PARSE_DATES_AS_UTC, True)
+    with PymodelioSettings.override(AUTO_PARSE_DATES_AS_UTC=False):
+        assert _Event.from_dict({'at': _DATETIME}).at.tzinfo is None
+    assert _Event.from_dict({'at': _DATETIME}).at.tzinfo == timezone.utc
+
+
+def test_override_checks_the_settings():
+    with pytest.raises(AssertionError):
+        PymodelioSettings.override(AUTO_PARSE_DATES_AS_UTC='yes')
+    with pytest.raises(KeyError):
+        PymodelioSettings.override(NON_EXISTENT_SETTING=True)
+
+
+def test_model_settings_take_precedence_over_the_other_ones():
+    with PymodelioSettings.override(AUTO_PARSE_DATES_AS_UTC=False):
+        assert _UTCEvent.from_dict({'at': _DATETIME}).at.tzinfo == timezone.utc
+    assert PymodelioSettings.get_for_model(PymodelioSetting.AUTO_PARSE_DATES_AS_UTC, _Event) is False
+
+
+def test_settings_overrides_are_isolated_between_concurrent_tasks():
+    async def deserialize(as_utc: bool) -> datetime:
+        with PymodelioSettings.override(AUTO_PARSE_DATES_AS_UTC=as_utc):
+            await asyncio.sleep(0)
+            return _Event.from_dict({'at': _DATETIME}).at
+
+    async def run() -> list:
+        return await asyncio.gather(deserialize(True), deserialize(False), deserialize(True))
+
+    assert [x.tzinfo for x in asyncio.run(run())] == [timezone.utc, None, timezone.utc]
+
+
+def test_attrs_declared_within_an_override_use_its_settings():
+    with PymodelioSettings.override(USE_DEFAULT_ATTR_VALIDATOR_IF_NOT_DEFINED=False):
+        attr = Attr(int)
+    assert attr.validator is None
+    assert Attr(int).validator is not None
+
+
+def test_datetime_converters_are_built_once_per_settings_combination():
+    assert get_datetime_converter(True) is get_datetime_converter(True)
+    assert get_datetime_converter(True)(_DATETIME) == datetime(2023, 4, 15, 10, 37, 10, tzinfo=timezone.utc)
+    assert get_datetime_converter(False)(_DATETIME) == datetime(2023, 4, 15, 10, 37, 10)
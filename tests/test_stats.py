@@ -0,0 +1,98 @@
+from typing import List
+
+import pytest
+
+from pymodelio import PymodelioModel, stats
+from pymodelio.attribute import Attr
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+
+
+class _StatsChild(PymodelioModel):
+    value: Attr(int)
+
+
+class _StatsParent(PymodelioModel):
+    children: Attr(List[_StatsChild])
+
+
+_CHILD_NAME = '%s._StatsChild' % __name__
+_PARENT_NAME = '%s._StatsParent' % __name__
+
+
+@pytest.fixture(autouse=True)
+def _stats():
+    stats.reset()
+    stats.enable()
+    try:
+        yield
+    finally:
+        stats.disable()
+        stats.reset()
+
+
+def test_enable_and_disable_restore_original_implementations():
+    stats.disable()
+    _StatsChild(value=1)
+    init = PymodelioModel.__init__
+    validator = _StatsChild.__annotations__['value'].validator
+    stats.enable()
+    assert stats.is_enabled()
+    assert PymodelioModel.__init__ is not init
+    assert _StatsChild.__annotations__['value'].validator is not validator
+    stats.disable()
+    assert not stats.is_enabled()
+    assert PymodelioModel.__init__ is init
+    assert _StatsChild.__annotations__['value'].validator is validator
+
+
+def test_snapshot_records_model_operations():
+    _StatsParent.from_dict({'children': [{'value': 1}]}).to_dict()
+    with pytest.raises(ModelValidationException):
+        _StatsParent.from_dict({'children': [{'value': '1'}]})
+    snapshot = stats.snapshot()
+    parent_stats = snapshot['models'][_PARENT_NAME]
+    assert parent_stats['from_dict']['count'] == 2
+    assert parent_stats['from_dict']['failures'] == 1
+    assert parent_stats['to_dict']['count'] == 1
+    assert parent_stats['construction']['count'] == 2
+    assert snapshot['models'][_CHILD_NAME]['construction']['count'] == 2
+    assert parent_stats['from_dict']['min_seconds'] <= parent_stats['from_dict']['p50_seconds'] <= \
+           parent_stats['from_dict']['max_seconds']
+
+
+def test_snapshot_records_attr_validations():
+    _StatsChild(value=1)
+    with pytest.raises(ModelValidationException):
+        _StatsChild(value='1')
+    value_stats = stats.snapshot()['attrs'][_CHILD_NAME]['value']
+    assert value_stats['count'] == 2
+    assert value_stats['failures'] == 1
+
+
+def test_attr_validations_are_instrumented_for_models_defined_while_enabled():
+    class Model(PymodelioModel):
+        attr: Attr(str)
+
+    Model(attr='value')
+    assert stats.snapshot()['attrs']['%s.%s' % (__name__, Model.__qualname__)]['attr']['count'] == 1
+
+
+def test_reset_clears_recorded_stats():
+    _StatsChild(value=1)
+    stats.reset()
+    assert stats.snapshot() == {'models': {}, 'attrs': {}}
+
+
+def test_to_prometheus():
+    _StatsChild(value=1)
+    exported = stats.to_prometheus()
+    assert '# TYPE pymodelio_model_operation_seconds summary' in exported
+    assert 'pymodelio_model_operation_seconds_count{model="%s",operation="construction"} 1' % _CHILD_NAME in exported
+    assert 'pymodelio_attr_validation_seconds_count{model="%s",attr="value"} 1' % _CHILD_NAME in exported
+    assert 'pymodelio_attr_validation_failures_total{model="%s",attr="value"} 0' % _CHILD_NAME in exported
+
+
+def test_snapshot_records_models_initialized_without_init():
+    _StatsChild.try_from_dict({'value': 1})
+    _StatsChild.from_rows([(1,), (2,)], ['value'])
+    assert stats.snapshot()['models'][_CHILD_NAME]['construction']['count'] == 3
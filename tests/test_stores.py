@@ -0,0 +1,140 @@
+import sqlite3
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum, IntEnum
+from typing import Dict, List, Literal, Optional, Tuple, Union
+from uuid import UUID, uuid4
+
+import pytest
+
+from pymodelio import PymodelioModel, Attr
+from pymodelio.stores import SQLiteStore
+
+
+class _Tag(PymodelioModel):
+    name: Attr(str)
+
+
+class _Card(PymodelioModel):
+    kind: Attr(Literal['card'])
+    number: Attr(str)
+
+
+class _Cash(PymodelioModel):
+    kind: Attr(Literal['cash'])
+    currency: Attr(str)
+
+
+class _Order(PymodelioModel):
+    id: Attr(int)
+    customer: Attr(str)
+    _total: Attr(Decimal, init_alias='total')
+    paid: Attr(bool)
+    created_at: Attr(datetime)
+    shipped_at: Attr(Optional[datetime])
+    tags: Attr(List[_Tag])
+    totals: Attr(Dict[str, float])
+    point: Attr(Tuple[int, int])
+    payment: Attr(Union[_Card, _Cash], discriminator='kind')
+
+
+def _order(i, **kwargs):
+    return _Order(**{
+        'id': i,
+        'customer': 'customer %s' % (i % 3),
+        'total': Decimal('%s.10' % i),
+        'paid': i % 2 == 0,
+        'created_at': datetime(2023, 1, 2, 3, 4, 5),
+        'shipped_at': None,
+        'tags': [_Tag(name='a'), _Tag(name='b')],
+        'totals': {'a': 1.5},
+        'point': (i, -i),
+        'payment': _Card(kind='card', number='123') if i % 2 else _Cash(kind='cash', currency='EUR'),
+        **kwargs
+    })
+
+
+@pytest.fixture
+def store():
+    with SQLiteStore(_Order, ':memory:', indexes=['customer']) as store:
+        yield store
+
+
+def test_stored_models_are_loaded_as_they_were(store):
+    orders = [_order(i) for i in range(3)]
+    store.put_many(iter(orders))
+    assert len(store) == 3
+    loaded = store.get(1)
+    assert isinstance(loaded, _Order)
+    assert loaded._total == Decimal('1.10')
+    assert loaded.paid is False
+    assert isinstance(loaded.tags[0], _Tag)
+    assert loaded.point == (1, -1)
+    assert isinstance(loaded.payment, _Card)
+    assert [x.to_dict() for x in store.iter_all(batch_size=2)] == [x.to_dict() for x in orders]
+    assert store.get(10) is None
+
+
+def test_putting_a_model_replaces_the_one_with_its_key(store):
+    store.put(_order(1))
+    store.put(_order(1, shipped_at=datetime(2023, 2, 3)))
+    assert len(store) == 1
+    assert store.get(1).shipped_at == datetime(2023, 2, 3)
+
+
+def test_where_queries_the_models_by_their_attributes(store):
+    store.put_many(_order(i, shipped_at=datetime(2023, 2, 3) if i == 4 else None) for i in range(6))
+    assert [x.id for x in store.where(customer='customer 1')] == [1, 4]
+    assert [x.id for x in store.where(customer='customer 1', shipped_at=None)] == [1]
+    assert [x.id for x in store.where(shipped_at=datetime(2023, 2, 3))] == [4]
+    with pytest.raises(NameError):
+        store.where(price=1)
+
+
+def test_models_without_key_are_identified_by_their_rowid(tmp_path):
+    path = str(tmp_path / 'tags.db')
+    with SQLiteStore(_Tag, path, table='tags') as store:
+        store.put_many([_Tag(name='a'), _Tag(name='b')])
+    with SQLiteStore(_Tag, path, table='tags') as store:
+        assert store.get(2).name == 'b'
+
+
+class _Color(Enum):
+    RED = 'red'
+    GREEN = 'green'
+
+
+class _Priority(IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class _Ticket(PymodelioModel):
+    id: Attr(UUID)
+    color: Attr(_Color)
+    priority: Attr(Optional[_Priority])
+    status: Attr(Literal['open', 'closed'])
+
+
+def test_enums_uuids_and_literals_are_stored_as_their_values(tmp_path):
+    path = str(tmp_path / 'tickets.db')
+    tickets = [
+        _Ticket(id=uuid4(), color=_Color.RED, priority=_Priority.HIGH, status='open'),
+        _Ticket(id=uuid4(), color=_Color.GREEN, priority=None, status='closed'),
+    ]
+    with SQLiteStore(_Ticket, path) as store:
+        store.put_many(tickets)
+        loaded = store.get(tickets[0].id)
+        assert loaded.id == tickets[0].id
+        assert loaded.color is _Color.RED
+        assert loaded.priority is _Priority.HIGH
+        assert loaded.status == 'open'
+        assert [x.id for x in store.where(color=_Color.GREEN)] == [tickets[1].id]
+        assert [x.id for x in store.where(status='closed')] == [tickets[1].id]
+    # The values are queryable with plain SQL
+    connection = sqlite3.connect(path)
+    try:
+        assert connection.execute('SELECT color, priority, status FROM _Ticket WHERE id = ?', (str(tickets[0].id),)
+                                  ).fetchall() == [('red', 2, 'open')]
+    finally:
+        connection.close()
@@ -0,0 +1,154 @@
+import io
+import sqlite3
+from typing import List
+
+import pytest
+
+from pymodelio import PymodelioModel, Tracer, TraceEvent, set_tracer, get_tracer, stats
+from pymodelio.attribute import Attr
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+
+
+class _TracedChild(PymodelioModel):
+    value: Attr(int)
+
+
+class _TracedParent(PymodelioModel):
+    children: Attr(List[_TracedChild])
+
+
+_CHILD_NAME = '%s._TracedChild' % __name__
+_PARENT_NAME = '%s._TracedParent' % __name__
+
+
+class _RecordingTracer(Tracer):
+
+    def __init__(self) -> None:
+        self.started = []
+        self.ended = []
+
+    def on_start(self, event: TraceEvent) -> None:
+        self.started.append(event)
+
+    def on_end(self, event: TraceEvent) -> None:
+        self.ended.append(event)
+
+    def summary(self) -> list:
+        return [(e.operation, e.model, e.depth, e.outcome) for e in self.ended]
+
+
+@pytest.fixture
+def tracer():
+    tracer = _RecordingTracer()
+    set_tracer(tracer)
+    try:
+        yield tracer
+    finally:
+        set_tracer(None)
+
+
+def test_setting_no_tracer_restores_original_implementations():
+    from_dict = PymodelioModel.__dict__['from_dict']
+    to_dict = PymodelioModel.to_dict
+    set_tracer(_RecordingTracer())
+    assert PymodelioModel.to_dict is not to_dict
+    set_tracer(Tracer())
+    assert get_tracer() is None
+    assert PymodelioModel.__dict__['from_dict'] is from_dict
+    assert PymodelioModel.to_dict is to_dict
+
+
+def test_tracer_receives_events_of_nested_calls(tracer):
+    _TracedParent.from_dict({'children': [{'value': 1}, {'value': 2}]}).to_dict()
+    assert tracer.summary() == [
+        ('from_dict', _CHILD_NAME, 1, TraceEvent.OK),
+        ('from_dict', _CHILD_NAME, 1, TraceEvent.OK),
+        ('validate', _PARENT_NAME, 1, TraceEvent.OK),
+        ('from_dict', _PARENT_NAME, 0, TraceEvent.OK),
+        ('to_dict', _PARENT_NAME, 0, TraceEvent.OK),
+    ]
+    assert tracer.started[0].operation == 'from_dict' and tracer.started[0].model == _PARENT_NAME
+    assert tracer.ended[3].payload_size == 3
+    assert all(event.duration >= 0 for event in tracer.ended)
+
+
+def test_tracer_receives_invalid_outcomes(tracer):
+    with pytest.raises(ModelValidationException):
+        _TracedChild.from_dict({'value': '1'})
+    _TracedChild.try_from_dict_many([{'value': 1}, {'value': None}])
+    assert tracer.summary() == [
+        ('validate', _CHILD_NAME, 1, TraceEvent.INVALID),
+        ('from_dict', _CHILD_NAME, 0, TraceEvent.INVALID),
+        ('try_from_dict_many', _CHILD_NAME, 0, TraceEvent.INVALID),
+    ]
+    assert tracer.ended[2].payload_size == 2
+
+
+def test_tracer_receives_one_event_per_batch_of_bulk_operations(tracer):
+    children = _TracedChild.from_rows([(1,), (2,)], ['value'])
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE children (value INTEGER)')
+    connection.executemany('INSERT INTO children VALUES (?)', [(x,) for x in range(5)])
+    assert len(list(_TracedChild.from_cursor(connection.execute('SELECT * FROM children'), batch_size=2))) == 5
+    assert len(_TracedChild.from_bytes_many(b''.join(x.to_bytes() for x in children), trusted=True)) == 2
+    list(_TracedChild.to_rows(children))
+    _TracedChild.to_columns(children)
+    _TracedChild.construct(value=1)
+    assert [(e.operation, e.payload_size, e.depth, e.outcome) for e in tracer.ended if e.depth == 0] == [
+        ('from_rows', 2, 0, TraceEvent.OK),
+        ('from_cursor', 2, 0, TraceEvent.OK),
+        ('from_cursor', 2, 0, TraceEvent.OK),
+        ('from_cursor', 1, 0, TraceEvent.OK),
+        ('from_bytes_many', len(b''.join(x.to_bytes() for x in children)), 0, TraceEvent.OK),
+        ('to_rows', 2, 0, TraceEvent.OK),
+        ('to_columns', 2, 0, TraceEvent.OK),
+        ('construct', 1, 0, TraceEvent.OK),
+    ]
+    # The models of the rows are validated inside the span of their batch
+    assert [(e.operation, e.depth) for e in tracer.ended[:3]] == [('validate', 1), ('validate', 1), ('from_rows', 0)]
+
+
+def test_tracer_receives_a_single_event_for_the_iteration_of_csv_files(tracer):
+    assert [x.value for x in _TracedChild.iter_csv(io.StringIO('value\n1\n2\n'))] == [1, 2]
+    results = list(_TracedChild.try_iter_csv(io.StringIO('value\n1\nx\n')))
+    assert [x.is_valid for x in results] == [True, False]
+    iterator = _TracedChild.iter_csv(io.StringIO('value\n1\n2\n'))
+    next(iterator)
+    iterator.close()
+    assert tracer.summary() == [
+        ('iter_csv', _CHILD_NAME, 0, TraceEvent.OK),
+        ('try_iter_csv', _CHILD_NAME, 0, TraceEvent.INVALID),
+        ('iter_csv', _CHILD_NAME, 0, TraceEvent.OK),
+    ]
+    with pytest.raises(ModelValidationException):
+        list(_TracedChild.iter_csv(io.StringIO('value\nx\n')))
+    assert tracer.summary()[-1] == ('iter_csv', _CHILD_NAME, 0, TraceEvent.INVALID)
+
+
+def test_only_sampled_calls_are_traced():
+    tracer = _RecordingTracer()
+    set_tracer(tracer, sample_every=3)
+    try:
+        for _ in range(4):
+            _TracedParent.from_dict({'children': [{'value': 1}]})
+    finally:
+        set_tracer(None)
+    assert [(e.model, e.depth) for e in tracer.ended if e.operation == 'from_dict'] == [
+        (_CHILD_NAME, 1), (_PARENT_NAME, 0), (_CHILD_NAME, 1), (_PARENT_NAME, 0)
+    ]
+
+
+def test_sample_every_must_be_positive():
+    with pytest.raises(ValueError):
+        set_tracer(_RecordingTracer(), sample_every=0)
+
+
+def test_tracing_and_stats_can_be_disabled_in_any_order():
+    from_dict = PymodelioModel.__dict__['from_dict']
+    stats.enable()
+    set_tracer(_RecordingTracer())
+    stats.disable()
+    assert PymodelioModel.__dict__['from_dict'] is not from_dict
+    set_tracer(None)
+    stats.reset()
+    assert PymodelioModel.__dict__['from_dict'] is from_dict
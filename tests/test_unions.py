@@ -0,0 +1,128 @@
+from typing import List, Optional, Union
+
+import pytest
+
+from pymodelio import PymodelioModel, Attr
+from pymodelio.exceptions import ModelValidationException
+from pymodelio.unions import UntaggedUnion
+from pymodelio.validators import ListValidator
+
+
+class _Card(PymodelioModel):
+    number: Attr(str)
+
+
+class _Transfer(PymodelioModel):
+    iban: Attr(str)
+    reference: Attr(Optional[str])
+
+
+class _Wallet(PymodelioModel):
+    number: Attr(str)
+    provider: Attr(str)
+
+
+class _Code(PymodelioModel):
+    value: Attr(int)
+
+
+class _Label(PymodelioModel):
+    value: Attr(str)
+
+
+class _Order(PymodelioModel):
+    payments: Attr(List[Union[_Card, _Transfer, '_Wallet']])
+    refund: Attr(Optional[Union[_Card, _Transfer]])
+
+
+def test_from_dict_deserializes_each_payload_into_the_variant_it_is_valid_for():
+    order = _Order.from_dict({
+        'payments': [{'number': '1'}, {'iban': 'ES1'}, {'number': '2', 'provider': 'x'}],
+        'refund': {'iban': 'ES2', 'reference': 'r'},
+    })
+    assert [type(x).__name__ for x in order.payments] == ['_Card', '_Transfer', '_Wallet']
+    assert order.refund.reference == 'r'
+    assert _Order.from_dict({'payments': [], 'refund': None}).refund is None
+
+
+def test_from_dict_fails_validation_for_payloads_not_valid_for_any_variant():
+    with pytest.raises(ModelValidationException) as ex_info:
+        _Order.from_dict({'payments': [{'reference': 'r'}], 'refund': None})
+    assert ex_info.value.args[0] == '_Order.payments[0] is not instance of _Card or _Transfer or _Wallet'
+    # Payloads with a single candidate variant are validated against it
+    with pytest.raises(ModelValidationException) as ex_info:
+        _Order.from_dict({'payments': [{'iban': 1}], 'refund': None})
+    assert ex_info.value.args[0] == '_Order.payments[0].iban is not instance of str'
+
+
+def test_variants_succeeding_more_often_are_tried_first():
+    union = UntaggedUnion((_Code, _Label))
+    assert union.deserialize({'value': 1}).value == 1
+    assert [x[0] for x in union._candidates[frozenset({'value'})]] == [_Code, _Label]
+    assert union.deserialize({'value': 'a'}).value == 'a'
+    assert [x[0] for x in union._candidates[frozenset({'value'})]] == [_Code, _Label]
+    assert union.deserialize({'value': 'b'}).value == 'b'
+    assert [x[0] for x in union._candidates[frozenset({'value'})]] == [_Label, _Code]
+
+
+def test_variants_knowing_more_keys_of_the_payload_are_tried_first():
+    union = UntaggedUnion((_Card, _Wallet))
+    assert isinstance(union.deserialize({'number': '1', 'provider': 'x'}), _Wallet)
+    assert isinstance(union.deserialize({'number': '1'}), _Card)
+
+
+def test_variants_whose_required_keys_are_missing_are_not_tried(monkeypatch):
+    tried = []
+    try_from_dict = _Card.try_from_dict.__func__
+    monkeypatch.setattr(_Card, 'try_from_dict',
+                        classmethod(lambda cls, data: tried.append(cls) or try_from_dict(cls, data)))
+    union = UntaggedUnion((_Card, _Transfer, _Wallet))
+    assert isinstance(union.deserialize({'iban': 'ES1'}), _Transfer)
+    assert isinstance(union.deserialize({'number': '1', 'provider': 'x'}), _Wallet)
+    assert tried == []
+
+
+def test_the_attempts_per_payload_are_bounded():
+    payload = {'value': 'a'}
+    assert UntaggedUnion((_Code, _Label), max_attempts=1).deserialize(payload) is payload
+    assert UntaggedUnion((_Code, _Label), max_attempts=2).deserialize(payload).value == 'a'
+
+
+def test_payloads_are_matched_regardless_of_the_order_of_their_keys():
+    union = UntaggedUnion((_Card, _Wallet))
+    assert isinstance(union.deserialize({'number': '1', 'provider': 'x'}), _Wallet)
+    assert isinstance(union.deserialize({'provider': 'y', 'number': '2'}), _Wallet)
+    assert list(union._candidates) == [frozenset({'number', 'provider'})]
+
+
+def test_the_chosen_variant_is_not_validated_again_by_the_model_holding_it():
+    checked = []
+
+    class _CountingValidator(ListValidator):
+        def _check(self, value, context):
+            checked.append(value)
+            return super()._check(value, context)
+
+    class _Names(PymodelioModel):
+        scores: Attr(List[str])
+
+    class _Scores(PymodelioModel):
+        scores: Attr(List[int], validator=_CountingValidator(elements_type=int))
+
+    class _Holder(PymodelioModel):
+        value: Attr(Union[_Names, _Scores])
+
+    holder = _Holder.from_dict({'value': {'scores': [1, 2]}})
+    assert isinstance(holder.value, _Scores)
+    assert checked == [[1, 2]]
+
+
+def test_errors_other_than_validation_ones_are_not_swallowed():
+    class _Failing(PymodelioModel):
+        value: Attr(str)
+
+        def __before_validate__(self) -> None:
+            raise RuntimeError('unexpected')
+
+    with pytest.raises(RuntimeError):
+        UntaggedUnion((_Code, _Failing)).deserialize({'value': 'a'})
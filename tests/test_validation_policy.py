@@ -0,0 +1,105 @@
+from typing import List, Set
+
+import pytest
+
+from pymodelio import PymodelioModel, Attr, PymodelioSettings, PymodelioSetting, ValidationPolicy
+from pymodelio.exceptions import ModelValidationException
+from pymodelio.validators import DiscriminatedUnionValidator, ListValidator
+
+
+class _Reading(PymodelioModel):
+    value: Attr(int)
+
+
+class _Feed(PymodelioModel):
+    readings: Attr(List[_Reading])
+    tags: Attr(Set[str], default_factory=set)
+
+
+class _FirstRowsFeed(PymodelioModel):
+    rows: Attr(List[List[int]], validation_policy=ValidationPolicy.first_n(2))
+
+
+class _SampledFeed(PymodelioModel):
+    __settings__ = {PymodelioSetting.VALIDATION_POLICY: ValidationPolicy.sample(0.5, seed=7)}
+
+    values: Attr(List[int])
+
+
+def _invalid_readings(count: int, invalid_index: int) -> List[_Reading]:
+    readings = [_Reading(value=i) for i in range(count)]
+    readings[invalid_index] = _Reading(value='x', auto_validate=False)
+    return readings
+
+
+def test_sample_and_first_n_select_the_indexes_to_check():
+    assert ValidationPolicy.full().select(10) is None
+    assert ValidationPolicy.first_n(3).select(10) == range(3)
+    assert ValidationPolicy.first_n(3).select(3) is None
+    indexes = ValidationPolicy.sample(4, seed=1).select(100)
+    assert len(indexes) == 4 and len(set(indexes)) == 4 and all(0 <= i < 100 for i in indexes)
+    assert ValidationPolicy.sample(4, seed=1).select(100) == indexes
+    assert len(ValidationPolicy.sample(0.25).select(100)) == 25
+    assert ValidationPolicy.sample(0.5).select(1) is None
+    with pytest.raises(ValueError):
+        ValidationPolicy.sample(1.5)
+    with pytest.raises(ValueError):
+        ValidationPolicy.first_n(-1)
+
+
+def test_collections_are_fully_validated_by_default():
+    feed = _Feed(readings=_invalid_readings(100, 99), auto_validate=False)
+    with pytest.raises(ModelValidationException) as ex_info:
+        feed.validate()
+    assert ex_info.value.args[0] == '_Feed.readings[99].value is not instance of int'
+    assert feed.get_validation_policies() == {}
+
+
+def test_settings_scopes_apply_their_policy_to_the_elements_and_nested_models():
+    feed = _Feed(readings=_invalid_readings(100, 99), tags={'a'}, auto_validate=False)
+    with PymodelioSettings.override(VALIDATION_POLICY=ValidationPolicy.first_n(10)):
+        feed.validate()
+    policies = feed.get_validation_policies()
+    assert policies == {'readings': ValidationPolicy.first_n(10), 'tags': ValidationPolicy.first_n(10)}
+    with PymodelioSettings.override(VALIDATION_POLICY=ValidationPolicy.first_n(100)):
+        with pytest.raises(ModelValidationException):
+            feed.validate()
+
+
+def test_attr_policies_take_precedence_over_the_pass_policy():
+    feed = _FirstRowsFeed(rows=[[1], [2, 3], ['x']])
+    assert feed.get_validation_policies() == {'rows': ValidationPolicy.first_n(2)}
+    with pytest.raises(ModelValidationException) as ex_info:
+        _FirstRowsFeed(rows=[[1], [2, 'x'], [3]])
+    assert ex_info.value.args[0] == '_FirstRowsFeed.rows[1][1] is not instance of int'
+
+
+def test_model_policies_are_configured_with_its_settings():
+    feed = _SampledFeed(values=list(range(1000)) + ['x'] * 1000, auto_validate=False)
+    with pytest.raises(ModelValidationException):
+        feed.validate()
+    assert feed.get_validation_policies() == {'values': ValidationPolicy.sample(0.5, seed=7)}
+    # Only the sampled elements are checked
+    sampled = set(ValidationPolicy.sample(0.5, seed=7).select(10))
+    _SampledFeed(values=[i if i in sampled else 'x' for i in range(10)])
+
+
+def test_validators_use_the_policy_of_the_running_pass():
+    values = list(range(10)) + ['x']
+    with PymodelioSettings.override(VALIDATION_POLICY=ValidationPolicy.first_n(10)):
+        ListValidator(elements_type=int).validate(values, 'values')
+    with pytest.raises(ModelValidationException):
+        ListValidator(elements_type=int).validate(values, 'values')
+
+
+def test_policies_apply_to_the_lists_of_discriminated_unions():
+    validator = DiscriminatedUnionValidator([_Reading, _Feed], is_list=True)
+    values = [_Reading(value=i) for i in range(10)] + ['x']
+    with PymodelioSettings.override(VALIDATION_POLICY=ValidationPolicy.first_n(10)):
+        validator.validate(values, 'values')
+    with pytest.raises(ModelValidationException) as ex_info:
+        validator.validate(values, 'values')
+    assert ex_info.value.args[0] == 'values[10] is not instance of _Reading or _Feed'
+    sampled = set(ValidationPolicy.sample(3, seed=1).select(10))
+    with PymodelioSettings.override(VALIDATION_POLICY=ValidationPolicy.sample(3, seed=1)):
+        validator.validate([_Reading(value=i) if i in sampled else 'x' for i in range(10)], 'values')
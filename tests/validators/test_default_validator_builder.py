@@ -4,7 +4,7 @@ from typing import Optional, List, Set, Tuple, Any, Dict, Union, ForwardRef
 import pytest
 
 from pymodelio import PymodelioModel, Attr
-from pymodelio.exceptions import AutoValidatorCreationException
+from pymodelio.exceptions import AutoValidatorCreationException, ModelValidationException
 from pymodelio.validators import StringValidator, BoolValidator, IntValidator, FloatValidator, DictValidator, \
     ListValidator, SetValidator, TupleValidator, DatetimeValidator, Validator, ForwardRefValidator
 from pymodelio.validators.date_validator import DateValidator
@@ -121,3 +121,44 @@ def test_build_raises_error_when_auto_generation_is_too_complex():
         with pytest.raises(AutoValidatorCreationException) as ex_info:
             DefaultValidatorsBuilder.build(_type)
         assert ex_info.value.args[0] == message
+
+
+def test_build_generates_validators_for_nested_generics():
+    class TestPymodelioModel(PymodelioModel):
+        name: Attr(str)
+
+    validator = DefaultValidatorsBuilder.build(Dict[str, List[TestPymodelioModel]])
+    validator.validate({'a': [TestPymodelioModel(name='a')], 'b': []}, 'prop')
+    with pytest.raises(ModelValidationException) as ex_info:
+        validator.validate({'a': [TestPymodelioModel(name='a'), 'b']}, 'prop')
+    assert ex_info.value.args[0] == 'prop.a[1] is not instance of TestPymodelioModel'
+
+    validator = DefaultValidatorsBuilder.build(list[list[int]])
+    validator.validate([[1], [], [2, 3]], 'prop')
+    with pytest.raises(ModelValidationException) as ex_info:
+        validator.validate([[1], [2, None]], 'prop')
+    assert ex_info.value.args[0] == 'prop[1][1] is not instance of int'
+
+    validator = DefaultValidatorsBuilder.build(List[Union[int, str]])
+    validator.validate([1, 'a'], 'prop')
+    with pytest.raises(ModelValidationException) as ex_info:
+        validator.validate([1, 2.5], 'prop')
+    assert ex_info.value.args[0] == 'prop[1] is not instance of int or str'
+
+
+def test_build_generates_validators_for_fixed_and_variadic_tuples():
+    validator = DefaultValidatorsBuilder.build(Tuple[int, str])
+    validator.validate((1, 'a'), 'prop')
+    with pytest.raises(ModelValidationException) as ex_info:
+        validator.validate((1, 2), 'prop')
+    assert ex_info.value.args[0] == 'prop[1] is not instance of str'
+    with pytest.raises(ModelValidationException) as ex_info:
+        validator.validate((1,), 'prop')
+    assert ex_info.value.args[0] == 'prop must have 2 elements'
+
+    validator = DefaultValidatorsBuilder.build(Tuple[int, ...])
+    assert validator.elements_type == (int,)
+    validator.validate((1, 2, 3), 'prop')
+    with pytest.raises(ModelValidationException) as ex_info:
+        validator.validate((1, 'a'), 'prop')
+    assert ex_info.value.args[0] == 'prop[1] is not instance of int'
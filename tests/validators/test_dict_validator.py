@@ -1,6 +1,7 @@
 import pytest
 
 from pymodelio.exceptions.model_validation_exception import ModelValidationException
+from pymodelio.validators import ListValidator
 from pymodelio.validators.dict_validator import DictValidator
 
 
@@ -14,3 +15,26 @@ def test_validate_raises_validation_error_when_provided_value_is_not_instance_of
 def test_validate_does_not_raise_error_when_provided_value_is_instance_of_provided_type():
     validator = DictValidator()
     validator.validate({}, 'path')
+
+
+def test_validate_raises_validation_error_when_a_key_is_not_instance_of_keys_type():
+    validator = DictValidator(keys_type=str)
+    with pytest.raises(ModelValidationException) as ex_info:
+        validator.validate({'a': 1, 2: 1}, 'prop')
+    assert ex_info.value.args[0] == 'prop[2] is not a key of type str'
+
+
+def test_validate_raises_validation_error_when_a_value_is_not_instance_of_values_type():
+    validator = DictValidator(keys_type=str, values_type=[int, float])
+    validator.validate({'a': 1, 'b': 2.5}, 'prop')
+    with pytest.raises(ModelValidationException) as ex_info:
+        validator.validate({'a': 1, 'b': '2'}, 'prop')
+    assert ex_info.value.args[0] == 'prop.b is not instance of int or float'
+
+
+def test_validate_validates_the_values_with_the_values_validator():
+    validator = DictValidator(values_validator=ListValidator(elements_type=int))
+    validator.validate({'a': [1, 2]}, 'prop')
+    with pytest.raises(ModelValidationException) as ex_info:
+        validator.validate({'a': [1, 2], 'b': [3, 'x']}, 'prop')
+    assert ex_info.value.args[0] == 'prop.b[1] is not instance of int'
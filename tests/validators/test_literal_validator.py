@@ -0,0 +1,33 @@
+from typing import Literal, Optional
+
+import pytest
+
+from pymodelio.exceptions.model_validation_exception import ModelValidationException
+from pymodelio.validators.default_validators_builder import DefaultValidatorsBuilder
+from pymodelio.validators.literal_validator import LiteralValidator
+
+
+def test_validate_raises_validation_error_when_provided_value_is_not_one_of_the_values():
+    validator = LiteralValidator(values=('click', 'scroll'))
+    with pytest.raises(ModelValidationException) as ex_info:
+        validator.validate('hover', 'prop')
+    assert ex_info.value.args[0] == "prop is not one of 'click', 'scroll'"
+
+
+def test_validate_raises_validation_error_when_provided_value_is_not_instance_of_the_values_type():
+    validator = LiteralValidator(values=('1',))
+    with pytest.raises(ModelValidationException) as ex_info:
+        validator.validate(1, 'prop')
+    assert ex_info.value.args[0] == 'prop is not instance of str'
+
+
+def test_validate_does_not_raise_error_when_provided_value_is_one_of_the_values():
+    LiteralValidator(values=('click', 'scroll')).validate('scroll', 'path')
+    LiteralValidator(values=('click',), nullable=True).validate(None, 'path')
+
+
+def test_default_validators_builder_builds_literal_validators():
+    validator = DefaultValidatorsBuilder.build(Optional[Literal['a', 'b']])
+    assert isinstance(validator, LiteralValidator)
+    assert validator.values == ('a', 'b')
+    assert validator.nullable
@@ -1,8 +1,11 @@
+from typing import Any
+
 import pytest
 
 import pymodelio
 from pymodelio import PymodelioModel
 from pymodelio.attribute import Attr
+from pymodelio.exceptions import ValidationError
 from pymodelio.exceptions.model_validation_exception import ModelValidationException
 from pymodelio.validators.validator import Validator
 
@@ -52,3 +55,34 @@ def test_validate_raises_validation_error_when_provided_value_is_a_model_and_it_
     with pytest.raises(ModelValidationException) as ex_info:
         validator.validate(ModelClass(name=12345, auto_validate=False), 'path')
     assert ex_info.value.args[0] == 'path.name is not instance of str'
+
+
+def test_validate_raises_validation_error_with_structured_error():
+    validator = Validator(expected_type=str)
+    with pytest.raises(ModelValidationException) as ex_info:
+        validator.validate(12345, 'prop')
+    assert ex_info.value.errors == [ValidationError('prop', tuple(), 'is not instance of str')]
+
+
+def test_validators_overriding_validate_are_used_when_validating_models():
+    class PositiveValidator(Validator):
+
+        def validate(self, value: Any, path: str = None) -> None:
+            super().validate(value, path)
+            if value <= 0:
+                self._raise_validation_error(path, 'must be positive')
+
+    class ModelClass(PymodelioModel):
+        attr: Attr(int, validator=PositiveValidator(expected_type=int))
+
+    ModelClass(attr=1)
+    with pytest.raises(ModelValidationException) as ex_info:
+        ModelClass(attr=0)
+    assert ex_info.value.args[0] == 'ModelClass.attr must be positive'
+    with pytest.raises(ModelValidationException) as ex_info:
+        ModelClass(attr='0')
+    assert ex_info.value.args[0] == 'ModelClass.attr is not instance of int'
+
+    assert ModelClass(attr=0, auto_validate=False).check().errors == [
+        ValidationError('ModelClass', ('attr',), 'must be positive')
+    ]